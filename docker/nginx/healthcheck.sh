@@ -1,3 +1,3 @@
 #!/bin/bash
 
-service nginx status || exit 1
\ No newline at end of file
+curl --fail -s http://localhost/healthz > /dev/null || exit 1
\ No newline at end of file
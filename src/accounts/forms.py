@@ -3,6 +3,7 @@ from django.contrib.auth import get_user_model, authenticate
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext as _
 
+from notes import services
 from notes.models import Worktable
 
 User = get_user_model()
@@ -79,7 +80,10 @@ class UserRegisterForm(forms.ModelForm):
         return confirming_password
 
     def bind_worktable_to_user(self, user):
-        worktable = Worktable.objects.get(session_key=self.request.session.session_key)
+        """Bind a worktable of the session to the user. The worktable is created if the session hasn't it yet."""
+        worktable = Worktable()
+        if session_key := self.request.session.session_key:
+            worktable = services.find_worktable(session_key=session_key) or worktable
         worktable.session_key = None
         worktable.user = user
         worktable.save()
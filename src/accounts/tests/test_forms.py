@@ -128,3 +128,12 @@ class UserRegisterFormTest(TestCase):
         self.worktable.refresh_from_db()
 
         self.assertEqual(user.id, self.worktable.user.id)
+
+    def test_form_creates_worktable_for_user_if_session_doesnt_have_it(self):
+        self.worktable.delete()
+
+        form = self.form_class(self.request, self.data)
+        form.is_valid()
+        user = form.save()
+
+        self.assertIsNone(n_models.Worktable.objects.get(user=user).session_key)
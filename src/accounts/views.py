@@ -1,7 +1,7 @@
 from django.contrib.auth import login, logout
-from django.http import JsonResponse
 
 from accounts import forms
+from core.http import JsonResponse
 
 
 def logout_user(request):
@@ -0,0 +1,70 @@
+"""
+Benchmarks of the project.
+
+Every ``bench_*`` module is a standalone script which is run from the ``src`` folder:
+
+    python -m benchmarks.bench_delete_category
+
+The load suite runs the whole workload of a user against the project and stores the results as JSON
+for comparison across commits:
+
+    python -m benchmarks run --users 4 --notes 2000
+    python -m benchmarks compare benchmarks/results/old.json benchmarks/results/new.json
+
+Benchmarks work with a throwaway test database, so development data is never touched.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+
+def setup_django():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+    os.environ.setdefault('DJANGO_SETTINGS_ENV', 'dev')
+    os.environ.setdefault('DJANGO_SECRET_KEY', 'benchmarks')
+
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def test_database(name: str | None = None):
+    """
+    Create a test database for the time of a benchmark and destroy it after.
+    name overrides the name of the test database, e.g. a file instead of in-memory SQLite for several threads.
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    if name is not None:
+        connection.settings_dict['TEST']['NAME'] = name
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def measure(fn: Callable, setup: Callable | None = None, repeat: int = 1) -> float:
+    """Return the best time of fn in seconds. setup is called before every run and isn't measured."""
+    best = float('inf')
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(title: str, rows: list[tuple]):
+    print(f'\n{title}')
+    width = max(len(str(row[0])) for row in rows)
+    for name, *values in rows:
+        print(f'  {str(name):<{width}}  ' + '  '.join(str(value) for value in values))
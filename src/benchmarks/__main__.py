@@ -0,0 +1,144 @@
+"""
+Load suite of the project: seed worktables, run the workload of benchmarks.load by Django's test client
+and by concurrent HTTP clients against a local WSGI server, report p50/p95/p99 and queries per request
+and store the results as JSON.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks import data, load, report, setup_django, test_database
+
+RESULTS_DIR = Path(__file__).parent / 'results'
+
+
+def get_commit() -> str | None:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def report_results(title: str, results: list[dict]):
+    rows = [
+        (
+            f'{result["driver"]}: {result["name"]}',
+            f'p50 {result["p50_ms"]:.1f} ms',
+            f'p95 {result["p95_ms"]:.1f} ms',
+            f'p99 {result["p99_ms"]:.1f} ms',
+            f'{result["queries_per_request"]} queries',
+            f'{result["errors"]} errors',
+        )
+        for result in results
+    ]
+    report(title, rows)
+
+
+def run(args):
+    setup_django()
+
+    from django.conf import settings
+    from django.test import Client, override_settings
+    from django.utils.crypto import get_random_string
+
+    with tempfile.TemporaryDirectory() as temp_dir, test_database(name=os.path.join(temp_dir, 'benchmarks.sqlite3')):
+        worktables = data.generate_dataset(args.users, args.notes, args.categories, args.text_words, args.seed)
+        category_ids = [worktable.get_all_categories().values_list('pk', flat=True).first() for worktable in worktables]
+
+        with override_settings(DEBUG=False, REQUEST_METRICS_SAMPLE_RATE=1, ALLOWED_HOSTS=['127.0.0.1', 'testserver']):
+            clients = []
+            for worktable in worktables:
+                client = Client()
+                client.force_login(worktable.user)
+                clients.append(client)
+
+            sessions = [load.TestClientSession(client) for client in clients]
+            wall_time = load.run_concurrently(sessions[:1], category_ids[:1], args.iterations)
+            results = load.summarize('test client', sessions[:1], wall_time)
+
+            csrf_token = get_random_string(32)
+            sessions = [
+                load.HttpSession(
+                    port=0,
+                    cookies={
+                        settings.SESSION_COOKIE_NAME: clients[n % len(clients)]
+                        .cookies[settings.SESSION_COOKIE_NAME]
+                        .value,
+                        settings.CSRF_COOKIE_NAME: csrf_token,
+                    },
+                    csrf_token=csrf_token,
+                )
+                for n in range(args.concurrency)
+            ]
+            with load.wsgi_server() as port:
+                for session in sessions:
+                    session.port = port
+                session_category_ids = [category_ids[n % len(category_ids)] for n in range(args.concurrency)]
+                wall_time = load.run_concurrently(sessions, session_category_ids, args.iterations)
+            results += load.summarize(f'http x{args.concurrency}', sessions, wall_time)
+
+    report_results(f'Load suite: {args.users} users x {args.notes} notes, {args.iterations} iterations', results)
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f'{datetime.now():%Y%m%d-%H%M%S}.json'
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            {
+                'commit': get_commit(),
+                'created': datetime.now(timezone.utc).isoformat(),
+                'parameters': {name: value for name, value in vars(args).items() if name not in ('func', 'output')},
+                'results': results,
+            },
+            indent=2,
+        )
+    )
+    print(f'\nResults are stored in {output}')
+
+
+def compare(args):
+    old, new = (json.loads(Path(path).read_text()) for path in (args.old, args.new))
+    old_results = {(result['driver'], result['name']): result for result in old['results']}
+    rows = []
+    for result in new['results']:
+        old_result = old_results.get((result['driver'], result['name']))
+        if old_result is None:
+            continue
+        values = []
+        for key in ('p50_ms', 'p95_ms', 'p99_ms'):
+            change = (result[key] - old_result[key]) / old_result[key] * 100 if old_result[key] else 0
+            values.append(f'{key[:3]} {old_result[key]:.1f} -> {result[key]:.1f} ms ({change:+.0f}%)')
+        rows.append((f'{result["driver"]}: {result["name"]}', *values))
+    report(f'{(old["commit"] or "?")[:8]} -> {(new["commit"] or "?")[:8]}', rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    subparsers = parser.add_subparsers(required=True)
+
+    run_parser = subparsers.add_parser('run', help='run the load suite')
+    run_parser.add_argument('--users', type=int, default=4)
+    run_parser.add_argument('--notes', type=int, default=2_000, help='notes of every user')
+    run_parser.add_argument('--categories', type=int, default=50, help='categories of every user')
+    run_parser.add_argument('--text-words', type=int, default=300, help='average words in a text of a note')
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--iterations', type=int, default=20, help='workload iterations of every client')
+    run_parser.add_argument('--concurrency', type=int, default=8, help='concurrent HTTP clients')
+    run_parser.add_argument('--output', help=f'JSON file of results, a new file in {RESULTS_DIR} by default')
+    run_parser.set_defaults(func=run)
+
+    compare_parser = subparsers.add_parser('compare', help='compare percentiles of two results')
+    compare_parser.add_argument('old')
+    compare_parser.add_argument('new')
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Latency of the active list of a worktable (filter_notes with the active status and the first notes
+of the home page) while its archive grows. Archived notes are moved to the ArchivedNote table,
+so the table and indexes which serve active notes don't grow with them.
+"""
+
+import argparse
+import random
+import time
+from datetime import timedelta
+
+from benchmarks import measure, report, setup_django, test_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--active', type=int, default=1_000)
+    parser.add_argument('--archived', type=int, nargs='+', default=[0, 10_000, 50_000, 200_000])
+    parser.add_argument('--text-words', type=int, default=100, dest='text_words')
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.db import DEFAULT_DB_ALIAS, connection
+    from django.test import Client
+    from django.urls import reverse
+    from django.utils import timezone
+
+    from notes import filters, models, seeding, services
+
+    def make_notes(worktable, quantity: int, created) -> list:
+        rng = random.Random(quantity)
+        texts = [seeding.make_text(rng, 0, args.text_words) for _ in range(100)]
+        return services.bulk_create_notes(
+            DEFAULT_DB_ALIAS,
+            (
+                models.Note(worktable=worktable, title=f'Note #{n}', text=texts[n % len(texts)], created=created)
+                for n in range(quantity)
+            ),
+            batch_size=5_000,
+        )
+
+    def get_size(model) -> str:
+        if connection.vendor != 'postgresql':
+            return f'{model.objects.count()} rows'
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_total_relation_size(%s)', [model._meta.db_table])
+            return f'{cursor.fetchone()[0] / 2**20:.1f} MiB'
+
+    def get_active_list() -> bytes:
+        response = client.get(reverse('filter_notes'), {'status': filters.NoteFilter.Status.ACTIVE})
+        return b''.join(response.streaming_content) if response.streaming else response.content
+
+    with test_database():
+        client = Client()
+        client.post(reverse('create_note'), {'title': 'Note'})
+        worktable = models.Worktable.objects.get()
+        make_notes(worktable, args.active - 1, timezone.now())
+
+        rows, archived = [], 0
+        for target in sorted(args.archived):
+            start = time.perf_counter()
+            # Archived notes are older than active ones, as they usually are.
+            make_notes(worktable, target - archived, timezone.now() - timedelta(days=30))
+            services.archive_notes(models.Note.objects.filter(created__lt=timezone.now() - timedelta(days=1)))
+            archive_seconds = time.perf_counter() - start
+            if connection.vendor == 'postgresql':
+                # Like autovacuum does after deletes, so sizes and plans of tables are up to date.
+                with connection.cursor() as cursor:
+                    cursor.execute('VACUUM ANALYZE')
+            archived = target
+
+            active_list = measure(get_active_list, repeat=args.repeat)
+            home_page = measure(lambda: client.get(reverse('home')), repeat=args.repeat)
+            rows.append(
+                (
+                    f'{archived} archived',
+                    f'active list {active_list * 1000:.1f} ms',
+                    f'home page {home_page * 1000:.1f} ms',
+                    f'notes table {get_size(models.Note)}',
+                    f'archive {get_size(models.ArchivedNote)}',
+                    f'archived in {archive_seconds:.1f} s',
+                )
+            )
+
+        report(f'Active list of {args.active} notes while the archive grows', rows)
+
+
+if __name__ == '__main__':
+    main()
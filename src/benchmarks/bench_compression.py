@@ -0,0 +1,92 @@
+"""
+Bytes on the wire and latency of filter_notes responses with and without gzip, and sizes of precompressed
+static files. Total time adds the transfer time of the response body at --mbps to the server time.
+"""
+
+import argparse
+import statistics
+import time
+
+from benchmarks import report, setup_django, test_database
+
+
+def time_requests(client, url: str, requests: int, **headers) -> tuple[float, int]:
+    timings, size = [], 0
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get(url, headers=headers)
+        content = b''.join(response.streaming_content) if response.streaming else response.content
+        timings.append(time.perf_counter() - start)
+        size = len(content)
+    return statistics.median(timings), size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--notes', type=int, default=10_000)
+    parser.add_argument('--categories', type=int, default=20)
+    parser.add_argument('--requests', type=int, default=10)
+    parser.add_argument('--mbps', type=float, default=10, help='bandwidth of the client link in Mbit/s')
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.contrib.staticfiles import finders
+    from django.test import Client
+    from django.urls import reverse
+
+    from core import storage
+    from notes import models, views
+
+    def transfer_time(size: int) -> float:
+        return size * 8 / (args.mbps * 1_000_000)
+
+    with test_database():
+        user = get_user_model().objects.create_user(email='benchmark@test.email', password='benchmark')
+        worktable = models.Worktable.objects.create(user=user)
+        categories = models.Category.objects.bulk_create(
+            models.Category(worktable=worktable, title=f'Category #{n}', color='#FF0000')
+            for n in range(args.categories)
+        )
+        models.Note.objects.bulk_create(
+            (
+                models.Note(worktable=worktable, title=f'Note #{n}', category=categories[n % len(categories)])
+                for n in range(args.notes)
+            ),
+            batch_size=5_000,
+        )
+        client = Client()
+        client.force_login(user)
+        url = reverse('filter_notes')
+
+        rows = []
+        for name, accept in (('json rows', 'application/json'), ('columnar json', views.COLUMNAR_CONTENT_TYPE)):
+            for encoding in ('identity', 'gzip'):
+                seconds, size = time_requests(client, url, args.requests, accept=accept, accept_encoding=encoding)
+                rows.append(
+                    (
+                        f'{name}, {encoding}',
+                        f'{size / 1024:.0f} KiB',
+                        f'{seconds * 1_000:.0f} ms server',
+                        f'{(seconds + transfer_time(size)) * 1_000:.0f} ms total',
+                    )
+                )
+        report(f'filter_notes for {args.notes} notes at {args.mbps:g} Mbit/s', rows)
+
+        rows = []
+        compressors = {'gzip': storage.gzip_compress}
+        if storage.brotli is not None:
+            compressors['brotli'] = storage.brotli_compress
+        for path in ('js/base.js', 'js/jscolor/jscolor.min.js'):
+            with open(finders.find(path), 'rb') as file:
+                content = file.read()
+            sizes = [f'{len(content) / 1024:.1f} KiB raw']
+            sizes += [f'{len(compress(content)) / 1024:.1f} KiB {name}' for name, compress in compressors.items()]
+            rows.append((path, *sizes))
+        report(f'Static files (GZIP_MIN_LENGTH={settings.GZIP_MIN_LENGTH})', rows)
+
+
+if __name__ == '__main__':
+    main()
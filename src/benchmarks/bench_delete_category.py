@@ -0,0 +1,63 @@
+"""
+Deleting a category with 100k notes: Django's collector (category.delete()) against
+the bulk path of services.delete_category.
+"""
+
+import argparse
+import tracemalloc
+
+from benchmarks import measure, report, setup_django, test_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--notes', type=int, default=100_000)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from notes import models, services
+
+    with test_database():
+        worktable = models.Worktable.objects.create(session_key='benchmark')
+        state = {}
+
+        def seed():
+            models.Note.objects.all().delete()
+            models.Category.objects.all().delete()
+            state['category'] = models.Category.objects.create(worktable=worktable, title='Huge')
+            state['move_to'] = models.Category.objects.create(worktable=worktable, title='Target')
+            models.Note.objects.bulk_create(
+                (
+                    models.Note(worktable=worktable, category=state['category'], title=f'Note #{n}')
+                    for n in range(args.notes)
+                ),
+                batch_size=5_000,
+            )
+
+        def traced(fn):
+            def wrapped():
+                tracemalloc.start()
+                fn()
+                state['peak'] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+            return wrapped
+
+        rows = []
+        for name, fn in (
+            ('category.delete()', lambda: state['category'].delete()),
+            ('services.delete_category()', lambda: services.delete_category(state['category'])),
+            (
+                'services.delete_category(move_to)',
+                lambda: services.delete_category(state['category'], move_to=state['move_to']),
+            ),
+        ):
+            seconds = measure(traced(fn), setup=seed)
+            rows.append((name, f'{seconds:.3f} s', f'peak memory {state["peak"] / 2**20:.1f} MiB'))
+
+        report(f'Deleting a category with {args.notes} notes', rows)
+
+
+if __name__ == '__main__':
+    main()
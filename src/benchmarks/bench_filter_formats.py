@@ -0,0 +1,59 @@
+"""
+Bytes on the wire and encode time of filter_notes formats for 10k notes: the default list of nested
+dicts, the columnar JSON layout and MessagePack (if msgpack is installed).
+"""
+
+import argparse
+import json
+
+from benchmarks import measure, report, setup_django, test_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--notes', type=int, default=10_000)
+    parser.add_argument('--categories', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.core.serializers.json import DjangoJSONEncoder
+
+    from notes import models, services, views
+
+    with test_database():
+        worktable = models.Worktable.objects.create(session_key='benchmark')
+        categories = models.Category.objects.bulk_create(
+            models.Category(worktable=worktable, title=f'Category #{n}', color='#FF0000')
+            for n in range(args.categories)
+        )
+        models.Note.objects.bulk_create(
+            (
+                models.Note(worktable=worktable, title=f'Note #{n}', category=categories[n % len(categories)])
+                for n in range(args.notes)
+            ),
+            batch_size=5_000,
+        )
+        qs = worktable.get_all_notes().select_related('category')
+
+        formats = {
+            'json rows': lambda: json.dumps(services.serialize_filter_qs(qs), cls=DjangoJSONEncoder).encode(),
+            'columnar json': lambda: json.dumps(
+                services.serialize_filter_qs_columnar([qs]), cls=DjangoJSONEncoder
+            ).encode(),
+        }
+        if views.msgpack is not None:
+            formats['columnar msgpack'] = lambda: views.msgpack.packb(services.serialize_filter_qs_columnar([qs]))
+
+        rows = []
+        for name, encode in formats.items():
+            size = len(encode())
+            seconds = measure(encode, repeat=args.repeat)
+            rows.append((name, f'{size / 1024:.0f} KiB', f'{seconds * 1_000:.0f} ms serialize + encode'))
+
+        report(f'filter_notes formats for {args.notes} notes', rows)
+
+
+if __name__ == '__main__':
+    main()
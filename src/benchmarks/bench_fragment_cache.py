@@ -0,0 +1,62 @@
+"""
+Render time of NotesView and CategoryView for a worktable with 500 categories, with and without
+cached template fragments.
+"""
+
+import argparse
+import statistics
+import time
+
+from benchmarks import report, setup_django, test_database
+
+DUMMY_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+
+
+def median_ms(client, url: str, requests: int) -> float:
+    client.get(url)  # warm up templates and fragments
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        client.get(url)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--categories', type=int, default=500)
+    parser.add_argument('--requests', type=int, default=100)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.test import Client, override_settings
+    from django.urls import reverse
+
+    from notes import models
+
+    with test_database():
+        user = get_user_model().objects.create_user(email='benchmark@test.email', password='benchmark')
+        worktable = models.Worktable.objects.create(user=user)
+        models.Category.objects.bulk_create(
+            models.Category(worktable=worktable, title=f'Category #{n}', color='#FF0000')
+            for n in range(args.categories)
+        )
+        client = Client()
+        client.force_login(user)
+
+        rows = []
+        for name in ('home', 'categories'):
+            with override_settings(CACHES=DUMMY_CACHES, SESSION_ENGINE='django.contrib.sessions.backends.db'):
+                uncached = median_ms(client, reverse(name), args.requests)
+            cached = median_ms(client, reverse(name), args.requests)
+            rows.append((f'{name}, no fragment cache', f'{uncached:.2f} ms median'))
+            rows.append((f'{name}, {settings.CACHES["default"]["BACKEND"]}', f'{cached:.2f} ms median'))
+
+        report(f'Page render with {args.categories} categories ({args.requests} requests each)', rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Encode time of the standard library json with DjangoJSONEncoder and of orjson (if it's installed)
+for the payloads of the JSON endpoints: filter_notes rows, columnar filter_notes, a single note and form errors.
+"""
+
+import argparse
+
+from benchmarks import measure, report, setup_django, test_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--notes', type=int, default=10_000)
+    parser.add_argument('--categories', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.test import override_settings
+
+    from core import http
+    from notes import forms, models, services
+
+    with test_database():
+        worktable = models.Worktable.objects.create(session_key='benchmark')
+        categories = models.Category.objects.bulk_create(
+            models.Category(worktable=worktable, title=f'Category #{n}', color='#FF0000')
+            for n in range(args.categories)
+        )
+        models.Note.objects.bulk_create(
+            (
+                models.Note(worktable=worktable, title=f'Note #{n}', category=categories[n % len(categories)])
+                for n in range(args.notes)
+            ),
+            batch_size=5_000,
+        )
+        qs = worktable.get_all_notes().select_related('category')
+        form = forms.CategoryUpdateForm(data={})
+        form.is_valid()
+        payloads = {
+            f'{args.notes} filter rows': services.serialize_filter_qs(qs),
+            f'{args.notes} columnar notes': services.serialize_filter_qs_columnar([qs]),
+            'single note': services.serialize_model(qs.first(), ('id', 'title', 'text', 'created'), services.NOTE_URLS),
+            'form errors': {'errors': form.errors},
+        }
+
+        encoders = ['json'] if http.orjson is None else ['json', 'orjson']
+        rows = []
+        for name, data in payloads.items():
+            for encoder in encoders:
+                with override_settings(JSON_ENCODER=encoder):
+                    size = len(http.dumps(data))
+                    seconds = measure(lambda: http.dumps(data), repeat=args.repeat)
+                rows.append((f'{name}, {encoder}', f'{size / 1024:.1f} KiB', f'{seconds * 1_000_000:.0f} µs'))
+
+        report('JSON encoders', rows)
+
+
+if __name__ == '__main__':
+    main()
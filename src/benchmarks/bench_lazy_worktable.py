@@ -0,0 +1,60 @@
+"""
+Database writes caused by anonymous page views: lazy worktable creation against the former eager
+get_or_create of a session and a worktable on every GET.
+"""
+
+import argparse
+from unittest import mock
+
+from benchmarks import report, setup_django, test_database
+
+WRITE_STATEMENTS = ('INSERT', 'UPDATE', 'DELETE')
+
+
+def count_writes(views: int) -> int:
+    from django.db import connection, reset_queries
+    from django.test import Client
+    from django.test.utils import CaptureQueriesContext
+    from django.urls import reverse
+
+    urls = [reverse('home'), reverse('categories')]
+    writes = 0
+    for n in range(views):
+        client = Client()  # every view is a new visitor, like a crawler or a health check
+        reset_queries()
+        with CaptureQueriesContext(connection) as queries:
+            client.get(urls[n % len(urls)])
+        writes += sum(query['sql'].lstrip().upper().startswith(WRITE_STATEMENTS) for query in queries)
+    return writes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--views', type=int, default=1_000)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from notes import services, views
+
+    def eager_get_worktable(self):
+        return services.get_or_create_worktable(self.request)
+
+    with test_database():
+        lazy = count_writes(args.views)
+        with mock.patch.object(views.BaseView, 'get_worktable', eager_get_worktable):
+            eager = count_writes(args.views)
+
+    per_1k = 1_000 / args.views
+    report(
+        f'Database writes per 1k anonymous page views ({args.views} views measured)',
+        [
+            ('eager worktable', f'{eager * per_1k:.0f}'),
+            ('lazy worktable', f'{lazy * per_1k:.0f}'),
+            ('writes avoided', f'{(eager - lazy) * per_1k:.0f}'),
+        ],
+    )
+
+
+if __name__ == '__main__':
+    main()
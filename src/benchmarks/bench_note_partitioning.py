@@ -0,0 +1,91 @@
+"""
+Notes in a plain table against notes hash-partitioned by worktable (the partition_notes command):
+queries of notes of a worktable and vacuum after churn of one worktable. Needs PostgreSQL, e.g.:
+
+    DOCKER_RUN=1 POSTGRES_HOST=localhost python -m benchmarks.bench_note_partitioning
+"""
+
+import argparse
+from io import StringIO
+
+from benchmarks import measure, report, setup_django, test_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--worktables', type=int, default=200)
+    parser.add_argument('--notes', type=int, default=400_000)
+    parser.add_argument('--partitions', type=int, default=16)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.core.management import call_command
+    from django.db import connection
+
+    from notes import models
+
+    if connection.vendor != 'postgresql':
+        parser.error(f'the benchmark needs PostgreSQL, the database is {connection.vendor}')
+
+    with test_database():
+        worktables = models.Worktable.objects.bulk_create(
+            models.Worktable(session_key=f'benchmark_{n}') for n in range(args.worktables)
+        )
+        # Half of the notes belong to one large worktable, the rest are spread between the others.
+        large, small = worktables[0], worktables[1:]
+        models.Note.objects.bulk_create(
+            (
+                models.Note(
+                    worktable=large if n % 2 else small[n % len(small)],
+                    title=f'Note #{n}',
+                    text='Lorem ipsum dolor sit amet ' * 4,
+                )
+                for n in range(args.notes)
+            ),
+            batch_size=5_000,
+        )
+
+        def execute(sql):
+            with connection.cursor() as cursor:
+                cursor.execute(sql)
+
+        def query(worktable):
+            return lambda: list(models.Note.objects.filter(worktable=worktable).order_by('-created')[:50])
+
+        def churn():
+            # Rewrites every note of a small worktable, leaving dead tuples for vacuum.
+            models.Note.objects.filter(worktable=small[0]).update(text='Changed')
+
+        def get_table_of_small_worktable():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT tableoid::regclass::text FROM notes_note WHERE worktable_id = %s LIMIT 1', [small[0].pk]
+                )
+                return cursor.fetchone()[0]
+
+        def run(name):
+            execute('VACUUM ANALYZE notes_note')
+            table = get_table_of_small_worktable()
+            return [
+                (
+                    f'{name}, notes of a small worktable',
+                    f'{measure(query(small[1]), repeat=args.repeat) * 1000:.2f} ms',
+                ),
+                (f'{name}, notes of the large worktable', f'{measure(query(large), repeat=args.repeat) * 1000:.2f} ms'),
+                (
+                    f'{name}, VACUUM {table}',
+                    f'{measure(lambda: execute(f"VACUUM {table}"), setup=churn, repeat=3):.3f} s',
+                ),
+            ]
+
+        rows = run('plain table')
+        call_command('partition_notes', partitions=args.partitions, stdout=StringIO())
+        rows += run(f'{args.partitions} partitions')
+
+        report(f'{args.notes} notes of {args.worktables} worktables', rows)
+
+
+if __name__ == '__main__':
+    main()
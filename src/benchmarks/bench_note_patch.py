@@ -0,0 +1,75 @@
+"""
+Saving a small edit of a note by update_note, which takes the whole title and text, against patch_note,
+which takes operations against a version: request size and latency by size of the text.
+"""
+
+import argparse
+import json
+import random
+from urllib.parse import urlencode
+
+from benchmarks import measure, report, setup_django, test_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--text-words', type=int, nargs='+', default=[100, 1_000, 10_000, 100_000], dest='text_words')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.test import Client
+    from django.urls import reverse
+
+    from notes import models, seeding
+
+    with test_database():
+        client = Client()
+        client.post(reverse('create_note'), {'title': 'Note'})
+        note = models.Note.objects.get()
+        rng = random.Random(0)
+
+        rows = []
+        for words in args.text_words:
+            text = seeding.make_text(rng, 0, words)
+            models.Note.objects.filter(pk=note.pk).update(text=text, version=0)
+            version = 0
+
+            def update():
+                # A typed word appended at the end, as a save after a few keystrokes sends it.
+                nonlocal text, version
+                text += ' word'
+                body = urlencode({'title': 'Note', 'text': text, 'version': version})
+                response = client.post(
+                    reverse('update_note', args=[note.pk]), body, content_type='application/x-www-form-urlencoded'
+                )
+                version = response.json()['note']['version']
+                return len(body)
+
+            def patch():
+                nonlocal text, version
+                body = json.dumps({'version': version, 'operations': [{'offset': len(text), 'insert': ' word'}]})
+                text += ' word'
+                response = client.post(reverse('patch_note', args=[note.pk]), body, content_type='application/json')
+                version = response.json()['note']['version']
+                return len(body)
+
+            update_size = update()
+            update_seconds = measure(update, repeat=args.repeat)
+            text = models.Note.objects.get().text
+            patch_size = patch()
+            patch_seconds = measure(patch, repeat=args.repeat)
+            rows.append(
+                (
+                    f'{words} words ({len(text) / 1024:.0f} KiB)',
+                    f'update {update_size} B {update_seconds * 1000:.2f} ms',
+                    f'patch {patch_size} B {patch_seconds * 1000:.2f} ms',
+                )
+            )
+
+        report('Saving an edit of a word', rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Request-level timing of NotesView and CategoryView for anonymous and authenticated visitors.
+"""
+
+import argparse
+import statistics
+import time
+
+from benchmarks import report, setup_django, test_database
+
+
+def time_requests(client, url: str, requests: int) -> tuple[float, float]:
+    from django.db import connection, reset_queries
+    from django.test.utils import CaptureQueriesContext
+
+    timings, queries = [], 0
+    for _ in range(requests):
+        reset_queries()
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            client.get(url)
+            timings.append(time.perf_counter() - start)
+        queries += len(captured)
+    return statistics.median(timings) * 1_000, queries / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--categories', type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.contrib.auth import get_user_model
+    from django.test import Client
+    from django.urls import reverse
+
+    from notes import models
+
+    with test_database():
+        anonymous = Client()
+        anonymous.post(reverse('create_category'), {'title': 'Category', 'color': '#FF0000'})
+
+        user = get_user_model().objects.create_user(email='benchmark@test.email', password='benchmark')
+        worktable = models.Worktable.objects.create(user=user)
+        models.Category.objects.bulk_create(
+            models.Category(worktable=worktable, title=f'Category #{n}', color='#FF0000')
+            for n in range(args.categories)
+        )
+        authenticated = Client()
+        authenticated.force_login(user)
+
+        rows = []
+        for name in ('home', 'categories'):
+            for visitor, client in (('anonymous', anonymous), ('authenticated', authenticated)):
+                client.get(reverse(name))  # warm up template and url caches
+                median, queries = time_requests(client, reverse(name), args.requests)
+                rows.append((f'{name}, {visitor}', f'{median:.2f} ms median', f'{queries:.1f} queries'))
+
+        report(f'Page views ({args.requests} requests each)', rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Database queries per anonymous page load with database-backed and cached database-backed sessions.
+"""
+
+import argparse
+
+from benchmarks import report, setup_django, test_database
+
+SESSION_ENGINES = (
+    'django.contrib.sessions.backends.db',
+    'django.contrib.sessions.backends.cached_db',
+)
+
+
+def count_queries(url: str, loads: int, returning: bool) -> float:
+    from django.db import connection, reset_queries
+    from django.test import Client
+    from django.test.utils import CaptureQueriesContext
+    from django.urls import reverse
+
+    client = Client()
+    if returning:
+        client.post(reverse('create_category'), {'title': 'Category', 'color': '#FF0000'})
+
+    queries = 0
+    for _ in range(loads):
+        reset_queries()
+        with CaptureQueriesContext(connection) as captured:
+            client.get(url)
+        queries += len(captured)
+    return queries / loads
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--loads', type=int, default=100)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.test import override_settings
+    from django.urls import reverse
+
+    with test_database():
+        for engine in SESSION_ENGINES:
+            rows = []
+            with override_settings(SESSION_ENGINE=engine):
+                for name in ('home', 'categories'):
+                    for visitor, returning in (('new visitor', False), ('returning visitor', True)):
+                        queries = count_queries(reverse(name), args.loads, returning)
+                        rows.append((f'{name}, {visitor}', f'{queries:.1f} queries'))
+            report(f'Queries per anonymous page load, {engine}', rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Texts of notes compressed by CompressedTextField: encode and decode time per text by each codec,
+and storage and read time of notes before and after the compress_note_texts command.
+Table sizes include TOAST on PostgreSQL, which compresses large values by itself, so the field stores
+texts as is there. The benchmark compresses them on PostgreSQL anyway to compare both, e.g.:
+
+    DOCKER_RUN=1 POSTGRES_HOST=localhost python -m benchmarks.bench_text_compression
+"""
+
+import argparse
+import random
+import sys
+from io import StringIO
+
+from benchmarks import measure, report, setup_django, test_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--notes', type=int, default=5_000)
+    parser.add_argument('--text-words', type=int, nargs='+', default=[100, 1_000, 10_000], dest='text_words')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.core.management import call_command
+    from django.db import connection
+    from django.test import override_settings
+
+    from notes import fields, models, seeding
+
+    field = models.Note._meta.get_field('text')
+    rng = random.Random(0)
+    texts = {words: [seeding.make_text(rng, 0, words) for _ in range(20)] for words in args.text_words}
+
+    rows = []
+    for words, samples in texts.items():
+        size = sum(len(text) for text in samples) / len(samples)
+        for codec in fields.CODECS:
+            codec_field = fields.CompressedTextField(codec=codec, threshold=field.threshold)
+            stored = [codec_field.encode(text) for text in samples]
+            encode = measure(lambda: [codec_field.encode(text) for text in samples], repeat=args.repeat)
+            decode = measure(lambda: [fields.decode_text(text) for text in stored], repeat=args.repeat)
+            rows.append(
+                (
+                    f'{words} words ({size / 1024:.1f} KiB), {codec}',
+                    f'stored {sum(map(len, stored)) / sum(map(len, samples)):.0%}',
+                    f'encode {encode / len(samples) * 1e6:.1f} µs',
+                    f'decode {decode / len(samples) * 1e6:.1f} µs',
+                )
+            )
+    report(f'Texts per operation, threshold {field.threshold} characters', rows)
+
+    def get_sizes() -> tuple[str, ...]:
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT SUM(LENGTH(text)) FROM {models.Note._meta.db_table}')
+            sizes = (f'texts {cursor.fetchone()[0] / 2**20:.1f} MiB',)
+            if connection.vendor == 'postgresql':
+                cursor.execute('VACUUM FULL ANALYZE notes_note')
+                cursor.execute('SELECT pg_total_relation_size(%s)', [models.Note._meta.db_table])
+                sizes += (f'table {cursor.fetchone()[0] / 2**20:.1f} MiB',)
+        return sizes
+
+    def read_notes():
+        return [note.text for note in models.Note.objects.filter(worktable=worktable).order_by('pk')[:100]]
+
+    with test_database():
+        worktable = models.Worktable.objects.create(session_key='benchmark')
+        samples = [text for words in args.text_words for text in texts[words]]
+        # Notes are written as before the field compressed texts.
+        with override_settings(NOTES_TEXT_COMPRESSION_THRESHOLD=sys.maxsize):
+            models.Note.objects.bulk_create(
+                (
+                    models.Note(worktable=worktable, title=f'Note #{n}', text=samples[n % len(samples)])
+                    for n in range(args.notes)
+                ),
+                batch_size=1_000,
+            )
+
+        rows = [('plain', *get_sizes(), f'read 100 notes {measure(read_notes, repeat=args.repeat) * 1000:.1f} ms')]
+        output = StringIO()
+        field.self_compressing_vendors = ()
+        call_command('compress_note_texts', stdout=output)
+        rows.append(
+            ('compressed', *get_sizes(), f'read 100 notes {measure(read_notes, repeat=args.repeat) * 1000:.1f} ms')
+        )
+        rows.append(('compress_note_texts', output.getvalue().splitlines()[-1]))
+        report(f'{args.notes} notes of {", ".join(map(str, args.text_words))} words', rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Time from starting a command to the first 200 response of a URL, e.g. of a container start:
+
+    python -m benchmarks.cold_start -- docker compose up -d --force-recreate web
+    python -m benchmarks.cold_start --url http://127.0.0.1:8000/ -- gunicorn
+
+A command which keeps running (a server in the foreground) is terminated after the measurement.
+Doesn't need Django.
+"""
+
+import argparse
+import subprocess
+import time
+import urllib.error
+import urllib.request
+
+from benchmarks import report
+
+
+def wait_for_ok(url: str, timeout: float, interval: float) -> float | None:
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        try:
+            with urllib.request.urlopen(url, timeout=interval * 10) as response:
+                if response.status == 200:
+                    return time.perf_counter() - start
+        except (urllib.error.URLError, ConnectionError):
+            pass
+        time.sleep(interval)
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://localhost/')
+    parser.add_argument('--timeout', type=float, default=300, help='seconds to wait for the first 200')
+    parser.add_argument('--interval', type=float, default=0.05, help='seconds between requests')
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('command', nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+    command = args.command[1:] if args.command[:1] == ['--'] else args.command
+    if not command:
+        parser.error('the command to start is required')
+
+    rows = []
+    for n in range(args.repeat):
+        start = time.perf_counter()
+        process = subprocess.Popen(command)
+        seconds = wait_for_ok(args.url, args.timeout, args.interval)
+        elapsed = time.perf_counter() - start if seconds is not None else None
+        if process.poll() is None:
+            process.terminate()
+            process.wait()
+        rows.append((f'run {n + 1}', f'{elapsed:.2f} s' if elapsed is not None else f'no 200 in {args.timeout:g} s'))
+
+    report(f'Time to the first 200 on {args.url}: {" ".join(command)}', rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Deterministic generator of realistic data for benchmarks: users with worktables, many categories
+and notes with long texts of notes.seeding. Word statistics are counted like the pre_save signal
+of notes does, because bulk_create skips signals.
+"""
+
+import random
+
+PASSWORD = 'benchmark'
+
+
+def generate_dataset(users: int, notes: int, categories: int, text_words: int, seed: int = 0) -> list:
+    """
+    Create users with worktables, `categories` categories and `notes` notes of about `text_words` words
+    in each worktable. Return the worktables. Every user logs in with PASSWORD.
+    """
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.hashers import make_password
+
+    from notes import models, seeding, services
+
+    rng = random.Random(seed)
+    password = make_password(PASSWORD)
+    user_model = get_user_model()
+    created_users = user_model.objects.bulk_create(
+        user_model(email=f'benchmark-{seed}-{n}@test.email', password=password) for n in range(users)
+    )
+    if not all(user.pk for user in created_users):  # backends which don't return ids from bulk_create
+        created_users = list(user_model.objects.filter(email__startswith=f'benchmark-{seed}-').order_by('pk'))
+    worktables = [models.Worktable.objects.create(user=user) for user in created_users]
+
+    for worktable in worktables:
+        worktable_categories = models.Category.objects.bulk_create(
+            models.Category(worktable=worktable, title=f'Category #{n}', color=f'#{rng.randrange(0x1000000):06X}')
+            for n in range(categories)
+        )
+        worktable_notes, archived = [], []
+        for n in range(notes):
+            text = seeding.make_text(rng, seed, rng.randint(text_words // 2, text_words * 3 // 2))
+            worktable_notes.append(
+                models.Note(
+                    worktable=worktable,
+                    # A part of notes is left without a category as users do.
+                    category=rng.choice(worktable_categories) if worktable_categories and rng.random() < 0.8 else None,
+                    title=seeding.make_title(rng, seed),
+                    text=text,
+                    words=services.count_words_in_text(text),
+                    unique_words=services.count_words_in_text(text, unique=True),
+                )
+            )
+            archived.append(rng.random() < 0.1)
+        models.Note.objects.bulk_create(worktable_notes, batch_size=1_000)
+        services.archive_notes(
+            models.Note.objects.filter(
+                pk__in=[note.pk for note, is_archived in zip(worktable_notes, archived) if is_archived]
+            )
+        )
+
+    return worktables
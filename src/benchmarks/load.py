@@ -0,0 +1,179 @@
+"""
+Workload of the benchmark suite and two drivers to run it: Django's test client in the benchmark process
+and HTTP clients in threads against a local threaded WSGI server.
+
+Queries per request are read from the Server-Timing header of core.middleware.RequestMetricsMiddleware,
+so the suite runs with REQUEST_METRICS_SAMPLE_RATE=1. Queries of streaming responses are counted by the
+middleware until the response is sent, so they reach /metrics, but the header is sent before them and
+has no db entry. Such requests are left out of queries_per_request.
+"""
+
+import http.client
+import json
+import re
+import statistics
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextlib import contextmanager
+from urllib.parse import urlencode
+
+SERVER_TIMING_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+class Session(ABC):
+    """Client of one user which records duration, queries and status of every request by name."""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+
+    @abstractmethod
+    def _send(self, method: str, path: str, data: dict | None, accept: str) -> tuple[int, str, bytes]:
+        """Send a request and return its status, Server-Timing header and body."""
+
+    def request(self, name: str, method: str, path: str, data: dict | None = None, accept='*/*') -> bytes:
+        start = time.perf_counter()
+        status, server_timing, body = self._send(method, path, data, accept)
+        duration = time.perf_counter() - start
+        match = SERVER_TIMING_QUERIES.search(server_timing)
+        self.samples[name].append((duration, int(match[1]) if match else None, status))
+        return body
+
+
+class TestClientSession(Session):
+    def __init__(self, client):
+        super().__init__()
+        self.client = client
+
+    def _send(self, method, path, data, accept):
+        if method == 'GET':
+            response = self.client.get(path, headers={'accept': accept})
+        else:
+            response = self.client.post(path, data or {}, headers={'accept': accept})
+        body = b''.join(response.streaming_content) if response.streaming else response.content
+        return response.status_code, response.get('Server-Timing', ''), body
+
+
+class HttpSession(Session):
+    def __init__(self, port: int, cookies: dict[str, str], csrf_token: str):
+        super().__init__()
+        self.port = port
+        self.cookie = '; '.join(f'{name}={value}' for name, value in cookies.items())
+        self.csrf_token = csrf_token
+
+    def _send(self, method, path, data, accept):
+        headers = {'Accept': accept, 'Cookie': self.cookie, 'X-CSRFToken': self.csrf_token}
+        body = None
+        if method != 'GET':
+            body = urlencode(data or {})
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=60)
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            return response.status, response.getheader('Server-Timing', ''), response.read()
+        finally:
+            connection.close()
+
+
+def run_iteration(session: Session, category_id: int, iteration: int):
+    """Page views, filtering and the whole life of a note, as a user of the worktable does it."""
+    from notes.views import COLUMNAR_CONTENT_TYPE
+
+    session.request('home', 'GET', '/')
+    session.request('categories', 'GET', '/categories/')
+    session.request('filter_notes', 'GET', '/notes/filter/', accept='application/json')
+    session.request('filter_notes columnar', 'GET', '/notes/filter/', accept=COLUMNAR_CONTENT_TYPE)
+    session.request('filter_notes by category', 'GET', f'/notes/filter/?category={category_id}')
+
+    note = {'title': f'Benchmark note #{iteration}', 'text': 'Benchmark text. ' * 50, 'category': category_id}
+    created_note = json.loads(session.request('create_note', 'POST', '/note/create/', note))['note']
+    note_id = created_note['id']
+    session.request('retrieve_note', 'GET', f'/note/retrieve/{note_id}/')
+    session.request(
+        'update_note',
+        'POST',
+        f'/note/update/{note_id}/',
+        {**note, 'title': 'Updated note', 'version': created_note['version']},
+    )
+    session.request('archive_note', 'POST', f'/note/archive/{note_id}/')
+    session.request('delete_note', 'POST', f'/note/delete/{note_id}/')
+
+
+@contextmanager
+def wsgi_server():
+    """Serve the project by a threaded WSGI server on a free local port, yield the port."""
+    from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+    from django.core.wsgi import get_wsgi_application
+
+    class QuietWSGIRequestHandler(WSGIRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadedWSGIServer(('127.0.0.1', 0), QuietWSGIRequestHandler)
+    server.daemon_threads = True
+    server.set_app(get_wsgi_application())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_address[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def run_concurrently(sessions: list[Session], category_ids: list[int], iterations: int) -> float:
+    """Run iterations of the workload by every session in its own thread. Return the wall time."""
+    errors = []
+
+    def worker(session: Session, category_id: int):
+        try:
+            for iteration in range(iterations):
+                run_iteration(session, category_id, iteration)
+        except Exception as error:  # reported after all workers have finished
+            errors.append(error)
+
+    threads = [
+        threading.Thread(target=worker, args=(session, category_id))
+        for session, category_id in zip(sessions, category_ids)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return time.perf_counter() - start
+
+
+def summarize(driver: str, sessions: list[Session], wall_time: float) -> list[dict]:
+    samples = defaultdict(list)
+    for session in sessions:
+        for name, name_samples in session.samples.items():
+            samples[name].extend(name_samples)
+
+    results = []
+    for name, name_samples in samples.items():
+        durations = sorted(duration * 1_000 for duration, _, _ in name_samples)
+        queries = [count for _, count, _ in name_samples if count is not None]
+        percentiles = (
+            statistics.quantiles(durations, n=100, method='inclusive') if len(durations) > 1 else durations * 99
+        )
+        results.append(
+            {
+                'driver': driver,
+                'name': name,
+                'requests': len(name_samples),
+                'errors': sum(status >= 400 for _, _, status in name_samples),
+                'p50_ms': round(percentiles[49], 3),
+                'p95_ms': round(percentiles[94], 3),
+                'p99_ms': round(percentiles[98], 3),
+                'mean_ms': round(statistics.fmean(durations), 3),
+                'queries_per_request': round(statistics.fmean(queries), 2) if queries else None,
+                'throughput_rps': round(len(name_samples) / wall_time, 1),
+            }
+        )
+    return results
@@ -0,0 +1,58 @@
+"""
+Memory of gunicorn workers: USS (memory only used by the process), PSS (with shared memory divided
+between processes sharing it) and RSS. Copy-on-write sharing of preload_app shows up as a low USS.
+Reads /proc, so it runs on Linux only, and doesn't need Django:
+
+    python -m benchmarks.worker_memory [master pid]
+"""
+
+import argparse
+from pathlib import Path
+
+from benchmarks import report
+
+DEFAULT_PIDFILE = '/tmp/online_notes_gunicorn.pid'
+
+
+def read_memory(pid: int) -> dict[str, int]:
+    """Return memory of the process in KiB by fields of smaps_rollup."""
+    memory = {}
+    for line in Path(f'/proc/{pid}/smaps_rollup').read_text().splitlines()[1:]:
+        name, value, *_ = line.split()
+        memory[name.rstrip(':')] = int(value)
+    return memory
+
+
+def get_children(pid: int) -> list[int]:
+    children = []
+    for path in Path(f'/proc/{pid}/task').glob('*/children'):
+        children.extend(int(child) for child in path.read_text().split())
+    return children
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('pid', type=int, nargs='?', help=f'pid of the gunicorn master, read from {DEFAULT_PIDFILE}')
+    args = parser.parse_args()
+
+    master_pid = args.pid or int(Path(DEFAULT_PIDFILE).read_text())
+    rows, total_uss = [], 0
+    for name, pid in [('master', master_pid)] + [('worker', pid) for pid in get_children(master_pid)]:
+        memory = read_memory(pid)
+        uss = memory['Private_Clean'] + memory['Private_Dirty']
+        if name == 'worker':
+            total_uss += uss
+        rows.append(
+            (
+                f'{name} {pid}',
+                f'USS {uss / 1024:.1f} MiB',
+                f'PSS {memory["Pss"] / 1024:.1f} MiB',
+                f'RSS {memory["Rss"] / 1024:.1f} MiB',
+            )
+        )
+    rows.append(('workers total', f'USS {total_uss / 1024:.1f} MiB'))
+    report(f'Memory of gunicorn {master_pid}', rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Checks of health and readiness endpoints, see core.middleware.HealthCheckMiddleware.
+"""
+
+import logging
+import time
+
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connection, connections, transaction
+from django.db.migrations.executor import MigrationExecutor
+
+logger = logging.getLogger('core.health')
+
+# Times of the last check and unapplied migrations by database alias.
+_migrations_cache: dict[str, tuple[float, list[str]]] = {}
+
+
+def check_database(timeout: float):
+    """Run a single cheap query. On PostgreSQL the query is cancelled after timeout seconds."""
+    with transaction.atomic(), connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute('SET LOCAL statement_timeout = %s', [int(timeout * 1_000)])
+        cursor.execute('SELECT 1')
+
+
+def get_unapplied_migrations(cache_timeout: float, database: str = DEFAULT_DB_ALIAS) -> list[str]:
+    """
+    Return names of migrations which aren't applied to a database yet. Loading migrations reads all
+    migration files, so the result is kept for cache_timeout seconds.
+    """
+    now = time.monotonic()
+    checked_at, unapplied_migrations = _migrations_cache.get(database, (None, []))
+    if checked_at is None or now - checked_at >= cache_timeout:
+        executor = MigrationExecutor(connections[database])
+        plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+        unapplied_migrations = [f'{migration.app_label}.{migration.name}' for migration, _ in plan]
+        _migrations_cache[database] = (now, unapplied_migrations)
+    return unapplied_migrations
+
+
+def reset_migrations_cache():
+    _migrations_cache.clear()
+
+
+def get_readiness_errors(database_timeout: float, migrations_cache_timeout: float) -> list[str]:
+    """
+    Return generic errors for the response, details such as database errors and names of migrations
+    are only logged, so that they aren't disclosed to whoever calls /readyz.
+    """
+    try:
+        check_database(database_timeout)
+        unapplied_migrations = get_unapplied_migrations(migrations_cache_timeout)
+    except DatabaseError:
+        logger.exception('Database is unavailable.')
+        return ['Database is unavailable.']
+
+    if unapplied_migrations:
+        logger.error('Migrations are not applied: %s', ', '.join(unapplied_migrations))
+        return ['Migrations are not applied.']
+    return []
@@ -0,0 +1,104 @@
+"""
+JSON responses of the project.
+
+Data is encoded by orjson if it's installed and JSON_ENCODER allows it, otherwise by the standard library json
+with DjangoJSONEncoder. Both encoders produce the same output.
+"""
+
+import itertools
+import json
+import time
+from typing import Iterable
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, StreamingHttpResponse
+
+try:
+    import orjson
+except ImportError:  # the standard library json is used instead
+    orjson = None
+
+STREAMING_CHUNK_SIZE = 64 * 1024
+
+_django_encoder = DjangoJSONEncoder()
+
+
+def _orjson_default(obj):
+    # Subclasses are passed through to here, because orjson would serialize e.g. ErrorList (a UserList
+    # and a list at once) by its empty list storage. Datetimes are passed to keep DjangoJSONEncoder's format.
+    if isinstance(obj, dict):
+        return dict(obj)
+    if isinstance(obj, (list, tuple)):
+        return list(obj)
+    if isinstance(obj, str):
+        # str() returns subclasses such as SafeString as they are, which orjson would pass here again.
+        return str.__str__(obj)
+    return _django_encoder.default(obj)
+
+
+def get_encoder_name() -> str:
+    if settings.JSON_ENCODER == 'json' or orjson is None:
+        return 'json'
+    return 'orjson'
+
+
+def dumps(data) -> bytes:
+    if get_encoder_name() == 'orjson':
+        return orjson.dumps(
+            data,
+            default=_orjson_default,
+            option=orjson.OPT_PASSTHROUGH_SUBCLASS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(data, cls=DjangoJSONEncoder, separators=(',', ':')).encode()
+
+
+class JsonResponse(HttpResponse):
+    """
+    Replacement of django.http.JsonResponse which encodes data by the configured encoder.
+    Time of encoding is kept in encode_time.
+    """
+
+    def __init__(self, data, safe=True, **kwargs):
+        if safe and not isinstance(data, dict):
+            raise TypeError('In order to allow non-dict objects to be serialized set the safe parameter to False.')
+        kwargs.setdefault('content_type', 'application/json')
+        start = time.perf_counter()
+        content = dumps(data)
+        self.encode_time = time.perf_counter() - start
+        super().__init__(content=content, **kwargs)
+
+
+class StreamingJsonResponse(StreamingHttpResponse):
+    """Response with a JSON list which is encoded item by item, so the whole list is never kept in memory."""
+
+    def __init__(self, items: Iterable, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        self.encode_time = 0.0
+        super().__init__(streaming_content=self._encode(items), **kwargs)
+
+    def _encode(self, items: Iterable):
+        chunk = bytearray(b'[')
+        for n, item in enumerate(items):
+            start = time.perf_counter()
+            if n:
+                chunk += b','
+            chunk += dumps(item)
+            self.encode_time += time.perf_counter() - start
+            if len(chunk) >= STREAMING_CHUNK_SIZE:
+                yield bytes(chunk)
+                chunk.clear()
+        chunk += b']'
+        yield bytes(chunk)
+
+
+def json_list_response(items: Iterable, **kwargs) -> HttpResponse:
+    """
+    Return a JsonResponse for a short list and a StreamingJsonResponse if the list is longer
+    than JSON_STREAMING_THRESHOLD items.
+    """
+    items = iter(items)
+    head = list(itertools.islice(items, settings.JSON_STREAMING_THRESHOLD + 1))
+    if len(head) <= settings.JSON_STREAMING_THRESHOLD:
+        return JsonResponse(data=head, safe=False, **kwargs)
+    return StreamingJsonResponse(itertools.chain(head, items), **kwargs)
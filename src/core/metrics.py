@@ -0,0 +1,384 @@
+"""
+Metrics of the project.
+
+REGISTRY keeps counters and histograms of the process and renders them in the Prometheus text exposition format.
+Under several worker processes every process writes its values to its own file in a shared directory
+and the values of all files are summed up on rendering. Files of finished processes are folded
+into the aggregate file of the directory by fold_process_files().
+
+RequestMetricsMiddleware also measures a sample of requests in detail and aggregates them per view
+in RequestStatsLog, which writes the averages to the "core.metrics" logger.
+"""
+
+import bisect
+import json
+import logging
+import math
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger('core.metrics')
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+AGGREGATE_FILE = 'aggregate.json'
+
+
+def format_value(value) -> str:
+    if isinstance(value, float):
+        return '+Inf' if value == math.inf else repr(value)
+    return str(value)
+
+
+def format_labels(labels: dict) -> str:
+    if not labels:
+        return ''
+    pairs = (
+        '{}="{}"'.format(name, str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n'))
+        for name, value in labels.items()
+    )
+    return '{' + ','.join(pairs) + '}'
+
+
+def merge_value(value, other_value):
+    """Sum values of two processes: numbers of counters or lists of counts of histograms."""
+    if isinstance(value, list):
+        return [a + b for a, b in zip(value, other_value)]
+    return value + other_value
+
+
+def merge_dumps(dumps) -> dict[str, dict[tuple, object]]:
+    """Sum dumps of registries of several processes into values of metrics by labels."""
+    values = defaultdict(dict)
+    for dump in dumps:
+        for name, items in dump.items():
+            for key, value in items:
+                key = tuple(key)
+                current_value = values[name].get(key)
+                values[name][key] = value if current_value is None else merge_value(current_value, value)
+    return values
+
+
+def read_json(path: Path):
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):  # the file of a process has just been removed
+        return None
+
+
+def write_json(path: Path, data):
+    """Write a file atomically, so readers never see it half-written."""
+    temp_path = path.with_suffix('.tmp')
+    temp_path.write_text(json.dumps(data))
+    os.replace(temp_path, path)
+
+
+def fold_process_files(directory: str, pid: int):
+    """
+    Add values of a finished process to the aggregate file of the directory and remove its files,
+    so files of recycled workers don't pile up and their counts aren't lost. Only one process,
+    e.g. the gunicorn master, may fold files. The aggregate file lists folded files, and collecting
+    skips them, so values are never counted twice while the files are being removed.
+    """
+    directory = Path(directory)
+    paths = list(directory.glob(f'{pid}-*.json'))
+    if not paths:
+        return
+    aggregate_path = directory / AGGREGATE_FILE
+    aggregate = read_json(aggregate_path) or {'folded': [], 'values': {}}
+    dumps = [aggregate['values'], *filter(None, map(read_json, paths))]
+    write_json(
+        aggregate_path,
+        {
+            # Files folded before and removed since then aren't listed anymore.
+            'folded': [name for name in aggregate['folded'] if (directory / name).exists()]
+            + [path.name for path in paths],
+            'values': {
+                name: [[list(key), value] for key, value in items.items()] for name, items in merge_dumps(dumps).items()
+            },
+        },
+    )
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+class Metric(ABC):
+    type = ''
+
+    def __init__(self, registry: 'Registry', name: str, documentation: str, labelnames=()):
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f'Metric {self.name} requires labels {self.labelnames}, got {tuple(labels)}.')
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def dump(self) -> list:
+        return [[list(key), value] for key, value in self._values.items()]
+
+    @abstractmethod
+    def render(self, values: dict) -> list[str]:
+        """Return lines of the text format for values by labels."""
+
+
+class Counter(Metric):
+    type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._registry.lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self, values: dict) -> list[str]:
+        return [
+            f'{self.name}{format_labels(dict(zip(self.labelnames, key)))} {format_value(value)}'
+            for key, value in values.items()
+        ]
+
+
+class Histogram(Metric):
+    """Histogram which keeps counts of the buckets (the last one is +Inf), the sum and the count of values."""
+
+    type = 'histogram'
+
+    def __init__(self, *args, buckets=DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._registry.lock:
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            counts[index] += 1
+            counts[-2] += value
+            counts[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def render(self, values: dict) -> list[str]:
+        lines = []
+        for key, counts in values.items():
+            labels = dict(zip(self.labelnames, key))
+            cumulative_count = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative_count += count
+                lines.append(
+                    f'{self.name}_bucket{format_labels({**labels, "le": format_value(float(bound))})} {cumulative_count}'
+                )
+            lines.append(f'{self.name}_sum{format_labels(labels)} {format_value(counts[-2])}')
+            lines.append(f'{self.name}_count{format_labels(labels)} {counts[-1]}')
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._metrics = {}
+        self._written_at = 0.0
+        self._pid = None
+        self._file_name = None
+
+    def _register(self, metric_class, name: str, *args, **kwargs) -> Metric:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = metric_class(self, name, *args, **kwargs)
+        elif not isinstance(metric, metric_class):
+            raise ValueError(f'Metric {name} is already registered as {metric.type}.')
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def dump(self) -> dict:
+        with self.lock:
+            return {name: metric.dump() for name, metric in self._metrics.items()}
+
+    def get_file_name(self) -> str:
+        pid = os.getpid()
+        if pid != self._pid:
+            # A process started later with the pid of a finished one doesn't overwrite its file.
+            self._pid, self._file_name = pid, f'{pid}-{time.time_ns()}.json'
+        return self._file_name
+
+    def write(self, directory: str):
+        """Write values of the process to its file in the directory, replacing the file atomically."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        write_json(directory / self.get_file_name(), self.dump())
+        self._written_at = time.monotonic()
+
+    def write_if_due(self, directory: str | None, interval: float):
+        if directory and time.monotonic() - self._written_at >= interval:
+            self.write(directory)
+
+    def collect(self, directory: str | None = None) -> dict[str, dict]:
+        """
+        Return values of all metrics by labels. If directory is set, values of all processes
+        which have written their files to it are summed up.
+        """
+        if not directory:
+            dumps = [self.dump()]
+        else:
+            self.write(directory)
+            process_dumps = {path.name: read_json(path) for path in Path(directory).glob('*-*.json')}
+            # The aggregate file is read after files of processes, so a file folded in between is counted
+            # once, by the aggregate file which lists it.
+            aggregate = read_json(Path(directory) / AGGREGATE_FILE) or {'folded': [], 'values': {}}
+            folded = set(aggregate['folded'])
+            dumps = [aggregate['values']]
+            dumps += [dump for name, dump in process_dumps.items() if name not in folded and dump is not None]
+
+        values = merge_dumps(dumps)
+        return {name: values.get(name, {}) for name in self._metrics}
+
+    def render(self, directory: str | None = None) -> str:
+        lines = []
+        for name, values in self.collect(directory).items():
+            metric = self._metrics[name]
+            lines.append(f'# HELP {name} {metric.documentation}')
+            lines.append(f'# TYPE {name} {metric.type}')
+            lines.extend(metric.render(dict(sorted(values.items()))))
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+REQUEST_DURATION = REGISTRY.histogram(
+    'online_notes_request_duration_seconds', 'Duration of requests by view.', ('view', 'method')
+)
+RESPONSES = REGISTRY.counter('online_notes_responses_total', 'Responses by view and status.', ('view', 'status'))
+# Queries are counted only for sampled requests, divide them by sampled requests for averages.
+SAMPLED_REQUESTS = REGISTRY.counter(
+    'online_notes_sampled_requests_total', 'Requests sampled for measuring database queries by view.', ('view',)
+)
+DB_QUERIES = REGISTRY.counter(
+    'online_notes_db_queries_total', 'Database queries of sampled requests by view.', ('view',)
+)
+DB_QUERY_DURATION = REGISTRY.counter(
+    'online_notes_db_query_duration_seconds_total',
+    'Total time of database queries of sampled requests by view.',
+    ('view',),
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    'online_notes_cache_requests_total',
+    'Requests of cached values by cache and result (hit or miss).',
+    ('cache', 'result'),
+)
+
+
+class QueryTimer:
+    """Execute wrapper of database connections which counts queries and their total time."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+
+
+@dataclass
+class RequestSample:
+    view: str
+    duration: float
+    queries: int
+    sql_duration: float
+    # Unknown for responses which aren't encoded by core.http and for streaming responses.
+    encode_duration: float | None = None
+    size: int | None = None
+
+
+@dataclass
+class EndpointStats:
+    requests: int = 0
+    duration: float = 0.0
+    queries: int = 0
+    sql_duration: float = 0.0
+    encoded_requests: int = 0
+    encode_duration: float = 0.0
+    sized_requests: int = 0
+    size: int = 0
+
+    def add(self, sample: RequestSample):
+        self.requests += 1
+        self.duration += sample.duration
+        self.queries += sample.queries
+        self.sql_duration += sample.sql_duration
+        if sample.encode_duration is not None:
+            self.encoded_requests += 1
+            self.encode_duration += sample.encode_duration
+        if sample.size is not None:
+            self.sized_requests += 1
+            self.size += sample.size
+
+    def format(self) -> str:
+        line = (
+            f'requests={self.requests} '
+            f'avg_ms={self.duration / self.requests * 1_000:.1f} '
+            f'avg_queries={self.queries / self.requests:.1f} '
+            f'avg_sql_ms={self.sql_duration / self.requests * 1_000:.1f}'
+        )
+        if self.encoded_requests:
+            line += f' avg_encode_ms={self.encode_duration / self.encoded_requests * 1_000:.1f}'
+        if self.sized_requests:
+            line += f' avg_bytes={self.size // self.sized_requests}'
+        return line
+
+
+class RequestStatsLog:
+    """Aggregate sampled requests per view and log the averages once in `interval` seconds."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._stats = defaultdict(EndpointStats)
+        self._lock = threading.Lock()
+        self._flushed_at = time.monotonic()
+
+    def add(self, sample: RequestSample):
+        with self._lock:
+            self._stats[sample.view].add(sample)
+            if time.monotonic() - self._flushed_at >= self.interval:
+                self._flush()
+
+    def _flush(self):
+        for view, stats in sorted(self._stats.items()):
+            logger.info('view=%s %s', view, stats.format())
+        self._stats.clear()
+        self._flushed_at = time.monotonic()
+
+
+def format_server_timing(sample: RequestSample, with_queries: bool = True) -> str:
+    metrics = []
+    if with_queries:
+        metrics.append(f'db;dur={sample.sql_duration * 1_000:.1f};desc="{sample.queries} queries"')
+    if sample.encode_duration is not None:
+        metrics.append(f'encode;dur={sample.encode_duration * 1_000:.1f}')
+    metrics.append(f'app;dur={sample.duration * 1_000:.1f}')
+    return ', '.join(metrics)
@@ -0,0 +1,165 @@
+"""
+Middlewares of the project.
+"""
+
+import random
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from django.middleware.gzip import GZipMiddleware
+
+from core import health, metrics, routers
+from core.http import JsonResponse
+
+
+def is_json_response(response) -> bool:
+    media_type = response.get('Content-Type', '').partition(';')[0].strip()
+    return media_type == 'application/json' or media_type.endswith('+json')
+
+
+class JsonGZipMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware which compresses only JSON responses of at least GZIP_MIN_LENGTH bytes.
+    Streaming JSON responses are always compressed, because they are only used for long lists.
+    The rest of responses are compressed by the proxy.
+    """
+
+    def process_response(self, request, response):
+        if not is_json_response(response):
+            return response
+        if not response.streaming and len(response.content) < settings.GZIP_MIN_LENGTH:
+            return response
+        return super().process_response(request, response)
+
+
+class RequestMetricsMiddleware:
+    """
+    Count duration and status of every request in core.metrics.REGISTRY.
+
+    REQUEST_METRICS_SAMPLE_RATE part of requests is also measured in detail: database queries
+    and their time, encoding time of JSON and size of the response. Queries are counted only for sampled
+    requests, so the rest don't pay for wrapping of database connections. Measurements are sent
+    in the Server-Timing header and aggregated per view by core.metrics.RequestStatsLog.
+    Streaming responses run queries while they are sent, so their queries are counted until the response
+    is closed and are left out of Server-Timing, which is sent before them.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.stats_log = metrics.RequestStatsLog(settings.REQUEST_METRICS_LOG_INTERVAL)
+
+    def __call__(self, request):
+        is_sampled = random.random() < settings.REQUEST_METRICS_SAMPLE_RATE
+        query_timer = metrics.QueryTimer()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            if is_sampled:
+                self.count_queries(stack, query_timer)
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        view = request.resolver_match.view_name if request.resolver_match else 'unresolved'
+        metrics.REQUEST_DURATION.observe(duration, view=view, method=request.method)
+        metrics.RESPONSES.inc(view=view, status=response.status_code)
+
+        if not is_sampled:
+            metrics.REGISTRY.write_if_due(settings.METRICS_DIR, settings.METRICS_WRITE_INTERVAL)
+            return response
+
+        sample = metrics.RequestSample(
+            view=view,
+            duration=duration,
+            queries=query_timer.count,
+            sql_duration=query_timer.duration,
+        )
+        if response.streaming:
+            response.streaming_content = self.stream(response.streaming_content, query_timer, sample)
+        else:
+            sample.encode_duration = getattr(response, 'encode_time', None)
+            sample.size = len(response.content)
+            self.add_sample(sample)
+
+        response.headers['Server-Timing'] = ', '.join(
+            filter(
+                None,
+                [
+                    response.get('Server-Timing'),
+                    metrics.format_server_timing(sample, with_queries=not response.streaming),
+                ],
+            )
+        )
+        return response
+
+    def count_queries(self, stack: ExitStack, query_timer: metrics.QueryTimer):
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(query_timer))
+
+    def stream(self, streaming_content, query_timer: metrics.QueryTimer, sample: metrics.RequestSample):
+        """Yield the content while counting its queries, the sample is added when the response is closed."""
+        try:
+            with ExitStack() as stack:
+                self.count_queries(stack, query_timer)
+                yield from streaming_content
+        finally:
+            sample.queries, sample.sql_duration = query_timer.count, query_timer.duration
+            self.add_sample(sample)
+
+    def add_sample(self, sample: metrics.RequestSample):
+        metrics.SAMPLED_REQUESTS.inc(view=sample.view)
+        metrics.DB_QUERIES.inc(sample.queries, view=sample.view)
+        metrics.DB_QUERY_DURATION.inc(sample.sql_duration, view=sample.view)
+        self.stats_log.add(sample)
+        metrics.REGISTRY.write_if_due(settings.METRICS_DIR, settings.METRICS_WRITE_INTERVAL)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Keep the database routing state of a request for core.routers.ReplicaRouter. A client whose request wrote
+    to the primary database gets a cookie which keeps its reads on the primary database for
+    DATABASE_REPLICA_STICKY_SECONDS. The middleware must be above SessionMiddleware to notice saving of sessions.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+
+        cookie_name = settings.DATABASE_REPLICA_COOKIE_NAME
+        with routers.routing_state(sticky=cookie_name in request.COOKIES) as state:
+            response = self.get_response(request)
+        if state.wrote:
+            response.set_cookie(
+                cookie_name,
+                '1',
+                max_age=settings.DATABASE_REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
+
+
+class HealthCheckMiddleware:
+    """
+    Answer /healthz and /readyz before the rest of middlewares, so health checks never touch sessions,
+    authentication and host validation and aren't counted in metrics.
+    /healthz only tells that the process serves requests, /readyz also checks the database and migrations.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.path == '/healthz':
+            return JsonResponse(data={'status': 'ok'})
+        if request.path == '/readyz':
+            errors = health.get_readiness_errors(
+                settings.READINESS_DATABASE_TIMEOUT, settings.READINESS_MIGRATIONS_CACHE_TIMEOUT
+            )
+            if errors:
+                return JsonResponse(data={'status': 'unavailable', 'errors': errors}, status=503)
+            return JsonResponse(data={'status': 'ok'})
+        return self.get_response(request)
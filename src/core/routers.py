@@ -0,0 +1,79 @@
+"""
+Routing of queries between the primary database and its read replicas.
+
+Writes always go to the "default" database. Reads go to one of DATABASE_REPLICAS only inside read_only(),
+which read-only views are decorated with, and only if the request hasn't written yet and the client
+hasn't written in the last DATABASE_REPLICA_STICKY_SECONDS (see core.middleware.ReplicaRoutingMiddleware),
+so a client always reads its own writes while replicas catch up.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+
+@dataclass
+class RoutingState:
+    # Reads go to the primary database because the client wrote recently.
+    sticky: bool = False
+    read_only: bool = False
+    wrote: bool = False
+    # A replica is chosen once, so that all reads of a request see the same data.
+    replica: str | None = None
+
+
+_state: ContextVar[RoutingState | None] = ContextVar('routing_state', default=None)
+
+
+@contextmanager
+def routing_state(sticky: bool = False):
+    """Start a new routing state, e.g. for a request, and yield it."""
+    state = RoutingState(sticky=sticky)
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+
+
+@contextmanager
+def read_only():
+    """Send reads to a replica while the block or the decorated function runs. Writes still go to the primary."""
+    state = _state.get()
+    token = None
+    if state is None:
+        state = RoutingState()
+        token = _state.set(state)
+    previous, state.read_only = state.read_only, True
+    try:
+        yield
+    finally:
+        state.read_only = previous
+        if token is not None:
+            _state.reset(token)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints) -> str:
+        state = _state.get()
+        if state is None or not state.read_only or state.wrote or state.sticky or not settings.DATABASE_REPLICAS:
+            return DEFAULT_DB_ALIAS
+        if state.replica is None:
+            state.replica = random.choice(settings.DATABASE_REPLICAS)
+        return state.replica
+
+    def db_for_write(self, model, **hints) -> str:
+        if (state := _state.get()) is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool | None:
+        # Replicas hold the same data as the primary database.
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
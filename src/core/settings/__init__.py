@@ -5,11 +5,17 @@ Combining settings for django project
 from split_settings.tools import include
 
 from core.settings.components import env
+from core.settings.components.roles import PROCESS_ROLE
 
-_settings = (
+_settings = [
     'components/base.py',
-    'components/baton.py',
+    'components/roles.py',
+    'components/cache.py',
     'components/{}.py'.format(env.get('DJANGO_SETTINGS_ENV', 'prod').lower()),
-)
+]
+
+# The admin theme is only needed by processes serving pages.
+if PROCESS_ROLE == 'web':
+    _settings.insert(2, 'components/baton.py')
 
 include(*_settings)
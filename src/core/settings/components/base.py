@@ -25,7 +25,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.HealthCheckMiddleware',
+    'core.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.JsonGZipMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -48,6 +52,9 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            'libraries': {
+                'bundles': 'core.templatetags.bundles',
+            },
         },
     },
 ]
@@ -83,6 +90,11 @@ USE_TZ = True
 STATIC_URL = 'static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 STATIC_ROOT = BASE_DIR / 'collected_static'
+# Scripts which are built into a single minified file by core.storage.BundledStaticFilesMixin on collectstatic.
+# Storages without bundling serve the source scripts one by one, see the "bundle_scripts" template tag.
+STATIC_BUNDLES = {
+    'js/bundle.min.js': ['js/base.js', 'js/jscolor/jscolor.min.js'],
+}
 
 MEDIA_URL = 'media/'
 MEDIA_ROOT = BASE_DIR / 'media'
@@ -90,4 +102,64 @@ MEDIA_ROOT = BASE_DIR / 'media'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+DATABASE_ROUTERS = ['notes.routers.ShardRouter', 'core.routers.ReplicaRouter']
+# Aliases of databases in DATABASES where worktables with their notes and categories are placed, see notes.sharding.
+NOTES_SHARDS = ['default']
+# Texts of archived notes are stored compressed by zlib, see notes.models.ArchivedNote.
+NOTES_ARCHIVE_COMPRESSION = True
+# Texts of notes of at least this many characters are stored compressed by the codec ("zlib" or "lzma"),
+# see notes.fields.CompressedTextField and the compress_note_texts command for existing notes.
+NOTES_TEXT_CODEC = 'zlib'
+NOTES_TEXT_COMPRESSION_THRESHOLD = 2_048
+# Aliases of read replicas of the "default" database in DATABASES, set by environment settings.
+DATABASE_REPLICAS: list[str] = []
+# Seconds for which reads of a client go to the primary database after it wrote, longer than the replication lag.
+DATABASE_REPLICA_STICKY_SECONDS = int(env.get('DJANGO_DATABASE_REPLICA_STICKY_SECONDS', 5))
+DATABASE_REPLICA_COOKIE_NAME = 'use_primary_db'
+
+# Encoder of core.http.JsonResponse: "auto" uses orjson if it's installed, "json" always uses the standard library.
+JSON_ENCODER = env.get('DJANGO_JSON_ENCODER', 'auto')
+# Lists longer than this are streamed by core.http.StreamingJsonResponse.
+JSON_STREAMING_THRESHOLD = 1_000
+# JSON responses shorter than this are sent uncompressed by core.middleware.JsonGZipMiddleware.
+GZIP_MIN_LENGTH = 1_024
+
+# Part of requests measured by core.middleware.RequestMetricsMiddleware, from 0 (none) to 1 (all).
+REQUEST_METRICS_SAMPLE_RATE = float(env.get('DJANGO_REQUEST_METRICS_SAMPLE_RATE', 0.01))
+# Averages of sampled requests per view are logged by "core.metrics" logger once in this number of seconds.
+REQUEST_METRICS_LOG_INTERVAL = 60
+# Shared directory where every worker process writes its metrics for /metrics, None for a single process.
+METRICS_DIR = env.get('DJANGO_METRICS_DIR')
+# Minimal number of seconds between writes of metrics of a process to METRICS_DIR.
+METRICS_WRITE_INTERVAL = 1
+
+# Seconds after which the database query of /readyz is cancelled (on PostgreSQL).
+READINESS_DATABASE_TIMEOUT = 2
+# Seconds for which /readyz keeps the result of checking unapplied migrations.
+READINESS_MIGRATIONS_CACHE_TIMEOUT = 60
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'metrics': {
+            'format': '{asctime} {process} {message}',
+            'style': '{',
+        },
+    },
+    'handlers': {
+        'metrics': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'metrics',
+        },
+    },
+    'loggers': {
+        'core.metrics': {
+            'handlers': ['metrics'],
+            'level': env.get('DJANGO_METRICS_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+    },
+}
+
 AUTH_USER_MODEL = 'accounts.User'
@@ -0,0 +1,27 @@
+"""
+Cache settings
+Docs: https://docs.djangoproject.com/en/4.2/topics/cache/
+
+Development uses a local-memory cache. Production uses a file-based cache shared by all gunicorn workers
+of the container, or any shared backend set by DJANGO_CACHE_BACKEND and DJANGO_CACHE_LOCATION,
+e.g. django.core.cache.backends.redis.RedisCache and redis://redis:6379/1.
+"""
+
+from core.settings.components import env
+
+if env.get('DJANGO_SETTINGS_ENV', 'prod').lower() == 'dev':
+    _backend, _location = 'django.core.cache.backends.locmem.LocMemCache', 'online-notes'
+else:
+    _backend, _location = 'django.core.cache.backends.filebased.FileBasedCache', '/tmp/online_notes_cache'
+
+CACHES = {
+    'default': {
+        'BACKEND': env.get('DJANGO_CACHE_BACKEND', _backend),
+        'LOCATION': env.get('DJANGO_CACHE_LOCATION', _location),
+        'KEY_PREFIX': 'online-notes',
+    },
+}
+
+# Sessions are read from the cache and written through to the database. The database stays the source of truth,
+# so the Session post_delete signal and the purge_stale_worktables anti-join keep working.
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
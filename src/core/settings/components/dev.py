@@ -5,15 +5,17 @@ Development settings
 from core.settings import env
 from core.settings.components import BASE_DIR
 from core.settings.components.base import INSTALLED_APPS, MIDDLEWARE
+from core.settings.components.roles import PROCESS_ROLE
 
 DEBUG = True
 
-DEBUG_TOOLBAR_CONFIG = {
-    'SHOW_TOOLBAR_CALLBACK': lambda request: False,
-}
-INSTALLED_APPS += ['debug_toolbar']
-MIDDLEWARE += ['debug_toolbar.middleware.DebugToolbarMiddleware']
-INTERNAL_IPS = ['127.0.0.1']
+if PROCESS_ROLE == 'web':
+    DEBUG_TOOLBAR_CONFIG = {
+        'SHOW_TOOLBAR_CALLBACK': lambda request: False,
+    }
+    INSTALLED_APPS += ['debug_toolbar']
+    MIDDLEWARE += ['debug_toolbar.middleware.DebugToolbarMiddleware']
+    INTERNAL_IPS = ['127.0.0.1']
 
 if env.get('DOCKER_RUN', '').lower() in ('true', '1'):
     DATABASES = {
@@ -33,3 +35,24 @@ else:
             'NAME': str(BASE_DIR / '../db.sqlite3'),
         }
     }
+    # A second SQLite database to try routing to replicas locally, copy db.sqlite3 over it to "replicate".
+    if env.get('DJANGO_SQLITE_REPLICA', '').lower() in ('true', '1'):
+        DATABASES['replica'] = {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': str(BASE_DIR / '../db.replica.sqlite3'),
+            'TEST': {'MIRROR': 'default'},
+        }
+        DATABASE_REPLICAS = ['replica']
+    # SQLite databases of shards to try sharding locally. DJANGO_SQLITE_SHARDS tells how many shards
+    # get new worktables, extra shards are declared anyway for tests.
+    SQLITE_SHARDS = int(env.get('DJANGO_SQLITE_SHARDS', 1))
+    DATABASES.update(
+        {
+            f'shard_{number}': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': str(BASE_DIR / f'../db.shard_{number}.sqlite3'),
+            }
+            for number in range(1, max(SQLITE_SHARDS, 3))
+        }
+    )
+    NOTES_SHARDS = ['default', *(f'shard_{number}' for number in range(1, SQLITE_SHARDS))]
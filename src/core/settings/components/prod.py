@@ -3,10 +3,31 @@ Production settings
 """
 
 from core.settings import env
+from core.settings.components.base import TEMPLATES
 
 
 DEBUG = False
 
+TEMPLATES[0]['APP_DIRS'] = False
+TEMPLATES[0]['OPTIONS']['loaders'] = [
+    (
+        'django.template.loaders.cached.Loader',
+        [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ],
+    ),
+]
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'core.storage.BundledManifestStaticFilesStorage',
+    },
+}
+
 
 DATABASES = {
     'default': {
@@ -16,5 +37,27 @@ DATABASES = {
         'NAME': env.get('POSTGRES_DB'),
         'USER': env.get('POSTGRES_USER'),
         'PASSWORD': env.get('POSTGRES_PASSWORD'),
+        'OPTIONS': {
+            # Seconds, so that /readyz fails instead of hanging while the database host is unreachable.
+            'connect_timeout': 5,
+        },
     }
 }
+
+# Read replicas of the database, their hosts are separated by spaces in POSTGRES_REPLICA_HOSTS.
+DATABASES.update(
+    {
+        f'replica_{number}': {**DATABASES['default'], 'HOST': host, 'TEST': {'MIRROR': 'default'}}
+        for number, host in enumerate(env.get('POSTGRES_REPLICA_HOSTS', '').split(), start=1)
+    }
+)
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+
+# Databases of shards besides "default", their hosts are separated by spaces in POSTGRES_SHARD_HOSTS.
+DATABASES.update(
+    {
+        f'shard_{number}': {**DATABASES['default'], 'HOST': host}
+        for number, host in enumerate(env.get('POSTGRES_SHARD_HOSTS', '').split(), start=1)
+    }
+)
+NOTES_SHARDS = ['default', *(alias for alias in DATABASES if alias.startswith('shard_'))]
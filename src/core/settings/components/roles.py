@@ -0,0 +1,15 @@
+"""
+Process roles
+
+A role tells which apps a process needs: "web" serves pages and loads everything, "worker" and "management"
+(manage.py commands) skip the admin theme and the debug tooling, which are only used to render pages.
+The role comes from DJANGO_PROCESS_ROLE, which manage.py, wsgi.py and asgi.py set by default.
+"""
+
+from core.settings.components import env
+
+PROCESS_ROLES = ('web', 'worker', 'management')
+PROCESS_ROLE = env.get('DJANGO_PROCESS_ROLE', 'web').lower()
+
+if PROCESS_ROLE not in PROCESS_ROLES:
+    raise ValueError(f'DJANGO_PROCESS_ROLE must be one of {PROCESS_ROLES}, not "{PROCESS_ROLE}".')
@@ -0,0 +1,129 @@
+"""
+Storages of the project.
+"""
+
+import gzip
+from io import BytesIO
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage, StaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:  # only .gz files are written
+    brotli = None
+
+try:
+    import rjsmin
+except ImportError:  # bundles are only concatenated
+    rjsmin = None
+
+
+def gzip_compress(content: bytes) -> bytes:
+    buffer = BytesIO()
+    # mtime=0 makes the output reproducible, so the same file is compressed to the same bytes on every deploy.
+    with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=9, mtime=0) as file:
+        file.write(content)
+    return buffer.getvalue()
+
+
+def brotli_compress(content: bytes) -> bytes:
+    return brotli.compress(content, quality=11)
+
+
+def minify_js(content: str) -> str:
+    if rjsmin is None:
+        return content
+    # /*! ... */ comments are kept for license headers.
+    return rjsmin.jsmin(content, keep_bang_comments=True)
+
+
+class BundledStaticFilesMixin:
+    """
+    Build minified bundles of STATIC_BUNDLES on collectstatic.
+    Bundles are added to the collected files, so they are hashed and compressed by the next storages in the MRO.
+    """
+
+    @property
+    def bundles(self) -> dict[str, list[str]]:
+        return settings.STATIC_BUNDLES
+
+    def build_bundle(self, sources: list[str]) -> bytes:
+        parts = []
+        for source in sources:
+            with self.open(source) as file:
+                parts.append(minify_js(file.read().decode()))
+        # A semicolon guards against a source which doesn't end its last statement.
+        return '\n;\n'.join(parts).encode()
+
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run:
+            paths = paths.copy()
+            for name, sources in self.bundles.items():
+                if self.exists(name):
+                    self.delete(name)
+                self._save(name, ContentFile(self.build_bundle(sources)))
+                paths[name] = (self, name)
+        yield from super().post_process(paths, dry_run, **options)
+
+
+class CompressedStaticFilesMixin:
+    """
+    Write precompressed .gz (and .br if brotli is installed) siblings of text static files
+    on collectstatic, so that the proxy serves them without compressing on every request.
+    """
+
+    compressed_extensions = ('.css', '.js', '.json', '.map', '.svg', '.txt', '.html', '.xml')
+    # Smaller files don't fill up a single network packet even without compression.
+    min_size = 512
+
+    def get_compressors(self) -> dict:
+        compressors = {'gz': gzip_compress}
+        if brotli is not None:
+            compressors['br'] = brotli_compress
+        return compressors
+
+    def post_process(self, paths, dry_run=False, **options):
+        names = dict.fromkeys(paths)
+        parent_post_process = getattr(super(), 'post_process', None)
+        if parent_post_process is not None:
+            for name, processed_name, processed in parent_post_process(paths, dry_run, **options):
+                if processed_name and not isinstance(processed, Exception):
+                    names[processed_name] = None
+                yield name, processed_name, processed
+
+        if dry_run:
+            return
+
+        compressors = self.get_compressors()
+        for name in names:
+            if not name.endswith(self.compressed_extensions):
+                continue
+            with self.open(name) as file:
+                content = file.read()
+            if len(content) < self.min_size:
+                continue
+            for extension, compress in compressors.items():
+                compressed_content = compress(content)
+                # Compressed file which isn't noticeably smaller isn't worth the extra request handling.
+                if len(compressed_content) >= len(content) * 0.95:
+                    continue
+                compressed_name = f'{name}.{extension}'
+                if self.exists(compressed_name):
+                    self.delete(compressed_name)
+                self._save(compressed_name, ContentFile(compressed_content))
+                yield name, compressed_name, True
+
+
+class CompressedStaticFilesStorage(CompressedStaticFilesMixin, StaticFilesStorage):
+    pass
+
+
+class BundledManifestStaticFilesStorage(
+    BundledStaticFilesMixin, CompressedStaticFilesMixin, ManifestStaticFilesStorage
+):
+    """
+    Storage of production: bundled, hashed and precompressed static files.
+    Hashed names never change their content, so the proxy caches them forever.
+    """
@@ -0,0 +1,21 @@
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.utils.html import format_html, format_html_join
+
+register = template.Library()
+
+
+@register.simple_tag
+def bundle_scripts(name: str) -> str:
+    """
+    Render a script tag of the bundle if the staticfiles storage builds bundles,
+    otherwise render script tags of all the bundle sources.
+    """
+    if hasattr(staticfiles_storage, 'bundles'):
+        return format_html('<script src="{}"></script>', staticfiles_storage.url(name))
+    return format_html_join(
+        '\n',
+        '<script src="{}"></script>',
+        ((staticfiles_storage.url(source),) for source in settings.STATIC_BUNDLES[name]),
+    )
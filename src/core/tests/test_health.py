@@ -0,0 +1,58 @@
+from unittest import mock
+
+from django.db import OperationalError
+from django.test import TestCase, override_settings
+
+from core import health
+
+
+@override_settings(ALLOWED_HOSTS=[])
+class HealthCheckMiddlewareTest(TestCase):
+    def setUp(self) -> None:
+        health.reset_migrations_cache()
+        self.addCleanup(health.reset_migrations_cache)
+
+    def test_healthz_returns_ok_without_database_and_session(self):
+        with self.assertNumQueries(0):
+            response = self.client.get('/healthz')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertDictEqual(response.json(), {'status': 'ok'})
+        self.assertFalse(response.cookies)
+
+    def test_readyz_returns_ok_if_database_is_available_and_migrated(self):
+        response = self.client.get('/readyz')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertDictEqual(response.json(), {'status': 'ok'})
+        self.assertFalse(response.cookies)
+
+    def test_readyz_checks_migrations_once_in_cache_timeout(self):
+        with mock.patch.object(health, 'MigrationExecutor', wraps=health.MigrationExecutor) as executor:
+            self.client.get('/readyz')
+            self.client.get('/readyz')
+
+        executor.assert_called_once()
+
+    def test_readyz_returns_error_if_migrations_are_not_applied(self):
+        with (
+            mock.patch.object(health, 'get_unapplied_migrations', return_value=['notes.0042_test']),
+            self.assertLogs('core.health', 'ERROR') as logs,
+        ):
+            response = self.client.get('/readyz')
+
+        self.assertEqual(response.status_code, 503)
+        self.assertDictEqual(response.json(), {'status': 'unavailable', 'errors': ['Migrations are not applied.']})
+        self.assertIn('notes.0042_test', logs.output[0])
+
+    def test_readyz_returns_error_if_database_is_unavailable(self):
+        with (
+            mock.patch.object(health, 'check_database', side_effect=OperationalError('connection refused')),
+            self.assertLogs('core.health', 'ERROR') as logs,
+        ):
+            response = self.client.get('/readyz')
+
+        self.assertEqual(response.status_code, 503)
+        self.assertDictEqual(response.json(), {'status': 'unavailable', 'errors': ['Database is unavailable.']})
+        self.assertNotIn('connection refused', response.content.decode())
+        self.assertIn('connection refused', logs.output[0])
@@ -0,0 +1,89 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import skipIf
+
+from django.http import StreamingHttpResponse
+from django.test import SimpleTestCase, override_settings
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+from django.utils.translation import gettext_lazy
+
+from core import http
+from notes.forms import CategoryUpdateForm
+
+
+class DumpsTest(SimpleTestCase):
+    def setUp(self) -> None:
+        form = CategoryUpdateForm(data={})
+        form.is_valid()
+        self.data = {
+            'errors': form.errors,
+            'lazy': gettext_lazy('title'),
+            'created': datetime(2024, 5, 9, 16, 9, 30, 123456, tzinfo=timezone.utc),
+            'decimal': Decimal('1.50'),
+            'list': [1, 'two', None, True],
+            'safe': mark_safe('<b>safe</b>'),
+            1: 'integer key',
+        }
+        self.expected_data = {
+            'errors': {'title': ['This field is required.'], 'color': ['This field is required.']},
+            'lazy': 'title',
+            'created': '2024-05-09T16:09:30.123Z',
+            'decimal': '1.50',
+            'list': [1, 'two', None, True],
+            'safe': '<b>safe</b>',
+            '1': 'integer key',
+        }
+
+    @override_settings(JSON_ENCODER='json')
+    def test_standard_library_encoder_encodes_django_types(self):
+        self.assertEqual(http.get_encoder_name(), 'json')
+        self.assertDictEqual(json.loads(http.dumps(self.data)), self.expected_data)
+
+    @skipIf(http.orjson is None, 'orjson is not installed')
+    @override_settings(JSON_ENCODER='auto')
+    def test_accelerated_encoder_encodes_django_types_like_standard_library_encoder(self):
+        self.assertEqual(http.get_encoder_name(), 'orjson')
+        self.assertDictEqual(json.loads(http.dumps(self.data)), self.expected_data)
+
+
+class JsonResponseTest(SimpleTestCase):
+    def test_response_encodes_data(self):
+        response = http.JsonResponse(data={'note': {'id': 1}}, status=201)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertDictEqual(json.loads(response.content), {'note': {'id': 1}})
+        self.assertGreaterEqual(response.encode_time, 0)
+
+    @override_settings(JSON_ENCODER='auto')
+    def test_response_encodes_safe_strings(self):
+        response = http.JsonResponse(data={'html': format_html('<b>{}</b>', 'Note & title')})
+
+        self.assertDictEqual(json.loads(response.content), {'html': '<b>Note &amp; title</b>'})
+
+    def test_response_raises_error_for_non_dict_data_if_safe(self):
+        with self.assertRaisesRegex(TypeError, r'safe parameter to False'):
+            http.JsonResponse(data=[1, 2])
+
+
+@override_settings(JSON_STREAMING_THRESHOLD=2)
+class JsonListResponseTest(SimpleTestCase):
+    def test_helper_returns_regular_response_for_short_list(self):
+        response = http.json_list_response(iter([{'id': 1}, {'id': 2}]))
+
+        self.assertIsInstance(response, http.JsonResponse)
+        self.assertListEqual(json.loads(response.content), [{'id': 1}, {'id': 2}])
+
+    def test_helper_streams_long_list(self):
+        items = [{'id': n} for n in range(5)]
+        response = http.json_list_response(iter(items))
+
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertListEqual(json.loads(b''.join(response.streaming_content)), items)
+
+    def test_streaming_response_encodes_empty_list(self):
+        response = http.StreamingJsonResponse(iter([]))
+
+        self.assertListEqual(json.loads(b''.join(response.streaming_content)), [])
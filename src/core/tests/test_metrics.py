@@ -0,0 +1,131 @@
+import json
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from core import metrics
+
+
+class RegistryTest(SimpleTestCase):
+    def setUp(self) -> None:
+        self.registry = metrics.Registry()
+        self.counter = self.registry.counter('test_requests_total', 'Requests.', ('view',))
+        self.histogram = self.registry.histogram('test_duration_seconds', 'Duration.', buckets=(0.1, 1.0))
+
+    def test_registry_renders_counter(self):
+        self.counter.inc(view='home')
+        self.counter.inc(2, view='home')
+        self.counter.inc(view='say "hi"\n')
+
+        self.assertEqual(
+            self.registry.render(),
+            '# HELP test_requests_total Requests.\n'
+            '# TYPE test_requests_total counter\n'
+            'test_requests_total{view="home"} 3\n'
+            'test_requests_total{view="say \\"hi\\"\\n"} 1\n'
+            '# HELP test_duration_seconds Duration.\n'
+            '# TYPE test_duration_seconds histogram\n',
+        )
+
+    def test_registry_renders_cumulative_histogram_buckets(self):
+        for value in (0.05, 0.1, 0.5, 5):
+            self.histogram.observe(value)
+
+        self.assertIn(
+            'test_duration_seconds_bucket{le="0.1"} 2\n'
+            'test_duration_seconds_bucket{le="1.0"} 3\n'
+            'test_duration_seconds_bucket{le="+Inf"} 4\n'
+            'test_duration_seconds_sum 5.65\n'
+            'test_duration_seconds_count 4\n',
+            self.registry.render(),
+        )
+
+    def test_metric_raises_error_for_wrong_labels(self):
+        with self.assertRaises(ValueError):
+            self.counter.inc(status=200)
+
+    def test_registry_returns_registered_metric_by_name(self):
+        self.assertIs(self.registry.counter('test_requests_total', 'Requests.', ('view',)), self.counter)
+        with self.assertRaises(ValueError):
+            self.registry.histogram('test_requests_total', 'Requests.')
+
+    def test_registry_sums_values_of_all_processes_in_directory(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        directory = Path(temp_dir.name)
+        other_process_values = {
+            'test_requests_total': [[['home'], 5], [['categories'], 1]],
+            'test_duration_seconds': [[[], [1, 0, 0, 0.05, 1]]],
+        }
+        (directory / '1-1.json').write_text(json.dumps(other_process_values))
+        self.counter.inc(view='home')
+        self.histogram.observe(0.5)
+
+        values = self.registry.collect(str(directory))
+
+        self.assertDictEqual(values['test_requests_total'], {('home',): 6, ('categories',): 1})
+        self.assertDictEqual(values['test_duration_seconds'], {(): [1, 1, 0, 0.55, 2]})
+
+    def test_values_of_finished_process_are_folded_into_aggregate_file(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        directory = Path(temp_dir.name)
+        for n, started in enumerate((1, 2), 1):
+            # The same pid reused by a process started later.
+            values = {'test_requests_total': [[['home'], n]], 'test_duration_seconds': [[[], [1, 0, 0, 0.05, 1]]]}
+            (directory / f'1-{started}.json').write_text(json.dumps(values))
+            metrics.fold_process_files(str(directory), 1)
+        self.counter.inc(view='home')
+
+        values = self.registry.collect(str(directory))
+
+        self.assertSetEqual(
+            {path.name for path in directory.iterdir()}, {metrics.AGGREGATE_FILE, self.registry.get_file_name()}
+        )
+        self.assertDictEqual(values['test_requests_total'], {('home',): 4})
+        self.assertDictEqual(values['test_duration_seconds'], {(): [2, 0, 0, 0.1, 2]})
+
+    def test_folded_file_which_still_exists_isnt_counted_twice(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        directory = Path(temp_dir.name)
+        process_file = directory / '1-1.json'
+        process_file.write_text(json.dumps({'test_requests_total': [[['home'], 5]]}))
+        metrics.fold_process_files(str(directory), 1)
+        # As if collecting had read the aggregate file before the process file was removed.
+        process_file.write_text(json.dumps({'test_requests_total': [[['home'], 5]]}))
+
+        values = self.registry.collect(str(directory))
+
+        self.assertDictEqual(values['test_requests_total'], {('home',): 5})
+
+
+class MetricsViewTest(TestCase):
+    def setUp(self) -> None:
+        self.url = reverse('metrics')
+
+    @override_settings(REQUEST_METRICS_SAMPLE_RATE=1)
+    def test_view_renders_request_metrics(self):
+        self.client.get(reverse('filter_notes'))
+
+        response = self.client.get(self.url)
+        content = response.content.decode()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], metrics.CONTENT_TYPE)
+        self.assertIn('online_notes_request_duration_seconds_count{view="filter_notes",method="GET"}', content)
+        self.assertIn('online_notes_responses_total{view="filter_notes",status="200"}', content)
+        self.assertIn('online_notes_db_queries_total{view="filter_notes"}', content)
+
+    def test_view_renders_metrics_of_all_processes(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        values = {'online_notes_db_queries_total': [[['other_process_view'], 7]]}
+        (Path(directory.name) / '1-1.json').write_text(json.dumps(values))
+
+        with override_settings(METRICS_DIR=directory.name):
+            content = self.client.get(self.url).content.decode()
+
+        self.assertIn('online_notes_db_queries_total{view="other_process_view"} 7\n', content)
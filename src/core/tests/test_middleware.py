@@ -0,0 +1,129 @@
+import gzip
+import json
+from unittest import mock
+
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core import metrics
+from core.http import JsonResponse, StreamingJsonResponse
+from core.middleware import JsonGZipMiddleware, RequestMetricsMiddleware
+
+
+@override_settings(GZIP_MIN_LENGTH=1_024)
+class JsonGZipMiddlewareTest(SimpleTestCase):
+    def setUp(self) -> None:
+        self.request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip, deflate, br')
+        self.long_data = {'notes': [{'id': n, 'title': f'Note #{n}'} for n in range(100)]}
+
+    def get_response(self, response):
+        return JsonGZipMiddleware(lambda request: response)(self.request)
+
+    def test_middleware_compresses_long_json_response(self):
+        response = self.get_response(JsonResponse(data=self.long_data))
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertDictEqual(json.loads(gzip.decompress(response.content)), self.long_data)
+
+    def test_middleware_compresses_json_response_with_structured_syntax_suffix(self):
+        response = self.get_response(
+            JsonResponse(data=self.long_data, content_type='application/vnd.online-notes.columnar+json')
+        )
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
+    def test_middleware_compresses_streaming_json_response(self):
+        items = self.long_data['notes'][:2]
+        response = self.get_response(StreamingJsonResponse(iter(items)))
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertListEqual(json.loads(gzip.decompress(b''.join(response.streaming_content))), items)
+
+    def test_middleware_does_not_compress_short_json_response(self):
+        response = self.get_response(JsonResponse(data={'note': {'id': 1, 'title': 'Note' * 100}}))
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_middleware_does_not_compress_html_response(self):
+        response = self.get_response(HttpResponse('<p>Note</p>' * 1_000))
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_middleware_does_not_compress_response_for_client_without_gzip_support(self):
+        self.request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='identity')
+
+        response = self.get_response(JsonResponse(data=self.long_data))
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+
+class RequestMetricsMiddlewareTest(TestCase):
+    def setUp(self) -> None:
+        self.url = reverse('filter_notes')
+
+    @override_settings(REQUEST_METRICS_SAMPLE_RATE=1)
+    def test_middleware_adds_server_timing_to_sampled_request(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        self.assertRegex(
+            response['Server-Timing'],
+            rf'^db;dur=[\d.]+;desc="{len(queries)} queries", encode;dur=[\d.]+, app;dur=[\d.]+$',
+        )
+
+    @override_settings(REQUEST_METRICS_SAMPLE_RATE=0)
+    def test_middleware_does_not_measure_not_sampled_request(self):
+        queries = metrics.DB_QUERIES.dump()
+
+        with mock.patch.object(connection, 'execute_wrapper') as execute_wrapper:
+            response = self.client.get(self.url)
+
+        self.assertFalse(response.has_header('Server-Timing'))
+        execute_wrapper.assert_not_called()
+        self.assertEqual(metrics.DB_QUERIES.dump(), queries)
+
+    @override_settings(REQUEST_METRICS_SAMPLE_RATE=1)
+    def test_middleware_counts_queries_of_streaming_response_until_it_is_sent(self):
+        def get_items():
+            for n in range(3):
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+                yield {'id': n}
+
+        def get_queries() -> int:
+            return sum(value for labels, value in metrics.DB_QUERIES.dump() if labels == ['unresolved'])
+
+        queries = get_queries()
+        middleware = RequestMetricsMiddleware(lambda request: StreamingJsonResponse(get_items()))
+        response = middleware(RequestFactory().get('/'))
+
+        self.assertEqual(get_queries(), queries)
+        self.assertNotIn('db;', response['Server-Timing'])
+
+        b''.join(response.streaming_content)
+        response.close()
+
+        self.assertEqual(get_queries(), queries + 3)
+
+    @override_settings(REQUEST_METRICS_SAMPLE_RATE=1, REQUEST_METRICS_LOG_INTERVAL=0)
+    def test_middleware_logs_averages_per_view(self):
+        with self.assertLogs('core.metrics') as logs:
+            self.client.get(self.url)
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertRegex(
+            logs.output[0],
+            r'view=filter_notes requests=1 avg_ms=[\d.]+ avg_queries=[\d.]+ avg_sql_ms=[\d.]+ '
+            r'avg_encode_ms=[\d.]+ avg_bytes=2$',
+        )
+
+    @override_settings(REQUEST_METRICS_SAMPLE_RATE=1, REQUEST_METRICS_LOG_INTERVAL=0)
+    def test_middleware_logs_unresolved_requests(self):
+        with self.assertLogs('core.metrics') as logs:
+            self.client.get('/not-found/')
+
+        self.assertIn('view=unresolved requests=1', logs.output[0])
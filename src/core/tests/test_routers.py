@@ -0,0 +1,91 @@
+from django.db import DEFAULT_DB_ALIAS
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from core import routers
+from core.middleware import ReplicaRoutingMiddleware
+from notes import models
+
+REPLICAS = ['replica_1', 'replica_2']
+
+
+@override_settings(DATABASE_REPLICAS=REPLICAS)
+class ReplicaRouterTest(SimpleTestCase):
+    def setUp(self) -> None:
+        self.router = routers.ReplicaRouter()
+
+    def test_reads_go_to_primary_outside_read_only_block(self):
+        self.assertEqual(self.router.db_for_read(models.Note), DEFAULT_DB_ALIAS)
+
+    def test_reads_go_to_same_replica_in_read_only_block(self):
+        with routers.read_only():
+            replica = self.router.db_for_read(models.Note)
+            self.assertIn(replica, REPLICAS)
+            self.assertEqual(self.router.db_for_read(models.Category), replica)
+
+        self.assertEqual(self.router.db_for_read(models.Note), DEFAULT_DB_ALIAS)
+
+    def test_reads_go_to_primary_after_write(self):
+        with routers.routing_state(), routers.read_only():
+            self.assertEqual(self.router.db_for_write(models.Note), DEFAULT_DB_ALIAS)
+            self.assertEqual(self.router.db_for_read(models.Note), DEFAULT_DB_ALIAS)
+
+    def test_reads_go_to_primary_if_state_is_sticky(self):
+        with routers.routing_state(sticky=True), routers.read_only():
+            self.assertEqual(self.router.db_for_read(models.Note), DEFAULT_DB_ALIAS)
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_reads_go_to_primary_without_replicas(self):
+        with routers.read_only():
+            self.assertEqual(self.router.db_for_read(models.Note), DEFAULT_DB_ALIAS)
+
+
+@override_settings(DATABASE_REPLICAS=REPLICAS)
+class ReplicaRoutingMiddlewareTest(TestCase):
+    def setUp(self) -> None:
+        self.cookie_name = 'use_primary_db'
+        self.request = RequestFactory().get('/')
+
+    def get_response(self, view):
+        return ReplicaRoutingMiddleware(view)(self.request)
+
+    def test_client_gets_cookie_after_write(self):
+        def view(request):
+            routers.ReplicaRouter().db_for_write(models.Note)
+            return HttpResponse()
+
+        response = self.get_response(view)
+
+        self.assertEqual(response.cookies[self.cookie_name]['max-age'], 5)
+
+    def test_client_doesnt_get_cookie_after_reads(self):
+        def view(request):
+            with routers.read_only():
+                self.assertIn(routers.ReplicaRouter().db_for_read(models.Note), REPLICAS)
+            return HttpResponse()
+
+        response = self.get_response(view)
+
+        self.assertNotIn(self.cookie_name, response.cookies)
+
+    def test_client_with_cookie_reads_from_primary(self):
+        self.request.COOKIES[self.cookie_name] = '1'
+
+        def view(request):
+            with routers.read_only():
+                self.assertEqual(routers.ReplicaRouter().db_for_read(models.Note), DEFAULT_DB_ALIAS)
+            return HttpResponse()
+
+        self.get_response(view)
+
+    def test_client_reads_own_note_after_creating_it(self):
+        response = self.client.post(reverse('create_note'), data={'title': 'Note #1'})
+        self.assertEqual(response.status_code, 201)
+        self.assertIn(self.cookie_name, response.cookies)
+
+        note = models.Note.objects.get(title='Note #1')
+        response = self.client.get(reverse('retrieve_note', args=[note.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['note']['title'], 'Note #1')
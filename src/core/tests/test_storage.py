@@ -0,0 +1,67 @@
+import gzip
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from core.storage import CompressedStaticFilesStorage
+
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'core.storage.CompressedStaticFilesStorage'},
+}
+
+
+class CompressedStaticFilesStorageTest(SimpleTestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.static_root = Path(temp_dir.name)
+
+        with override_settings(STATIC_ROOT=self.static_root, STORAGES=STORAGES):
+            call_command('collectstatic', interactive=False, verbosity=0)
+
+    def test_collectstatic_writes_gzip_siblings_of_text_files(self):
+        source = settings.BASE_DIR / 'static/js/base.js'
+
+        compressed_content = (self.static_root / 'js/base.js.gz').read_bytes()
+
+        self.assertEqual(gzip.decompress(compressed_content), source.read_bytes())
+        self.assertLess(len(compressed_content), source.stat().st_size)
+
+    def test_collectstatic_compresses_only_text_files(self):
+        compressed_files = list(self.static_root.rglob('*.gz'))
+
+        self.assertTrue(compressed_files)
+        for compressed_file in compressed_files:
+            self.assertIn(Path(compressed_file.stem).suffix, CompressedStaticFilesStorage.compressed_extensions)
+
+    def test_collectstatic_does_not_compress_short_files(self):
+        for compressed_file in self.static_root.rglob('*.gz'):
+            original_file = compressed_file.with_suffix('')
+            self.assertGreaterEqual(original_file.stat().st_size, CompressedStaticFilesStorage.min_size)
+
+
+class BundledManifestStaticFilesStorageTest(SimpleTestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.static_root = Path(temp_dir.name)
+        self.storages = {**STORAGES, 'staticfiles': {'BACKEND': 'core.storage.BundledManifestStaticFilesStorage'}}
+
+        with override_settings(STATIC_ROOT=self.static_root, STORAGES=self.storages):
+            call_command('collectstatic', interactive=False, verbosity=0)
+
+    def test_collectstatic_writes_hashed_and_compressed_bundle(self):
+        with override_settings(STATIC_ROOT=self.static_root, STORAGES=self.storages):
+            url = staticfiles_storage.url('js/bundle.min.js')
+        bundle = self.static_root / url.removeprefix('/static/')
+
+        self.assertRegex(bundle.name, r'^bundle\.min\.[0-9a-f]{12}\.js$')
+        self.assertTrue(bundle.with_name(f'{bundle.name}.gz').exists())
+        content = bundle.read_text()
+        self.assertIn('function', content)
+        self.assertIn('jscolor', content)
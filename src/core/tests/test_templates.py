@@ -0,0 +1,71 @@
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.template import Context, Template
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'core.storage.BundledManifestStaticFilesStorage'},
+}
+
+
+class HashedStaticUrlsTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The directory is created only when the tests run, so importing the module leaves nothing behind.
+        cls.static_root = Path(tempfile.mkdtemp())
+        cls.static_settings = override_settings(STATIC_ROOT=cls.static_root, STORAGES=STORAGES)
+        cls.static_settings.enable()
+        super().setUpClass()
+        call_command('collectstatic', interactive=False, clear=True, verbosity=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.static_settings.disable()
+        shutil.rmtree(cls.static_root)
+
+    def setUp(self) -> None:
+        self.static_prefix = staticfiles_storage.base_url
+
+    def assertHashedUrl(self, url: str):
+        self.assertRegex(url, rf'^{re.escape(self.static_prefix)}\S+\.[0-9a-f]{{12}}\.\w+$')
+        self.assertTrue((self.static_root / url.removeprefix(self.static_prefix)).exists(), url)
+
+    def test_templates_reference_static_files_only_by_tags(self):
+        for template in Path(settings.TEMPLATES[0]['DIRS'][0]).rglob('*.html'):
+            source = template.read_text()
+            self.assertNotRegex(source, rf"""["']/?{re.escape(settings.STATIC_URL)}""", template)
+
+            for name in re.findall(r"""{%\s*(?:static|bundle_scripts)\s+['"]([^'"]+)['"]""", source):
+                self.assertHashedUrl(staticfiles_storage.url(name))
+
+    def test_pages_reference_hashed_urls(self):
+        for url in (reverse('home'), reverse('categories')):
+            content = self.client.get(url).content.decode()
+            static_urls = re.findall(rf"""["']({re.escape(self.static_prefix)}[^"']+)["']""", content)
+
+            self.assertTrue(static_urls, url)
+            for static_url in static_urls:
+                self.assertHashedUrl(static_url)
+
+
+@override_settings(STATIC_BUNDLES={'js/bundle.min.js': ['js/base.js', 'js/jscolor/jscolor.min.js']})
+class BundleScriptsTagTest(SimpleTestCase):
+    def setUp(self) -> None:
+        self.template = Template("{% load bundles %}{% bundle_scripts 'js/bundle.min.js' %}")
+
+    def test_tag_renders_sources_if_storage_does_not_build_bundles(self):
+        content = self.template.render(Context())
+
+        self.assertHTMLEqual(
+            content,
+            '<script src="/static/js/base.js"></script><script src="/static/js/jscolor/jscolor.min.js"></script>',
+        )
@@ -1,16 +1,23 @@
+from django.apps import apps
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 
+from core import views
+
 urlpatterns = [
+    path('metrics', views.metrics, name='metrics'),
     path('admin/', admin.site.urls),
-    path('baton/', include('baton.urls')),
     path('account/', include('accounts.urls')),
     path('', include('notes.urls')),
 ]
 
 urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
-if settings.DEBUG:
+# Installed only for the web process role, see core/settings/components/roles.py.
+if apps.is_installed('baton'):
+    urlpatterns += [path('baton/', include('baton.urls'))]
+
+if apps.is_installed('debug_toolbar'):
     urlpatterns += [path('__debug__/', include('debug_toolbar.urls'))]
@@ -0,0 +1,9 @@
+from django.conf import settings
+from django.http import HttpResponse
+
+from core import metrics as core_metrics
+
+
+def metrics(request):
+    content = core_metrics.REGISTRY.render(settings.METRICS_DIR)
+    return HttpResponse(content, content_type=core_metrics.CONTENT_TYPE)
@@ -0,0 +1,80 @@
+"""
+Gunicorn configuration, gunicorn reads it from the working directory (src).
+Every setting is overridable by a GUNICORN_* environment variable.
+
+Docs: https://docs.gunicorn.org/en/stable/settings.html
+"""
+
+import gc
+import multiprocessing
+import os
+import shutil
+
+env = os.environ
+
+wsgi_app = 'core.wsgi:application'
+bind = env.get('GUNICORN_BIND', '0.0.0.0:8000')
+pidfile = env.get('GUNICORN_PIDFILE', '/tmp/online_notes_gunicorn.pid')
+
+# "sync" suits CPU-bound views, "gthread" keeps workers responsive while they wait for the database.
+worker_class = env.get('GUNICORN_WORKER_CLASS', 'sync')
+cpu_count = multiprocessing.cpu_count()
+if worker_class == 'gthread':
+    workers = int(env.get('GUNICORN_WORKERS', cpu_count + 1))
+    threads = int(env.get('GUNICORN_THREADS', 4))
+else:
+    workers = int(env.get('GUNICORN_WORKERS', cpu_count * 2 + 1))
+    threads = 1
+
+# Workers are recycled to bound memory growth, the jitter keeps them from restarting all at once.
+max_requests = int(env.get('GUNICORN_MAX_REQUESTS', 1_000))
+max_requests_jitter = int(env.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+timeout = int(env.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(env.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+# Seconds to hold idle keep-alive connections of gthread workers, sync workers close connections anyway.
+keepalive = int(env.get('GUNICORN_KEEPALIVE', 5))
+
+# Django and the apps are imported once in the master and shared by forked workers. The garbage collector
+# is disabled until then, because collecting writes to headers of objects and copies shared pages.
+preload_app = env.get('GUNICORN_PRELOAD_APP', 'true').lower() in ('true', '1')
+if preload_app:
+    gc.disable()
+
+
+def on_starting(server):
+    # Metrics files of workers of the previous run would be summed up with the new ones.
+    metrics_dir = env.get('DJANGO_METRICS_DIR')
+    if metrics_dir:
+        shutil.rmtree(metrics_dir, ignore_errors=True)
+        os.makedirs(metrics_dir)
+
+
+def worker_exit(server, worker):
+    # Values since the last periodic write of the worker, its file is folded by child_exit.
+    metrics_dir = env.get('DJANGO_METRICS_DIR')
+    if metrics_dir:
+        from core import metrics
+
+        metrics.REGISTRY.write(metrics_dir)
+
+
+def child_exit(server, worker):
+    # Recycled workers leave their files, their values are moved to the aggregate file of the directory.
+    metrics_dir = env.get('DJANGO_METRICS_DIR')
+    if metrics_dir:
+        from core import metrics
+
+        metrics.fold_process_files(metrics_dir, worker.pid)
+
+
+def when_ready(server):
+    if preload_app:
+        # Objects of the loaded application are moved to the permanent generation,
+        # so collections in workers never touch them.
+        gc.freeze()
+
+
+def post_fork(server, worker):
+    if preload_app:
+        gc.enable()
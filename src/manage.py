@@ -4,10 +4,18 @@
 import os
 import sys
 
+# Commands which serve pages or collect static files of all apps run with the apps of the web process role.
+WEB_COMMANDS = ('runserver', 'test', 'collectstatic', 'findstatic', 'bootstrap')
+
+
+def get_process_role(argv: list[str]) -> str:
+    return 'web' if len(argv) > 1 and argv[1] in WEB_COMMANDS else 'management'
+
 
 def main():
     """Run administrative tasks."""
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+    os.environ.setdefault('DJANGO_PROCESS_ROLE', get_process_role(sys.argv))
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
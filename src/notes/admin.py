@@ -6,9 +6,9 @@ from notes import models
 
 @admin.register(models.Note)
 class NoteAdmin(admin.ModelAdmin):
-    list_display = ('title', 'worktable', 'category', 'is_archived', 'created')
+    list_display = ('title', 'worktable', 'category', 'created')
     fieldsets = (
-        ('Information', {'fields': ('worktable', 'category', 'title', 'text', 'is_archived')}),
+        ('Information', {'fields': ('worktable', 'category', 'title', 'text')}),
         ('Dates', {'fields': ('created',)}),
     )
     readonly_fields = ('created',)
@@ -19,6 +19,16 @@ class NoteAdmin(admin.ModelAdmin):
         return self.readonly_fields
 
 
+@admin.register(models.ArchivedNote)
+class ArchivedNoteAdmin(admin.ModelAdmin):
+    list_display = ('title', 'worktable', 'category', 'created')
+    fieldsets = (
+        ('Information', {'fields': ('worktable', 'category', 'title', 'text', 'is_text_compressed')}),
+        ('Dates', {'fields': ('created',)}),
+    )
+    readonly_fields = ('worktable', 'category', 'title', 'text', 'is_text_compressed', 'created')
+
+
 class NoteInlineForCategory(admin.StackedInline):
     model = models.Note
     fields = ('worktable', 'title', 'text')
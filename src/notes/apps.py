@@ -7,4 +7,6 @@ class NotesConfig(AppConfig):
 
     def ready(self):
         from notes.signals import delete_worktable_after_deleting_session  # noqa
+        from notes.signals import bump_version_of_created_worktable  # noqa
+        from notes.signals import bump_worktable_version_after_changing_category  # noqa
         from notes.signals import set_quantity_of_all_words  # noqa
@@ -0,0 +1,84 @@
+import base64
+import lzma
+import zlib
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+
+# Stored values which start with the marker are "<marker><codec>:<payload>", other values are plain texts.
+MARKER = '\x02'
+CODECS = {
+    'zlib': (zlib.compress, zlib.decompress),
+    'lzma': (lzma.compress, lzma.decompress),
+}
+# Plain texts which start with the marker themselves are stored behind "<marker>raw:".
+RAW = 'raw'
+
+
+def decode_text(value: str | None) -> str | None:
+    """Return a text from its stored value, compressed by any codec or plain."""
+    if value is None or not value.startswith(MARKER):
+        return value
+    codec, _, payload = value[len(MARKER) :].partition(':')
+    if codec == RAW:
+        return payload
+    decompress = CODECS[codec][1]
+    return decompress(base64.b64decode(payload)).decode()
+
+
+class CompressedTextField(models.TextField):
+    """
+    A text field which stores texts of at least `threshold` characters compressed by `codec` ("zlib" or "lzma")
+    and base64-encoded behind a marker, if it makes them smaller. Shorter texts are stored as is, so they
+    cost nothing to read and write, and rows written before the field compressed texts stay readable.
+    Texts are compressed in Python, so database lookups of their content, e.g. icontains, don't find them.
+    PostgreSQL compresses large values itself (TOAST) better than base64 allows, so texts are stored as is there.
+    """
+
+    self_compressing_vendors = ('postgresql',)
+
+    def __init__(self, *args, codec: str | None = None, threshold: int | None = None, **kwargs):
+        # Neither option changes the schema, so they aren't deconstructed into migrations and by default
+        # they are read from NOTES_TEXT_CODEC and NOTES_TEXT_COMPRESSION_THRESHOLD settings at runtime.
+        if codec is not None and codec not in CODECS:
+            raise ValueError(f'Codec must be one of {", ".join(CODECS)}.')
+        self._codec = codec
+        self._threshold = threshold
+        super().__init__(*args, **kwargs)
+
+    @property
+    def codec(self) -> str:
+        codec = self._codec or settings.NOTES_TEXT_CODEC
+        if codec not in CODECS:
+            raise ImproperlyConfigured(f'NOTES_TEXT_CODEC must be one of {", ".join(CODECS)}.')
+        return codec
+
+    @property
+    def threshold(self) -> int:
+        return settings.NOTES_TEXT_COMPRESSION_THRESHOLD if self._threshold is None else self._threshold
+
+    def compresses_on(self, connection) -> bool:
+        return connection.vendor not in self.self_compressing_vendors
+
+    def encode(self, value: str | None, compress: bool = True) -> str | None:
+        """Return the stored value of a text."""
+        if value is None:
+            return None
+        if compress and len(value) >= self.threshold:
+            data = value.encode()
+            codec = self.codec
+            encoded = f'{MARKER}{codec}:{base64.b64encode(CODECS[codec][0](data)).decode()}'
+            if len(encoded) < len(data):
+                return encoded
+        if value.startswith(MARKER):
+            return f'{MARKER}{RAW}:{value}'
+        return value
+
+    def from_db_value(self, value, expression, connection):
+        return decode_text(value)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        # Lookups pass prepared values, which are still texts, so they are encoded here as well.
+        value = super().get_db_prep_value(value, connection, prepared)
+        return self.encode(value, compress=self.compresses_on(connection))
@@ -1,6 +1,11 @@
+import copy
+import functools
+
 import django_filters as filters
+from django import forms
 from django.utils.translation import gettext as _
 from django.db import models as dj_models
+from django.db.models import QuerySet
 
 from notes import models, services
 
@@ -23,24 +28,61 @@ class NoteFilter(filters.FilterSet):
         super().__init__(*args, **kwargs)
         self.request = request
         self.worktable = services.get_worktable(self.request)
-        self.queryset = self.worktable.get_all_notes()
+        self.queryset = self.get_worktable_notes()
         self.filters['category'].queryset = self.worktable.get_all_categories()
 
+    def get_worktable_notes(self) -> QuerySet:
+        return self.worktable.get_all_notes()
+
+    @classmethod
+    @functools.cache
+    def get_base_form_class(cls) -> type[forms.Form]:
+        """
+        Return a form class built from base filters once per filterset class.
+        Choices of the category field must be set for every form instance.
+        """
+        fields = {name: filter_.field for name, filter_ in copy.deepcopy(cls.base_filters).items()}
+        return type(f'{cls.__name__}Form', (cls._meta.form,), fields)
+
     def _get_value_as_int(self, value):
         try:
             value = int(value)
-        except ValueError:
+        except (TypeError, ValueError):
             value = 0
         return value
 
     def filter_by_status(self, queryset, name, value):
-        value = self._get_value_as_int(value)
+        # The status chooses tiers of notes to filter, see tiers.
+        return queryset
+
+    @property
+    def tiers(self) -> list[QuerySet]:
+        """
+        Return filtered querysets of the tiers which the status asks for: active notes, archived notes or both.
+        Every queryset is ordered by the creation date and id descending, see services.merge_note_tiers(),
+        so notes with the same date keep their order between requests which skip the first of them.
+        """
+        if not hasattr(self, '_tiers'):
+            status = None
+            if self.is_bound:
+                # Like qs, fields with errors are left out of filtering.
+                self.form.is_valid()
+                status = self.form.cleaned_data.get('status')
+            status = self._get_value_as_int(status)
+            self._tiers = []
+            if status != self.Status.ARCHIVED:
+                self._tiers.append(self.qs.order_by('-created', '-id'))
+            if status != self.Status.ACTIVE:
+                archived_filter = ArchivedNoteFilter(self.request, data=self.data if self.is_bound else None)
+                self._tiers.append(archived_filter.qs.order_by('-created', '-id'))
+        return self._tiers
+
+
+class ArchivedNoteFilter(NoteFilter):
+    """Filter of archived notes by the same fields, NoteFilter.tiers applies it to the archive tier."""
 
-        if value == self.Status.ACTIVE:
-            result = queryset.filter(is_archived=False)
-        elif value == self.Status.ARCHIVED:
-            result = queryset.filter(is_archived=True)
-        else:
-            result = queryset
+    class Meta(NoteFilter.Meta):
+        model = models.ArchivedNote
 
-        return result
+    def get_worktable_notes(self) -> QuerySet:
+        return self.worktable.get_all_archived_notes()
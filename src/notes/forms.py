@@ -1,9 +1,31 @@
+import functools
+import inspect
+
 from django import forms
+from django.db import router, transaction
+from django.utils.functional import SimpleLazyObject
 
 from notes import models, services
 from notes.services import get_worktable
 
 
+@functools.cache
+def accepts_request(form_class: type[forms.BaseForm]) -> bool:
+    """Return True if a constructor of the form class takes a request. It's introspected once per class."""
+    return 'request' in inspect.signature(form_class.__init__).parameters
+
+
+def build_form(form_class: type[forms.BaseForm], request, *args, **kwargs) -> forms.BaseForm:
+    if accepts_request(form_class):
+        return form_class(request, *args, **kwargs)
+    return form_class(*args, **kwargs)
+
+
+def lazy_form(form_class: type[forms.BaseForm], request) -> forms.BaseForm:
+    """Return a form which is built only when a template renders it."""
+    return SimpleLazyObject(lambda: build_form(form_class, request))  # type: ignore
+
+
 class BaseCreateForm(forms.ModelForm):
     """BaseCreateForm for models that has more to one relation with a worktable"""
 
@@ -13,7 +35,7 @@ class BaseCreateForm(forms.ModelForm):
 
     def save(self, commit=True):
         obj = super().save(commit=False)
-        obj.worktable = services.get_worktable(self.request)
+        obj.worktable = services.get_or_create_worktable(self.request)
         obj.save()
         return obj
 
@@ -40,7 +62,57 @@ class NoteCreateForm(BaseCreateForm):
         self.fields['category'].queryset = get_worktable(self.request).get_all_categories()
 
 
-class NoteUpdateForm(forms.ModelForm):
+class BaseNoteUpdateForm(forms.ModelForm):
+    """BaseNoteUpdateForm for notes of both tiers"""
+
+    # The version of the note which the edit was made against, like patches of its text are.
+    version = forms.IntegerField(min_value=0)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Categories are looked up on the shard of the note.
+        self.fields['category'].queryset = self.instance.worktable.get_all_categories()
+
+    def save(self, commit=True):
+        """
+        Save the note as the next version. Raise services.NoteVersionConflict if the note was changed
+        since the version of the edit, so a full update doesn't overwrite a newer patch and makes patches
+        made against earlier versions conflict. Raise DoesNotExist of its model if it was moved or deleted.
+        """
+        version = self.cleaned_data['version']
+        self.instance.version = version + 1
+        if not commit:
+            return super().save(commit)
+
+        model = type(self.instance)
+        database = router.db_for_write(model, instance=self.instance)
+        with transaction.atomic(using=database):
+            # The version is bumped by a conditional update first, like patches do, so only one of concurrent
+            # saves of a version passes and the row stays locked until the note is saved.
+            notes = model.objects.using(database).filter(pk=self.instance.pk, version=version)
+            if not notes.update(version=version + 1):
+                raise services.NoteVersionConflict(services.get_note_version(model, database, self.instance.pk))
+            return super().save(commit)
+
+
+class NoteUpdateForm(BaseNoteUpdateForm):
     class Meta:
         model = models.Note
         fields = ('category', 'title', 'text')
+
+
+class ArchivedNoteUpdateForm(BaseNoteUpdateForm):
+    # The text of an archived note is a property over its stored text, so the field is the one of active notes.
+    text = models.Note._meta.get_field('text').formfield()
+
+    class Meta:
+        model = models.ArchivedNote
+        fields = ('category', 'title')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.initial.setdefault('text', self.instance.text)
+
+    def save(self, commit=True):
+        self.instance.text = self.cleaned_data['text']
+        return super().save(commit)
@@ -0,0 +1,100 @@
+import hashlib
+import json
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import BaseCommand, call_command
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext as _
+
+from core import health
+from core.settings.components import env
+from notes import services
+from notes.models import Worktable
+
+STATIC_FINGERPRINT_NAME = '.static-fingerprint'
+IGNORED_STATIC_PATTERNS = ['CVS', '.*', '*~']
+
+
+def get_static_fingerprint() -> str:
+    """Return a hash of contents of all static files and settings which affect collectstatic."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([settings.STORAGES['staticfiles'], settings.STATIC_BUNDLES], sort_keys=True).encode())
+    for finder in finders.get_finders():
+        for path, storage in finder.list(IGNORED_STATIC_PATTERNS):
+            digest.update(f'{getattr(storage, "prefix", None) or ""}/{path}'.encode())
+            with storage.open(path) as file:
+                digest.update(file.read())
+    return digest.hexdigest()
+
+
+class Command(BaseCommand):
+    help = _(
+        'Prepare the database and static files before web processes start: apply migrations, '
+        'create the superuser with a worktable and collect static files. Steps with nothing to do are skipped.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            dest='force',
+            help=_('Run every step even if it has nothing to do.'),
+        )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        for step in (self.migrate, self.create_superuser, self.collect_static):
+            step_start = time.perf_counter()
+            message = step(options['force'])
+            self.stdout.write(f'{message} ({time.perf_counter() - step_start:.2f} s)')
+        self.stdout.write(self.style.SUCCESS(_(f'Bootstrap finished in {time.perf_counter() - start:.2f} s.')))
+
+    def migrate(self, force: bool) -> str:
+        # Every shard is checked on its own, so that a new shard is migrated even if "default" is up to date.
+        unapplied_migrations = {
+            database: health.get_unapplied_migrations(cache_timeout=0, database=database)
+            for database in dict.fromkeys([DEFAULT_DB_ALIAS, *settings.NOTES_SHARDS])
+        }
+        if not any(unapplied_migrations.values()) and not force:
+            return _('Migrations: nothing to apply, skipped.')
+        for database, migrations in unapplied_migrations.items():
+            if migrations or force:
+                call_command('migrate', database=database, interactive=False, verbosity=0)
+        applied = ', '.join(f'{len(migrations)} to {database}' for database, migrations in unapplied_migrations.items())
+        return _(f'Migrations: applied {applied}.')
+
+    def create_superuser(self, force: bool) -> str:
+        email = env.get('DJANGO_SUPERUSER_EMAIL')
+        if not email:
+            return _('Superuser: DJANGO_SUPERUSER_EMAIL environment variable is not set, skipped.')
+
+        user_model = get_user_model()
+        superuser = user_model.objects.filter(email=email).first()
+        if superuser is None:
+            call_command('createsuperuser', interactive=False, email=email, verbosity=0)
+            superuser = user_model.objects.get(email=email)
+            message = _('Superuser: created with a worktable.')
+        else:
+            message = _('Superuser: already exists, skipped.')
+        if services.find_worktable(user=superuser) is None:
+            Worktable.objects.create(user=superuser)
+        return message
+
+    def collect_static(self, force: bool) -> str:
+        fingerprint = get_static_fingerprint()
+        fingerprint_path = Path(settings.STATIC_ROOT) / STATIC_FINGERPRINT_NAME
+        manifest_name = getattr(staticfiles_storage, 'manifest_name', None)
+        collected = fingerprint_path.exists() and fingerprint_path.read_text() == fingerprint
+        if manifest_name is not None:
+            collected = collected and staticfiles_storage.exists(manifest_name)
+        if collected and not force:
+            return _('Static files: not changed since the last collecting, skipped.')
+
+        call_command('collectstatic', interactive=False, verbosity=0)
+        fingerprint_path.write_text(fingerprint)
+        return _('Static files: collected.')
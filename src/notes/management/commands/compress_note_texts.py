@@ -0,0 +1,97 @@
+import time
+
+from django.core.management import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models.functions import Length
+from django.utils.translation import gettext as _
+
+from notes import fields, models
+
+
+class Command(BaseCommand):
+    help = _(
+        'Compress texts of notes which were written before the text field compressed them or with another threshold. '
+        'Notes are rewritten in short transactions, so the command can run alongside the site.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1_000,
+            dest='batch_size',
+            help=_('Quantity of notes rewritten in one transaction.'),
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0,
+            help=_('Seconds to wait between batches to leave the database to the site.'),
+        )
+        parser.add_argument(
+            '--database',
+            default=DEFAULT_DB_ALIAS,
+            help=_('Database to compress notes in, e.g. a shard.'),
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            dest='dry_run',
+            help=_('Only count notes with uncompressed texts without rewriting them.'),
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError(_('Batch size must be a positive integer.'))
+
+        database = options['database']
+        field = models.Note._meta.get_field('text')
+        if not field.compresses_on(connections[database]):
+            self.stdout.write(
+                _(f'Texts are stored as is on {connections[database].vendor}, which compresses them itself.')
+            )
+            return
+
+        # startswith doesn't prepare its value by the field, so it finds stored values which are compressed.
+        notes = (
+            models.Note.objects.using(database)
+            .annotate(text_length=Length('text'))
+            .filter(text_length__gte=field.threshold)
+            .exclude(text__startswith=fields.MARKER)
+            .only('text')
+            .order_by('pk')
+        )
+
+        if options['dry_run']:
+            self.stdout.write(_(f'Found {notes.count()} notes with uncompressed texts.'))
+            return
+
+        start = time.perf_counter()
+        compressed = size = compressed_size = 0
+        last_pk = 0
+        while batch := list(notes.filter(pk__gt=last_pk)[:batch_size]):
+            last_pk = batch[-1].pk
+            changed = []
+            for note in batch:
+                # Texts which don't get smaller stay as they are.
+                if (stored_text := field.encode(note.text)).startswith(fields.MARKER):
+                    changed.append(note)
+                    size += len(note.text.encode())
+                    compressed_size += len(stored_text)
+            if changed:
+                with transaction.atomic(using=database):
+                    models.Note.objects.using(database).bulk_update(changed, ['text'])
+            compressed += len(changed)
+            self.stdout.write(_(f'Compressed batch of {len(changed)} texts.'), self.style.HTTP_INFO)
+            if options['pause']:
+                time.sleep(options['pause'])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                _(
+                    f'Compressed {compressed} texts from {size} to {compressed_size} bytes '
+                    f'in {time.perf_counter() - start:.2f} s.'
+                )
+            )
+        )
@@ -0,0 +1,153 @@
+import time
+
+from django.core.management import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils.translation import gettext as _
+
+from notes import models
+
+
+def get_partition_sql(
+    table: str,
+    key: str,
+    partitions: int,
+    indexes: list[tuple[str, str, bool]],
+    foreign_keys: list[tuple[str, str]],
+    quote_name=lambda name: f'"{name}"',
+) -> list[str]:
+    """
+    Return statements which turn a plain table into a table hash-partitioned by the key column.
+    indexes are (name, definition, is_primary) and foreign_keys are (name, definition) of the plain table.
+    Rows are copied before indexes and foreign keys are created, which is faster than keeping them up to date.
+    The primary key of a partitioned table must include the key, so it's (id, key), while ids still come
+    from a single identity sequence and stay unique.
+    """
+    old_table = f'{table}_unpartitioned'
+    statements = [
+        f'LOCK TABLE {quote_name(table)} IN ACCESS EXCLUSIVE MODE',
+        f'ALTER TABLE {quote_name(table)} RENAME TO {quote_name(old_table)}',
+        f'CREATE TABLE {quote_name(table)} (LIKE {quote_name(old_table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+        f'PARTITION BY HASH ({quote_name(key)})',
+    ]
+    statements += [
+        f'CREATE TABLE {quote_name(f"{table}_p{remainder}")} PARTITION OF {quote_name(table)} '
+        f'FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})'
+        for remainder in range(partitions)
+    ]
+    statements += [
+        f'INSERT INTO {quote_name(table)} SELECT * FROM {quote_name(old_table)}',
+        f'DROP TABLE {quote_name(old_table)}',
+        f'ALTER TABLE {quote_name(table)} ALTER COLUMN "id" ADD GENERATED BY DEFAULT AS IDENTITY',
+        f"SELECT setval(pg_get_serial_sequence('{quote_name(table)}', 'id'), COALESCE(MAX(\"id\"), 0) + 1, false) "
+        f'FROM {quote_name(table)}',
+    ]
+    for name, definition, is_primary in indexes:
+        if is_primary:
+            statements.append(
+                f'ALTER TABLE {quote_name(table)} ADD CONSTRAINT {quote_name(name)} PRIMARY KEY ("id", {quote_name(key)})'
+            )
+        else:
+            # Indexes on a partitioned table are created on every partition.
+            statements.append(definition)
+    statements += [
+        f'ALTER TABLE {quote_name(table)} ADD CONSTRAINT {quote_name(name)} {definition}'
+        for name, definition in foreign_keys
+    ]
+    statements.append(f'ANALYZE {quote_name(table)}')
+    return statements
+
+
+class Command(BaseCommand):
+    help = _(
+        'Convert the table of notes on PostgreSQL to a table hash-partitioned by worktable, so that queries '
+        'of a worktable and vacuum work with one partition. The Note model works with both tables as is. '
+        'The table is locked while rows are copied.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--partitions',
+            type=int,
+            default=16,
+            help=_('Quantity of partitions.'),
+        )
+        parser.add_argument(
+            '--database',
+            default=DEFAULT_DB_ALIAS,
+            help=_('Database to convert the table in, e.g. a shard.'),
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            dest='dry_run',
+            help=_('Only print SQL statements without running them.'),
+        )
+
+    def handle(self, *args, **options):
+        if options['partitions'] < 2:
+            raise CommandError(_('Quantity of partitions must be at least 2.'))
+        connection = connections[options['database']]
+        if connection.vendor != 'postgresql':
+            raise CommandError(_(f'Partitioning needs PostgreSQL, the database is {connection.vendor}.'))
+
+        table = models.Note._meta.db_table
+        key = models.Note._meta.get_field('worktable').column
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)', [table])
+            if (row := cursor.fetchone()) is None:
+                raise CommandError(
+                    _(f'Table {table} doesn\'t exist in database {options["database"]}, migrate it first.')
+                )
+            if row[0] == 'p':
+                raise CommandError(_(f'Table {table} is already partitioned.'))
+
+            cursor.execute(
+                'SELECT conrelid::regclass::text FROM pg_constraint WHERE contype = %s AND confrelid = to_regclass(%s)',
+                ['f', table],
+            )
+            if referencing := [row[0] for row in cursor.fetchall()]:
+                raise CommandError(
+                    _(f'Tables {", ".join(referencing)} reference {table}, its primary key must stay a single id.')
+                )
+
+            # An index covers the key if the key is one of its columns, whatever their quantity and order.
+            cursor.execute(
+                'SELECT c.relname, pg_get_indexdef(i.indexrelid), i.indisprimary, i.indisunique, '
+                'a.attnum = ANY(i.indkey::int2[]) '
+                'FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid '
+                'JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attname = %s '
+                'WHERE i.indrelid = to_regclass(%s)',
+                [key, table],
+            )
+            indexes = []
+            for name, definition, is_primary, is_unique, covers_key in cursor.fetchall():
+                if is_unique and not is_primary and not covers_key:
+                    raise CommandError(_(f'Unique index {name} must include {key} to be partitioned.'))
+                indexes.append((name, definition, is_primary))
+
+            cursor.execute(
+                'SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint '
+                'WHERE contype = %s AND conrelid = to_regclass(%s)',
+                ['f', table],
+            )
+            foreign_keys = cursor.fetchall()
+
+        statements = get_partition_sql(
+            table, key, options['partitions'], indexes, foreign_keys, quote_name=connection.ops.quote_name
+        )
+        if options['dry_run']:
+            self.stdout.write(';\n'.join(statements) + ';')
+            return
+
+        start = time.perf_counter()
+        with transaction.atomic(using=options['database']), connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+        self.stdout.write(
+            self.style.SUCCESS(
+                _(
+                    f'Partitioned {table} into {options["partitions"]} partitions by {key} '
+                    f'in {time.perf_counter() - start:.2f} s.'
+                )
+            )
+        )
@@ -0,0 +1,71 @@
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.translation import gettext as _
+
+from notes import services
+
+
+DB_SESSION_ENGINES = (
+    'django.contrib.sessions.backends.db',
+    'django.contrib.sessions.backends.cached_db',
+)
+
+
+class Command(BaseCommand):
+    help = _('Delete anonymous worktables with their notes and categories if their sessions expired or were deleted.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1_000,
+            dest='batch_size',
+            help=_('Quantity of worktables deleted in one transaction.'),
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            dest='dry_run',
+            help=_('Only count stale worktables without deleting them.'),
+        )
+
+    def handle(self, *args, **options):
+        if settings.SESSION_ENGINE not in DB_SESSION_ENGINES:
+            raise CommandError(
+                _(
+                    f'Sessions must be stored in the database to find stale worktables, not by {settings.SESSION_ENGINE}.'
+                )
+            )
+
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError(_('Batch size must be a positive integer.'))
+
+        stale_ids = services.get_stale_worktables().order_by('pk').values_list('pk', flat=True)
+
+        if options['dry_run']:
+            self.stdout.write(_(f'Found {stale_ids.count()} stale worktables.'))
+            return
+
+        start = time.perf_counter()
+        deleted: dict[str, int] = {}
+        last_pk = 0
+        while ids := list(stale_ids.filter(pk__gt=last_pk)[:batch_size]):
+            with transaction.atomic():
+                for label, quantity in services.delete_worktables(ids).items():
+                    deleted[label] = deleted.get(label, 0) + quantity
+            last_pk = ids[-1]
+            self.stdout.write(_(f'Deleted batch of {len(ids)} worktables.'), self.style.HTTP_INFO)
+
+        seconds = time.perf_counter() - start
+        rows = sum(deleted.values())
+        for label, quantity in sorted(deleted.items()):
+            self.stdout.write(f'{label}: {quantity}')
+        self.stdout.write(
+            self.style.SUCCESS(
+                _(f'Deleted {rows} rows in {seconds:.2f} s ({rows / seconds if seconds else 0:.0f} rows/s).')
+            )
+        )
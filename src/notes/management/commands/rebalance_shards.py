@@ -0,0 +1,62 @@
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.utils.translation import gettext as _
+
+from notes import models, services, sharding
+
+
+class Command(BaseCommand):
+    help = _(
+        'Move worktables with their notes and categories to the shards their ids hash to, e.g. after adding '
+        'a shard to NOTES_SHARDS. Only worktables whose shard changed are moved, one per transaction.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--shards',
+            nargs='+',
+            dest='shards',
+            help=_(
+                'Shards to place worktables on instead of NOTES_SHARDS, e.g. to empty a shard '
+                'before removing it from settings.'
+            ),
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            dest='dry_run',
+            help=_('Only count worktables to move per shard without moving them.'),
+        )
+
+    def handle(self, *args, **options):
+        shards = options['shards'] or settings.NOTES_SHARDS
+        if unknown := [shard for shard in shards if shard not in settings.DATABASES]:
+            raise CommandError(_(f'Shards must be databases of DATABASES setting, unknown: {", ".join(unknown)}.'))
+
+        moves = [
+            (pk, target)
+            for pk, shard in models.WorktableShard.objects.order_by('pk').values_list('pk', 'shard').iterator()
+            if (target := sharding.get_shard_for_id(pk, shards)) != shard
+        ]
+        if options['dry_run']:
+            counts: dict[str, int] = {}
+            for _pk, target in moves:
+                counts[target] = counts.get(target, 0) + 1
+            for shard in shards:
+                self.stdout.write(_(f'{shard}: {counts.get(shard, 0)} worktables to move in.'))
+            return
+
+        start = time.perf_counter()
+        moved = notes = 0
+        for pk, target in moves:
+            entry = models.WorktableShard.objects.get(pk=pk)
+            try:
+                notes += services.move_worktable(entry, target)
+            except services.WorktableChangedError as error:
+                self.stdout.write(self.style.WARNING(_(f'{error} It stays on {entry.shard}, run the command again.')))
+                continue
+            moved += 1
+        seconds = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(_(f'Moved {moved} worktables with {notes} notes in {seconds:.2f} s.')))
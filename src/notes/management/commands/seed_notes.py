@@ -0,0 +1,215 @@
+import csv
+import io
+import os
+import random
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.contrib.sessions.models import Session
+from django.core.management import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.utils import timezone
+from django.utils.translation import gettext as _
+
+from notes import models, seeding, services
+
+# COPY writes only the listed columns, and the database has no defaults of fields, so every field is listed.
+NOTE_COLUMNS = ('worktable', 'category', 'title', 'text', 'words', 'unique_words', 'version', 'created')
+
+
+def make_note(row: tuple) -> models.Note:
+    worktable_id, category_id, title, text, words, unique_words, version, created = row
+    return models.Note(
+        worktable_id=worktable_id,
+        category_id=category_id,
+        title=title,
+        text=text,
+        words=words,
+        unique_words=unique_words,
+        version=version,
+        created=created,
+    )
+
+
+class Command(BaseCommand):
+    help = _(
+        'Create users and anonymous sessions with worktables, categories and notes of synthetic texts. '
+        'The same arguments always generate the same data.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=10, help=_('Quantity of users with worktables.'))
+        parser.add_argument(
+            '--sessions', type=int, default=10, help=_('Quantity of anonymous sessions with worktables.')
+        )
+        parser.add_argument('--notes', type=int, default=100_000, help=_('Quantity of notes of all worktables.'))
+        parser.add_argument(
+            '--distribution',
+            choices=seeding.DISTRIBUTIONS,
+            default='zipf',
+            help=_('Distribution of notes between worktables.'),
+        )
+        parser.add_argument(
+            '--categories', type=int, default=20, help=_('Maximal quantity of categories of a worktable.')
+        )
+        parser.add_argument(
+            '--text-words', type=int, default=200, dest='text_words', help=_('Average quantity of words in a text.')
+        )
+        parser.add_argument(
+            '--days', type=int, default=365, help=_('Notes are created during this quantity of last days.')
+        )
+        parser.add_argument('--seed', type=int, default=0, help=_('Seed of the generated data.'))
+        parser.add_argument('--password', default='password', help=_('Password of the created users.'))
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=5_000,
+            dest='chunk_size',
+            help=_('Quantity of notes generated by a process and written in one transaction.'),
+        )
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=os.cpu_count(),
+            help=_('Quantity of processes generating texts, 1 generates them in this process.'),
+        )
+
+    def handle(self, *args, **options):
+        for name in ('users', 'sessions', 'notes', 'categories', 'text_words', 'days'):
+            if options[name] < 0:
+                raise CommandError(_(f'{name} must not be negative.'))
+        for name in ('chunk_size', 'processes'):
+            if options[name] < 1:
+                raise CommandError(_(f'{name} must be a positive integer.'))
+
+        seed = options['seed']
+        email_prefix = f'seed-{seed}-'
+        if get_user_model().objects.filter(email__startswith=email_prefix).exists():
+            raise CommandError(_(f'Data of seed {seed} already exists, use another --seed.'))
+
+        start = time.perf_counter()
+        with transaction.atomic():
+            worktables = self.create_worktables(options, email_prefix)
+            category_ids = self.create_categories(options, worktables)
+        self.stdout.write(_(f'Created {len(worktables)} worktables with categories.'), self.style.HTTP_INFO)
+
+        notes_start = time.perf_counter()
+        notes = self.create_notes(options, worktables, category_ids)
+        notes_seconds = time.perf_counter() - notes_start
+
+        seconds = time.perf_counter() - start
+        rows = len(worktables) * 2 + sum(map(len, category_ids)) + notes
+        self.stdout.write(_(f'notes: {notes} in {notes_seconds:.2f} s ({notes / notes_seconds:.0f} rows/s)'))
+        self.stdout.write(
+            self.style.SUCCESS(
+                _(f'Created {rows} rows in {seconds:.2f} s ({rows / seconds if seconds else 0:.0f} rows/s).')
+            )
+        )
+
+    def create_worktables(self, options, email_prefix: str) -> list[models.Worktable]:
+        rng = random.Random(f'{options["seed"]}:worktables')
+        user_model = get_user_model()
+        password = make_password(options['password'])
+        user_model.objects.bulk_create(
+            user_model(email=f'{email_prefix}{n}@seed.test', password=password) for n in range(options['users'])
+        )
+        users = user_model.objects.filter(email__startswith=email_prefix).order_by('pk')
+
+        session_store = import_module(settings.SESSION_ENGINE).SessionStore
+        session_data = session_store().encode({})
+        expire_date = timezone.now() + timedelta(seconds=settings.SESSION_COOKIE_AGE)
+        session_keys = [f'{rng.getrandbits(128):032x}' for _ in range(options['sessions'])]
+        Session.objects.bulk_create(
+            Session(session_key=session_key, session_data=session_data, expire_date=expire_date)
+            for session_key in session_keys
+        )
+
+        return services.bulk_create_worktables(
+            [models.Worktable(user=user) for user in users]
+            + [models.Worktable(session_key=session_key) for session_key in session_keys]
+        )
+
+    def create_categories(self, options, worktables: list[models.Worktable]) -> list[tuple[int, ...]]:
+        rng = random.Random(f'{options["seed"]}:categories')
+        shard_categories = defaultdict(list)
+        for worktable in worktables:
+            for n in range(rng.randint(0, options['categories'])):
+                category = models.Category(
+                    worktable=worktable, title=f'Category #{n}', color=f'#{rng.randrange(0x1000000):06X}'
+                )
+                shard_categories[worktable._state.db].append(category)
+
+        category_ids = {worktable.pk: [] for worktable in worktables}
+        for shard, categories in shard_categories.items():
+            models.Category.objects.using(shard).bulk_create(categories)
+            categories = models.Category.objects.using(shard).filter(worktable__in=worktables).order_by('pk')
+            for worktable_id, category_id in categories.values_list('worktable_id', 'pk'):
+                category_ids[worktable_id].append(category_id)
+        return [tuple(category_ids[worktable.pk]) for worktable in worktables]
+
+    def create_notes(self, options, worktables, category_ids) -> int:
+        now = timezone.now()
+        chunks = []
+        counts = seeding.distribute(options['notes'], len(worktables), options['distribution'])
+        for worktable_index, (worktable, count) in enumerate(zip(worktables, counts)):
+            for index, offset in enumerate(range(0, count, options['chunk_size'])):
+                chunks.append(
+                    seeding.NotesChunk(
+                        seed=options['seed'],
+                        worktable_index=worktable_index,
+                        index=index,
+                        worktable_id=worktable.pk,
+                        category_ids=category_ids[worktable_index],
+                        size=min(options['chunk_size'], count - offset),
+                        text_words=options['text_words'],
+                        days=options['days'],
+                        now=now,
+                    )
+                )
+
+        shards = [worktables[chunk.worktable_index]._state.db for chunk in chunks]
+        if options['processes'] == 1:
+            return sum(map(self.write_notes, shards, map(seeding.generate_notes, chunks)))
+
+        with ProcessPoolExecutor(options['processes'], initializer=seeding.init_worker) as pool:
+            # Chunks are written in order while the next ones are being generated.
+            return sum(map(self.write_notes, shards, pool.map(seeding.generate_notes, chunks)))
+
+    def write_notes(self, shard: str, rows: list[tuple]) -> int:
+        active_rows, archived_rows = [], []
+        for *row, is_archived, created in rows:
+            (archived_rows if is_archived else active_rows).append((*row, created))
+        with transaction.atomic(using=shard):
+            if connections[shard].vendor == 'postgresql':
+                self.copy_notes(shard, active_rows)
+            else:
+                services.bulk_create_notes(shard, map(make_note, active_rows))
+            # Archived notes share ids with notes, so they are created as notes and moved to the archive.
+            notes = services.bulk_create_notes(shard, map(make_note, archived_rows))
+            services.archive_notes(models.Note.objects.using(shard).filter(pk__in=[note.pk for note in notes]))
+        self.stdout.write(_(f'Wrote {len(rows)} notes.'), self.style.HTTP_INFO)
+        return len(rows)
+
+    def copy_notes(self, shard: str, rows: list[tuple]):
+        """Write notes by COPY, which is several times faster than INSERT on PostgreSQL."""
+        connection = connections[shard]
+        meta = models.Note._meta
+        # COPY bypasses fields, so texts are stored the way the text field stores them.
+        text_index, text_field = NOTE_COLUMNS.index('text'), meta.get_field('text')
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(
+            (*row[:text_index], text_field.get_db_prep_value(row[text_index], connection), *row[text_index + 1 :])
+            for row in rows
+        )
+        buffer.seek(0)
+        columns = ', '.join(connection.ops.quote_name(meta.get_field(name).column) for name in NOTE_COLUMNS)
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f'COPY {connection.ops.quote_name(meta.db_table)} ({columns}) FROM STDIN WITH (FORMAT csv)', buffer
+            )
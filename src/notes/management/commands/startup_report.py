@@ -0,0 +1,136 @@
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.utils.translation import gettext as _
+
+from core.settings.components.roles import PROCESS_ROLES
+
+STARTUP_CODE = 'import django; django.setup()'
+IMPORT_TIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$')
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def package(self) -> str:
+        return self.module.partition('.')[0]
+
+
+def parse_import_times(output: str) -> list[ImportTime]:
+    """Parse lines written to stderr by `python -X importtime`, the header and other lines are ignored."""
+    import_times = []
+    for line in output.splitlines():
+        if match := IMPORT_TIME_LINE.match(line):
+            self_us, cumulative_us, indent, module = match.groups()
+            import_times.append(ImportTime(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return import_times
+
+
+def get_package_times(import_times: list[ImportTime]) -> dict[str, int]:
+    """Return own import time of all modules of each top-level package in microseconds."""
+    package_times: dict[str, int] = defaultdict(int)
+    for import_time in import_times:
+        package_times[import_time.package] += import_time.self_us
+    return dict(package_times)
+
+
+def profile_startup(role: str, code: str = STARTUP_CODE) -> tuple[float, list[ImportTime]]:
+    """Run the code in a new interpreter in the process role, return its wall time in seconds and import times."""
+    env = {**os.environ, 'DJANGO_PROCESS_ROLE': role}
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=settings.BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    duration = time.perf_counter() - start
+    if result.returncode:
+        raise CommandError(_(f'Startup of the "{role}" role failed:\n{result.stderr[-2000:]}'))
+    return duration, parse_import_times(result.stderr)
+
+
+class Command(BaseCommand):
+    help = _(
+        'Profile imports made during startup of each process role with `python -X importtime` '
+        'and report the slowest packages and top-level imports.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--role',
+            action='append',
+            choices=PROCESS_ROLES,
+            dest='roles',
+            help=_('Process role to profile, may be repeated. All roles are profiled by default.'),
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=10,
+            dest='top',
+            help=_('Quantity of the slowest packages and imports in the report.'),
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=3,
+            dest='repeat',
+            help=_('Quantity of runs of each role, the fastest one is reported.'),
+        )
+
+    def handle(self, *args, **options):
+        if options['repeat'] < 1:
+            raise CommandError(_('Repeat must be a positive integer.'))
+
+        summary = []
+        for role in options['roles'] or PROCESS_ROLES:
+            duration, import_times = min(
+                (profile_startup(role) for _n in range(options['repeat'])), key=lambda run: run[0]
+            )
+            imports_duration = sum(import_time.self_us for import_time in import_times) / 1e6
+            summary.append((role, duration, imports_duration, len(import_times)))
+            self.report(role, duration, imports_duration, import_times, options['top'])
+
+        self.stdout.write(self.style.HTTP_INFO(_('Summary')))
+        for role, duration, imports_duration, modules in summary:
+            self.stdout.write(
+                _(f'  {role:<12} {duration * 1e3:8.1f} ms, {imports_duration * 1e3:8.1f} ms in {modules} imports')
+            )
+
+    def report(self, role: str, duration: float, imports_duration: float, import_times: list[ImportTime], top: int):
+        self.stdout.write(
+            self.style.HTTP_INFO(
+                _(
+                    f'Role "{role}": started in {duration * 1e3:.1f} ms, '
+                    f'{imports_duration * 1e3:.1f} ms spent in {len(import_times)} imports'
+                )
+            )
+        )
+
+        self.stdout.write(_('  Slowest packages (own time of their modules):'))
+        package_times = sorted(get_package_times(import_times).items(), key=lambda item: item[1], reverse=True)
+        for package, duration_us in package_times[:top]:
+            self.stdout.write(f'    {duration_us / 1e3:8.1f} ms  {package}')
+
+        self.stdout.write(_('  Slowest top-level imports (with their dependencies):'))
+        top_level = sorted(
+            (import_time for import_time in import_times if import_time.depth == 0),
+            key=lambda import_time: import_time.cumulative_us,
+            reverse=True,
+        )
+        for import_time in top_level[:top]:
+            self.stdout.write(f'    {import_time.cumulative_us / 1e3:8.1f} ms  {import_time.module}')
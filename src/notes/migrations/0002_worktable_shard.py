@@ -0,0 +1,74 @@
+# Generated by Django 4.2.11 on 2026-10-19 14:37
+
+from django.conf import settings
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, migrations, models
+import django.db.models.deletion
+
+
+def fill_directory(apps, schema_editor):
+    """Put existing worktables, which are all in the "default" database, into the directory."""
+    connection = schema_editor.connection
+    if connection.alias != DEFAULT_DB_ALIAS:
+        return
+    Worktable = apps.get_model('notes', 'Worktable')
+    WorktableShard = apps.get_model('notes', 'WorktableShard')
+    WorktableShard.objects.bulk_create(
+        (
+            WorktableShard(pk=pk, shard=DEFAULT_DB_ALIAS, user_id=user_id, session_key=session_key)
+            for pk, user_id, session_key in Worktable.objects.values_list('pk', 'user_id', 'session_key').iterator()
+        ),
+        batch_size=1_000,
+    )
+    # Ids of new worktables are allocated by the directory, so they must continue after the existing ones.
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(no_style(), [WorktableShard]):
+            cursor.execute(sql)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('notes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='worktable',
+            name='user',
+            field=models.OneToOneField(
+                blank=True,
+                db_constraint=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to=settings.AUTH_USER_MODEL,
+                verbose_name='user',
+            ),
+        ),
+        migrations.CreateModel(
+            name='WorktableShard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('shard', models.CharField(db_index=True, max_length=100, verbose_name='shard')),
+                (
+                    'session_key',
+                    models.CharField(blank=True, max_length=50, null=True, unique=True, verbose_name='session'),
+                ),
+                (
+                    'user',
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name='user',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'worktable shard',
+                'verbose_name_plural': 'worktable shards',
+            },
+        ),
+        migrations.RunPython(fill_directory, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,126 @@
+# Generated by Django 4.2.11 on 2026-10-19 14:48
+
+import zlib
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+CHUNK_SIZE = 2_000
+
+
+def move_archived_notes(apps, schema_editor):
+    """Move archived notes to the archive tier with the same ids, compressing texts like ArchivedNote does."""
+    database = schema_editor.connection.alias
+    Note = apps.get_model('notes', 'Note')
+    ArchivedNote = apps.get_model('notes', 'ArchivedNote')
+    notes = Note.objects.using(database).filter(is_archived=True).order_by('pk')
+    while chunk := list(notes[:CHUNK_SIZE]):
+        archived_notes = []
+        for note in chunk:
+            stored_text, is_text_compressed = None, False
+            if note.text is not None:
+                stored_text = note.text.encode()
+                compressed = zlib.compress(stored_text) if settings.NOTES_ARCHIVE_COMPRESSION else stored_text
+                if len(compressed) < len(stored_text):
+                    stored_text, is_text_compressed = compressed, True
+            archived_notes.append(
+                ArchivedNote(
+                    id=note.pk,
+                    worktable_id=note.worktable_id,
+                    category_id=note.category_id,
+                    title=note.title,
+                    stored_text=stored_text,
+                    is_text_compressed=is_text_compressed,
+                    words=note.words,
+                    unique_words=note.unique_words,
+                    created=note.created,
+                )
+            )
+        ArchivedNote.objects.using(database).bulk_create(archived_notes)
+        Note.objects.using(database).filter(pk__in=[note.pk for note in chunk]).delete()
+
+
+def restore_archived_notes(apps, schema_editor):
+    database = schema_editor.connection.alias
+    Note = apps.get_model('notes', 'Note')
+    ArchivedNote = apps.get_model('notes', 'ArchivedNote')
+    created = Note._meta.get_field('created')
+    created.auto_now_add = False
+    archived_notes = ArchivedNote.objects.using(database).order_by('pk')
+    while chunk := list(archived_notes[:CHUNK_SIZE]):
+        notes = []
+        for archived_note in chunk:
+            text = None
+            if archived_note.stored_text is not None:
+                text = bytes(archived_note.stored_text)
+                text = (zlib.decompress(text) if archived_note.is_text_compressed else text).decode()
+            notes.append(
+                Note(
+                    id=archived_note.pk,
+                    worktable_id=archived_note.worktable_id,
+                    category_id=archived_note.category_id,
+                    title=archived_note.title,
+                    text=text,
+                    words=archived_note.words,
+                    unique_words=archived_note.unique_words,
+                    is_archived=True,
+                    created=archived_note.created,
+                )
+            )
+        Note.objects.using(database).bulk_create(notes)
+        ArchivedNote.objects.using(database).filter(pk__in=[note.pk for note in chunk]).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('notes', '0002_worktable_shard'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedNote',
+            fields=[
+                ('title', models.CharField(max_length=50, verbose_name='title')),
+                ('words', models.PositiveIntegerField(default=0, verbose_name='Quantity of words in text')),
+                (
+                    'unique_words',
+                    models.PositiveIntegerField(default=0, verbose_name='Quantity of unique words in text'),
+                ),
+                ('id', models.BigIntegerField(primary_key=True, serialize=False, verbose_name='id')),
+                ('created', models.DateTimeField(verbose_name='created')),
+                ('stored_text', models.BinaryField(blank=True, null=True, verbose_name='stored text')),
+                ('is_text_compressed', models.BooleanField(default=False, verbose_name='text is compressed')),
+                (
+                    'category',
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to='notes.category',
+                        verbose_name='category',
+                    ),
+                ),
+                (
+                    'worktable',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to='notes.worktable', verbose_name='worktable'
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'archived note',
+                'verbose_name_plural': 'archived notes',
+                'ordering': ['-created'],
+                'abstract': False,
+                'indexes': [
+                    models.Index(fields=['worktable', '-created'], name='notes_archived_worktable_idx'),
+                ],
+            },
+        ),
+        migrations.RunPython(move_archived_notes, restore_archived_notes),
+        migrations.RemoveField(
+            model_name='note',
+            name='is_archived',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.11 on 2026-10-19 15:01
+
+from django.db import migrations
+import notes.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('notes', '0003_archived_note'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='note',
+            name='text',
+            field=notes.fields.CompressedTextField(blank=True, null=True, verbose_name='text'),
+        ),
+    ]
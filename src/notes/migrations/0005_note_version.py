@@ -0,0 +1,22 @@
+# Generated by Django 4.2.11 on 2026-10-19 15:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('notes', '0004_compressed_note_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivednote',
+            name='version',
+            field=models.PositiveIntegerField(default=0, verbose_name='version'),
+        ),
+        migrations.AddField(
+            model_name='note',
+            name='version',
+            field=models.PositiveIntegerField(default=0, verbose_name='version'),
+        ),
+    ]
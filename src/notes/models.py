@@ -1,11 +1,19 @@
+import zlib
+
 from colorfield.fields import ColorField
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import DEFAULT_DB_ALIAS, models, transaction
 from django.utils.translation import gettext as _
 
+from notes import sharding
+from notes.fields import CompressedTextField
+
+# Fields copied between a note and its archived copy, except for the id which they share.
+NOTE_TIER_FIELDS = ('worktable_id', 'category_id', 'title', 'text', 'words', 'unique_words', 'version', 'created')
 
-class Note(models.Model):
+
+class BaseNote(models.Model):
     worktable = models.ForeignKey(
         verbose_name=_('worktable'),
         to='Worktable',
@@ -18,7 +26,7 @@ class Note(models.Model):
         verbose_name=_('title'),
         max_length=50,
     )
-    text = models.TextField(
+    text = CompressedTextField(
         verbose_name=_('text'),
         null=True,
         blank=True,
@@ -31,24 +39,97 @@ class Note(models.Model):
         verbose_name=_('Quantity of unique words in text'),
         default=0,
     )
-    is_archived = models.BooleanField(
-        verbose_name=_('archived'),
-        default=False,
+    # Incremented by every update, patches of the text are applied only to the version they were made against.
+    version = models.PositiveIntegerField(
+        verbose_name=_('version'),
+        default=0,
     )
     created = models.DateTimeField(
         verbose_name=_('created'),
         auto_now_add=True,
     )
 
+    # Serialized notes of both tiers are keyed by "note", and their urls are urls of notes.
+    serialization_key = 'note'
+
     class Meta:
-        verbose_name = _('note')
-        verbose_name_plural = _('notes')
+        abstract = True
         ordering = ['-created']
 
     def __str__(self):
         return self.title
 
 
+class Note(BaseNote):
+    """An active note. Archived notes are moved to the ArchivedNote table, see services.archive_note()."""
+
+    is_archived = False
+
+    class Meta(BaseNote.Meta):
+        verbose_name = _('note')
+        verbose_name_plural = _('notes')
+
+
+class ArchivedNote(BaseNote):
+    """
+    A note in the archive tier. It keeps the id of the note, so urls of the note stay valid, and its text
+    is compressed when NOTES_ARCHIVE_COMPRESSION is on and compression makes it smaller. Archived notes
+    don't bloat the table and indexes of active notes, which most pages list.
+    """
+
+    id = models.BigIntegerField(
+        verbose_name=_('id'),
+        primary_key=True,
+    )
+    # Notes are archived with the date they were created at.
+    created = models.DateTimeField(
+        verbose_name=_('created'),
+    )
+    stored_text = models.BinaryField(
+        verbose_name=_('stored text'),
+        null=True,
+        blank=True,
+    )
+    is_text_compressed = models.BooleanField(
+        verbose_name=_('text is compressed'),
+        default=False,
+    )
+
+    is_archived = True
+
+    class Meta(BaseNote.Meta):
+        verbose_name = _('archived note')
+        verbose_name_plural = _('archived notes')
+        # The archive of a worktable is listed from the newest notes, without sorting all of them.
+        indexes = [models.Index(fields=['worktable', '-created'], name='notes_archived_worktable_idx')]
+
+    @property
+    def text(self) -> str | None:
+        if self.stored_text is None:
+            return None
+        data = bytes(self.stored_text)
+        return (zlib.decompress(data) if self.is_text_compressed else data).decode()
+
+    @text.setter
+    def text(self, value: str | None):
+        self.stored_text, self.is_text_compressed = None, False
+        if value is None:
+            return
+        data = value.encode()
+        if settings.NOTES_ARCHIVE_COMPRESSION:
+            compressed = zlib.compress(data)
+            if len(compressed) < len(data):
+                data, self.is_text_compressed = compressed, True
+        self.stored_text = data
+
+    @classmethod
+    def from_note(cls, note: Note) -> 'ArchivedNote':
+        return cls(id=note.pk, **{name: getattr(note, name) for name in NOTE_TIER_FIELDS})
+
+    def to_note(self) -> Note:
+        return Note(id=self.pk, **{name: getattr(self, name) for name in NOTE_TIER_FIELDS})
+
+
 class Category(models.Model):
     worktable = models.ForeignKey(
         verbose_name=_('worktable'),
@@ -72,6 +153,52 @@ class Category(models.Model):
         return self.title
 
 
+class WorktableShardManager(models.Manager):
+    def allocate(self, user_id: int | None = None, session_key: str | None = None) -> 'WorktableShard':
+        """Allocate an id and a shard for a new worktable."""
+        entry = self.create(user_id=user_id, session_key=session_key)
+        entry.shard = sharding.get_shard_for_id(entry.pk)
+        entry.save(update_fields=['shard'])
+        return entry
+
+    def get_shard(self, worktable_id: int) -> str:
+        """Return the shard of a worktable. Worktables missing in the directory are in the "default" database."""
+        return self.filter(pk=worktable_id).values_list('shard', flat=True).first() or DEFAULT_DB_ALIAS
+
+
+class WorktableShard(models.Model):
+    """An entry of the directory of worktables in the "default" database, see notes.sharding."""
+
+    shard = models.CharField(
+        verbose_name=_('shard'),
+        max_length=100,
+        db_index=True,
+    )
+    user = models.OneToOneField(
+        verbose_name=_('user'),
+        to=settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+    )
+    session_key = models.CharField(
+        verbose_name=_('session'),
+        max_length=50,
+        unique=True,
+        blank=True,
+        null=True,
+    )
+
+    objects = WorktableShardManager()
+
+    class Meta:
+        verbose_name = _('worktable shard')
+        verbose_name_plural = _('worktable shards')
+
+    def __str__(self):
+        return f'{self.pk}: {self.shard}'
+
+
 class Worktable(models.Model):
     user = models.OneToOneField(
         verbose_name=_('user'),
@@ -79,6 +206,8 @@ class Worktable(models.Model):
         on_delete=models.CASCADE,
         blank=True,
         null=True,
+        # Users are stored in the "default" database, worktables may be on other shards.
+        db_constraint=False,
     )
     session_key = models.CharField(
         verbose_name=_('session'),
@@ -101,6 +230,25 @@ class Worktable(models.Model):
         if (self.user and self.session_key) or (not self.user and not self.session_key):
             raise ValidationError(self.error_messages['invalid_user_and_session'], 'invalid_user_and_session')
 
+    def save(self, *args, **kwargs):
+        """
+        A new worktable gets its id and shard from the directory, which is also kept in sync with the user
+        and the session of the worktable, see notes.sharding.
+        """
+        with transaction.atomic(using=DEFAULT_DB_ALIAS):
+            if self.pk is None:
+                entry = WorktableShard.objects.allocate(user_id=self.user_id, session_key=self.session_key)
+                self.pk = entry.pk
+                kwargs.update(using=entry.shard, force_insert=True)
+            elif kwargs.get('update_fields') is None or {'user', 'session_key'} & set(kwargs['update_fields']):
+                WorktableShard.objects.filter(pk=self.pk).update(user_id=self.user_id, session_key=self.session_key)
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic(using=DEFAULT_DB_ALIAS):
+            WorktableShard.objects.filter(pk=self.pk).delete()
+            return super().delete(*args, **kwargs)
+
     def __str__(self):
         if self.user:
             return self.user.email
@@ -108,7 +256,16 @@ class Worktable(models.Model):
             return str(self.session_key)
 
     def get_all_categories(self):
+        if self.pk is None:
+            return Category.objects.none()
         return self.category_set.all().order_by('title')
 
     def get_all_notes(self):
+        if self.pk is None:
+            return Note.objects.none()
         return self.note_set.all()
+
+    def get_all_archived_notes(self):
+        if self.pk is None:
+            return ArchivedNote.objects.none()
+        return self.archivednote_set.all()
@@ -0,0 +1,50 @@
+from django.db import DEFAULT_DB_ALIAS
+
+from notes import models, sharding
+
+
+class ShardRouter:
+    """
+    Route worktables, notes and categories to the shard of the worktable of the instance in hints,
+    which Django passes for related managers and saving, see notes.sharding. The "default" shard and
+    queries without such an instance are left to the next router, so that they can use replicas.
+    Databases other than "default" and its replicas are shards, they get the tables of "default" except for
+    the directory. Users stay empty there, but the initial migration of notes references them until
+    0002_worktable_shard drops the constraint.
+    """
+
+    def get_shard(self, model, hints) -> str | None:
+        instance = hints.get('instance')
+        if instance is None or not sharding.is_sharded(model) or not sharding.is_sharded(instance):
+            return None
+
+        if instance._state.db is not None:
+            shard = sharding.get_shard_of_database(instance._state.db)
+        else:
+            worktable_id = instance.pk if isinstance(instance, models.Worktable) else instance.worktable_id
+            if worktable_id is None:
+                return None
+            shard = models.WorktableShard.objects.get_shard(worktable_id)
+        return None if shard == DEFAULT_DB_ALIAS else shard
+
+    def db_for_read(self, model, **hints) -> str | None:
+        return self.get_shard(model, hints)
+
+    def db_for_write(self, model, **hints) -> str | None:
+        return self.get_shard(model, hints)
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool | None:
+        if sharding.is_sharded(obj1) != sharding.is_sharded(obj2):
+            # Users and the rest of tables of the "default" database are referenced from every shard.
+            return True
+        if sharding.is_sharded(obj1):
+            return sharding.get_shard_of_database(obj1._state.db) == sharding.get_shard_of_database(obj2._state.db)
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> bool | None:
+        if sharding.get_shard_of_database(db) == DEFAULT_DB_ALIAS:
+            return None
+        # Data migrations without a model skip shards themselves if they need the directory.
+        if f'{app_label}.{model_name}' in sharding.DIRECTORY_MODELS:
+            return False
+        return None
@@ -0,0 +1,112 @@
+"""
+Deterministic generation of synthetic notes for the seed_notes command and benchmarks.
+
+Texts are built of a Zipf-distributed vocabulary of pseudo-words, so they have common and rare words
+as natural texts do. Notes are generated in chunks which only depend on the seed and the position
+of the chunk, so chunks are generated by a process pool in any order with the same result.
+"""
+
+import functools
+import itertools
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+SYLLABLES = ('ka', 'lo', 'mi', 'ne', 'ru', 'sa', 'to', 'vi', 'de', 'an', 'or', 'el', 'is', 'um', 'pro', 'st')
+VOCABULARY_SIZE = 5_000
+DISTRIBUTIONS = ('uniform', 'zipf')
+
+
+@functools.cache
+def get_vocabulary(seed: int) -> tuple[list[str], list[float]]:
+    """Return words and their cumulative weights for random.choices."""
+    rng = random.Random(f'{seed}:vocabulary')
+    words = [''.join(rng.choices(SYLLABLES, k=rng.randint(1, 4))) for _ in range(VOCABULARY_SIZE)]
+    cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, VOCABULARY_SIZE + 1)))
+    return words, cum_weights
+
+
+def make_text(rng: random.Random, seed: int, words: int) -> str:
+    vocabulary, cum_weights = get_vocabulary(seed)
+    text_words = rng.choices(vocabulary, cum_weights=cum_weights, k=words)
+    sentences, start = [], 0
+    while start < words:
+        end = start + rng.randint(5, 20)
+        sentences.append(' '.join(text_words[start:end]).capitalize() + '.')
+        start = end
+    return ' '.join(sentences)
+
+
+def make_title(rng: random.Random, seed: int) -> str:
+    vocabulary, cum_weights = get_vocabulary(seed)
+    return ' '.join(rng.choices(vocabulary, cum_weights=cum_weights, k=rng.randint(1, 4))).capitalize()[:50]
+
+
+def distribute(total: int, parts: int, distribution: str) -> list[int]:
+    """Split total into parts: equally or by Zipf's law, so that a few parts are much larger than the rest."""
+    if parts < 1:
+        return []
+    if distribution == 'uniform':
+        weights = [1.0] * parts
+    elif distribution == 'zipf':
+        weights = [1 / rank for rank in range(1, parts + 1)]
+    else:
+        raise ValueError(f'Unknown distribution "{distribution}", expected one of {DISTRIBUTIONS}.')
+    weights_sum = sum(weights)
+    counts = [int(total * weight / weights_sum) for weight in weights]
+    for n in range(total - sum(counts)):
+        counts[n % parts] += 1
+    return counts
+
+
+@dataclass(frozen=True)
+class NotesChunk:
+    seed: int
+    worktable_index: int
+    index: int
+    worktable_id: int
+    category_ids: tuple[int, ...]
+    size: int
+    text_words: int
+    days: int
+    now: datetime
+
+
+def init_worker():
+    """Initializer of pool processes started without fork, which don't inherit the configured Django."""
+    from django.apps import apps
+
+    if not apps.ready:
+        import django
+
+        django.setup()
+
+
+def generate_notes(chunk: NotesChunk) -> list[tuple]:
+    """
+    Return rows of notes: worktable_id, category_id, title, text, words, unique_words, version, is_archived,
+    created.
+    Word statistics are counted as the pre_save signal of notes does.
+    """
+    from notes.services import count_words_in_text
+
+    rng = random.Random(f'{chunk.seed}:notes:{chunk.worktable_index}:{chunk.index}')
+    rows = []
+    for _ in range(chunk.size):
+        text = make_text(rng, chunk.seed, rng.randint(chunk.text_words // 2, chunk.text_words * 3 // 2))
+        # A part of notes is left without a category as users do.
+        category_id = rng.choice(chunk.category_ids) if chunk.category_ids and rng.random() < 0.8 else None
+        rows.append(
+            (
+                chunk.worktable_id,
+                category_id,
+                make_title(rng, chunk.seed),
+                text,
+                count_words_in_text(text),
+                count_words_in_text(text, unique=True),
+                0,
+                rng.random() < 0.1,
+                chunk.now - timedelta(seconds=rng.random() * chunk.days * 86_400),
+            )
+        )
+    return rows
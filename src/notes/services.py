@@ -1,42 +1,520 @@
+import heapq
+import itertools
 import re
-from collections import Counter
-from typing import Type
+import time
+from collections import Counter, defaultdict
+from operator import attrgetter, itemgetter
+from typing import Callable, Iterable, Iterator, Type
 
-from django.db.models import QuerySet, Model
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, router, transaction
+from django.db.models import Count, Exists, Model, OuterRef, QuerySet, Sum, Value
 from django.urls import reverse
+from django.utils import timezone
 
-from notes import models
+from core import metrics
+from notes import models, sharding
 
+CATEGORY_NOTES_CHUNK_SIZE = 5_000
+MOVE_NOTES_CHUNK_SIZE = 2_000
+ARCHIVE_NOTES_CHUNK_SIZE = 2_000
+WORKTABLE_VERSION_CACHE_KEY = 'worktable:{}:version'
+NOTE_URLS = ('update', 'retrieve', 'archive', 'delete')
+URL_ID_PLACEHOLDER = '__id__'
+
+WORD_COUNT_DURATION = metrics.REGISTRY.histogram(
+    'online_notes_word_count_duration_seconds',
+    'Duration of counting words in texts of notes.',
+    ('unique',),
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5),
+)
+
+
+def get_worktable(request) -> models.Worktable:
+    """
+    Return a worktable of the request. An anonymous visitor who hasn't written anything yet gets
+    an unsaved empty worktable, so reading pages doesn't write to the database.
+    The worktable is looked up once per request.
+    """
+    if (worktable := getattr(request, '_worktable', None)) is not None:
+        return worktable
 
-def get_worktable(request):
     if request.user.is_authenticated:
-        return request.user.worktable
+        worktable = find_worktable(user=request.user) or models.Worktable(user=request.user)
     else:
-        return models.Worktable.objects.get(session_key=request.session.session_key)
+        worktable = None
+        if session_key := request.session.session_key:
+            worktable = find_worktable(session_key=session_key)
+        worktable = worktable or models.Worktable(session_key=session_key)
 
+    request._worktable = worktable
+    return worktable
 
-def serialize_filter_qs(qs: QuerySet) -> list[dict]:
-    serialized_data = []
-    for note in qs:
-        note_data = serialize_model(
-            note,
-            ('id', 'title', 'is_archived'),
-            ('update', 'retrieve', 'archive', 'delete'),
+
+def get_or_create_worktable(request) -> models.Worktable:
+    """Return a saved worktable of the request. Session and worktable are created on the first write."""
+    worktable = get_worktable(request)
+    if worktable.pk is not None:
+        return worktable
+
+    if not request.user.is_authenticated:
+        if request.session.session_key is None:
+            request.session.save()
+        worktable.session_key = request.session.session_key
+    try:
+        worktable.save()
+    except IntegrityError:
+        # A concurrent request of the same client has just created the worktable.
+        worktable = find_worktable(user=worktable.user_id, session_key=worktable.session_key)
+        if worktable is None:
+            raise
+    request._worktable = worktable
+    return worktable
+
+
+def find_worktable(**lookup) -> models.Worktable | None:
+    """
+    Return a worktable by its user or session_key, or None. The worktable is found through the directory
+    of shards, unless NOTES_SHARDS has the "default" database only.
+    """
+    if settings.NOTES_SHARDS == [DEFAULT_DB_ALIAS]:
+        return models.Worktable.objects.filter(**lookup).first()
+
+    entry = models.WorktableShard.objects.filter(**lookup).values_list('pk', 'shard').first()
+    if entry is None:
+        return None
+    pk, shard = entry
+    worktables = models.Worktable.objects.filter(pk=pk)
+    # The "default" shard is left to routers, so that reads can go to its replicas.
+    if shard != DEFAULT_DB_ALIAS:
+        worktables = worktables.using(shard)
+    # The default ordering by user joins users, which shards don't have.
+    return worktables.order_by('pk').first()
+
+
+def bulk_create_worktables(worktables: list[models.Worktable]) -> list[models.Worktable]:
+    """Create worktables on their shards like Worktable.save(), but by a few queries per shard."""
+    with transaction.atomic(using=DEFAULT_DB_ALIAS):
+        entries = models.WorktableShard.objects.bulk_create(
+            models.WorktableShard(user_id=worktable.user_id, session_key=worktable.session_key)
+            for worktable in worktables
+        )
+        shards = defaultdict(list)
+        for entry, worktable in zip(entries, worktables):
+            entry.shard = sharding.get_shard_for_id(entry.pk)
+            worktable.pk = entry.pk
+            shards[entry.shard].append(worktable)
+        models.WorktableShard.objects.bulk_update(entries, ['shard'], batch_size=1_000)
+        for shard, shard_worktables in shards.items():
+            models.Worktable.objects.using(shard).bulk_create(shard_worktables)
+    return worktables
+
+
+def get_worktable_version(worktable: models.Worktable) -> int:
+    """
+    Return a version of worktable categories to key cached template fragments. A version is a timestamp,
+    so a version evicted from the cache never matches fragments cached before.
+    """
+    if worktable.pk is None:
+        return 0
+    key = WORKTABLE_VERSION_CACHE_KEY.format(worktable.pk)
+    version = cache.get(key)
+    if version is not None:
+        metrics.CACHE_REQUESTS.inc(cache='worktable_version', result='hit')
+        return version
+    metrics.CACHE_REQUESTS.inc(cache='worktable_version', result='miss')
+    return cache.get_or_set(key, time.time_ns, timeout=None)
+
+
+def bump_worktable_version(worktable_id: int):
+    cache.set(WORKTABLE_VERSION_CACHE_KEY.format(worktable_id), time.time_ns(), timeout=None)
+
+
+def delete_category(
+    category: models.Category,
+    move_to: models.Category | None = None,
+    chunk_size: int = CATEGORY_NOTES_CHUNK_SIZE,
+) -> int:
+    """
+    Delete a category without loading its notes into memory. Notes of the category are detached,
+    or moved to the move_to category, by chunked UPDATE queries and then the category is deleted.
+    Return quantity of updated notes.
+    """
+    if move_to is not None and move_to.worktable_id != category.worktable_id:
+        raise ValueError('Category "move_to" must belong to the same worktable.')
+
+    database = router.db_for_write(models.Category, instance=category)
+    updated = 0
+    for model in (models.Note, models.ArchivedNote):
+        notes = model.objects.using(database).filter(category=category).order_by('pk')
+        last_pk = 0
+        while True:
+            chunk = notes.filter(pk__gt=last_pk)
+            upper_pk = chunk.values_list('pk', flat=True)[chunk_size - 1 : chunk_size].first()
+            if upper_pk is not None:
+                chunk = chunk.filter(pk__lte=upper_pk)
+            with transaction.atomic(using=database):
+                updated += chunk.update(category=move_to)
+            if upper_pk is None:
+                break
+            last_pk = upper_pk
+
+    models.Category.objects.using(database).filter(pk=category.pk).delete()
+    return updated
+
+
+def get_stale_worktables() -> QuerySet:
+    """
+    Return directory entries of anonymous worktables whose sessions are expired or don't exist anymore.
+    Sessions are checked by a single anti-join with the directory, which is in the same database.
+    """
+    alive_sessions = Session.objects.filter(session_key=OuterRef('session_key'), expire_date__gt=timezone.now())
+    return models.WorktableShard.objects.filter(user__isnull=True, session_key__isnull=False).filter(
+        ~Exists(alive_sessions)
+    )
+
+
+def delete_worktables(ids) -> dict[str, int]:
+    """
+    Delete worktables by ids together with their notes of both tiers and categories on their shards and with
+    their entries in the directory. Dependent rows are deleted first by bulk queries, so Django's collector
+    doesn't load them. Return quantity of deleted rows per model.
+    """
+    ids = list(ids)
+    shards = defaultdict(list)
+    for pk, shard in models.WorktableShard.objects.filter(pk__in=ids).values_list('pk', 'shard'):
+        shards[shard].append(pk)
+
+    deleted: dict[str, int] = {}
+    with transaction.atomic(using=DEFAULT_DB_ALIAS):
+        for shard, shard_ids in shards.items():
+            for label, quantity in delete_worktables_of_shard(shard, shard_ids).items():
+                deleted[label] = deleted.get(label, 0) + quantity
+        models.WorktableShard.objects.filter(pk__in=ids).delete()
+    return deleted
+
+
+def delete_worktables_of_shard(shard: str, ids: list[int]) -> dict[str, int]:
+    """
+    Delete worktables with their notes and categories on a shard by one DELETE query per table.
+    Rows which reference each other are deleted in order, so Django's collector isn't needed; it would load
+    every category to send delete signals, which only bump versions of the deleted worktables.
+    """
+    deleted: dict[str, int] = {}
+    for qs in (
+        models.Note.objects.using(shard).filter(worktable_id__in=ids),
+        models.ArchivedNote.objects.using(shard).filter(worktable_id__in=ids),
+        models.Category.objects.using(shard).filter(worktable_id__in=ids),
+        models.Worktable.objects.using(shard).filter(id__in=ids),
+    ):
+        deleted[qs.model._meta.label] = qs._raw_delete(shard)
+    return deleted
+
+
+def bulk_create_notes(database: str, notes: Iterable[models.Note], batch_size: int | None = None) -> list[models.Note]:
+    """
+    Create notes by bulk_create with their given creation dates, e.g. of copied or generated notes.
+    auto_now_add replaces the dates on insert, so they are written back by bulk_update in the same transaction.
+    """
+    notes = list(notes)
+    created = [note.created for note in notes]
+    with transaction.atomic(using=database):
+        models.Note.objects.using(database).bulk_create(notes, batch_size=batch_size)
+        for note, note_created in zip(notes, created):
+            note.created = note_created
+        models.Note.objects.using(database).bulk_update(notes, ['created'], batch_size=batch_size)
+    return notes
+
+
+class WorktableChangedError(Exception):
+    """A worktable was changed on its shard while it was being moved to another one."""
+
+
+def get_worktable_contents(database: str, worktable_id: int) -> tuple:
+    """Return quantities of categories and notes of both tiers of a worktable and sums of versions of the notes."""
+    contents = (models.Category.objects.using(database).filter(worktable_id=worktable_id).count(),)
+    for model in (models.Note, models.ArchivedNote):
+        aggregate = (
+            model.objects.using(database).filter(worktable_id=worktable_id).aggregate(Count('pk'), Sum('version'))
         )
-        note_data['note']['created'] = note.created.strftime('%d.%m.%Y')
+        contents += (aggregate['pk__count'], aggregate['version__sum'] or 0)
+    return contents
+
+
+def move_worktable(entry: models.WorktableShard, target: str, chunk_size: int = MOVE_NOTES_CHUNK_SIZE) -> int:
+    """
+    Copy a worktable with its categories and notes of both tiers to the target shard, point its directory
+    entry there and delete it from the old shard. Categories and notes get new ids on the target shard.
+    Return quantity of moved notes.
+
+    The worktable and its copied rows are locked on the old shard (on databases with row locks), so writes
+    to it wait for the move and then fail instead of being lost. Before the worktable is deleted
+    from the old shard, its contents are compared with the copied ones; if anything was changed meanwhile,
+    WorktableChangedError is raised and nothing is moved.
+    """
+    source = entry.shard
+    with (
+        transaction.atomic(using=DEFAULT_DB_ALIAS),
+        transaction.atomic(using=source),
+        transaction.atomic(using=target),
+    ):
+        # Inserts of notes and categories of the worktable wait for this lock by their foreign keys.
+        worktable = models.Worktable.objects.using(source).select_for_update().get(pk=entry.pk)
+        worktable.save(using=target, force_insert=True)
+
+        categories = list(
+            models.Category.objects.using(source).filter(worktable=worktable).select_for_update().order_by('pk')
+        )
+        copies = models.Category.objects.using(target).bulk_create(
+            models.Category(worktable_id=worktable.pk, title=category.title, color=category.color)
+            for category in categories
+        )
+        category_ids = {category.pk: copy.pk for category, copy in zip(categories, copies)}
+
+        moved = 0
+        copied_contents = (len(categories),)
+        for model in (models.Note, models.ArchivedNote):
+            notes = model.objects.using(source).filter(worktable=worktable).select_for_update().order_by('pk')
+            last_pk, quantity, versions = 0, 0, 0
+            while chunk := list(notes.filter(pk__gt=last_pk)[:chunk_size]):
+                last_pk = chunk[-1].pk
+                copies = [note.to_note() if note.is_archived else note for note in chunk]
+                for copy in copies:
+                    copy.pk = None
+                    copy.category_id = category_ids.get(copy.category_id)
+                # Archived notes share ids with notes, so new ids of archived notes are allocated
+                # by inserting them as notes.
+                bulk_create_notes(target, copies)
+                if model is models.ArchivedNote:
+                    archive_notes(models.Note.objects.using(target).filter(pk__in=[copy.pk for copy in copies]))
+                quantity += len(chunk)
+                versions += sum(note.version for note in chunk)
+            copied_contents += (quantity, versions)
+            moved += quantity
+
+        if get_worktable_contents(source, worktable.pk) != copied_contents:
+            raise WorktableChangedError(f'Worktable {worktable.pk} was changed while it was being moved.')
+        delete_worktables_of_shard(source, [worktable.pk])
+        models.WorktableShard.objects.filter(pk=entry.pk).update(shard=target)
+
+    entry.shard = target
+    bump_worktable_version(entry.pk)
+    return moved
+
+
+def get_note(worktable: models.Worktable, id) -> models.Note | models.ArchivedNote:
+    """
+    Return a note of the worktable by id from the active tier or, if it isn't there, from the archive.
+    Raise Note.DoesNotExist if neither tier has it.
+    """
+    try:
+        return worktable.get_all_notes().get(id=id)
+    except models.Note.DoesNotExist:
+        if (archived_note := worktable.get_all_archived_notes().filter(id=id).first()) is None:
+            raise
+        return archived_note
+
+
+def archive_note(note: models.Note) -> models.ArchivedNote:
+    """Move a note to the archive tier. The archived note keeps the id of the note."""
+    database = router.db_for_write(models.Note, instance=note)
+    archived_note = models.ArchivedNote.from_note(note)
+    with transaction.atomic(using=database):
+        archived_note.save(using=database, force_insert=True)
+        models.Note.objects.using(database).filter(pk=note.pk).delete()
+    return archived_note
+
+
+def unarchive_note(archived_note: models.ArchivedNote) -> models.Note:
+    """Move an archived note back to the active tier with its id and creation date."""
+    database = router.db_for_write(models.ArchivedNote, instance=archived_note)
+    note = archived_note.to_note()
+    with transaction.atomic(using=database):
+        note.save(using=database, force_insert=True)
+        # auto_now_add replaces the creation date on insert.
+        models.Note.objects.using(database).filter(pk=note.pk).update(created=archived_note.created)
+        models.ArchivedNote.objects.using(database).filter(pk=archived_note.pk).delete()
+    note.created = archived_note.created
+    return note
+
+
+def archive_notes(notes: QuerySet, chunk_size: int = ARCHIVE_NOTES_CHUNK_SIZE) -> int:
+    """
+    Move notes of a queryset to the archive tier by chunks, a transaction per chunk, e.g. for seeding or
+    an archiving policy. Return quantity of archived notes.
+    """
+    database = notes.db
+    notes = notes.order_by('pk')
+    archived, last_pk = 0, 0
+    while chunk := list(notes.filter(pk__gt=last_pk)[:chunk_size]):
+        last_pk = chunk[-1].pk
+        with transaction.atomic(using=database):
+            models.ArchivedNote.objects.using(database).bulk_create(map(models.ArchivedNote.from_note, chunk))
+            models.Note.objects.using(database).filter(pk__in=[note.pk for note in chunk]).delete()
+        archived += len(chunk)
+    return archived
+
+
+class NoteVersionConflict(Exception):
+    """A note was changed since the version which a patch of its text was made against."""
+
+    def __init__(self, version: int):
+        super().__init__(f'Note was changed, its current version is {version}.')
+        self.version = version
+
+
+def apply_text_patch(text: str, operations: list) -> str:
+    """
+    Return the text with operations applied in order. An operation {"offset", "length", "insert"} replaces
+    `length` characters at `offset` of the text, as previous operations left it, by `insert`.
+    Offsets and lengths count Unicode code points. Raise ValueError if an operation doesn't fit the text.
+    """
+    if not isinstance(operations, list):
+        raise ValueError('Operations must be a list.')
+    for operation in operations:
+        if not isinstance(operation, dict):
+            raise ValueError('Operation must be an object with "offset", "length" and "insert".')
+        offset, length, insert = operation.get('offset'), operation.get('length', 0), operation.get('insert', '')
+        if not all(
+            isinstance(number, int) and not isinstance(number, bool) and number >= 0 for number in (offset, length)
+        ):
+            raise ValueError('"offset" and "length" of an operation must be non-negative integers.')
+        if not isinstance(insert, str):
+            raise ValueError('"insert" of an operation must be a string.')
+        if offset + length > len(text):
+            raise ValueError(f'Operation at {offset} of length {length} is out of the text of length {len(text)}.')
+        text = f'{text[:offset]}{insert}{text[offset + length :]}'
+    return text
+
+
+def get_note_version(model: type[models.Note | models.ArchivedNote], database: str, pk: int) -> int:
+    """
+    Return the current version of a note after its conditional update didn't match. Raise DoesNotExist
+    of the model if the note was archived, restored or deleted meanwhile.
+    """
+    version = model.objects.using(database).filter(pk=pk).values_list('version', flat=True).first()
+    if version is None:
+        raise model.DoesNotExist(f'{model._meta.object_name} {pk} was moved or deleted.')
+    return version
+
+
+def patch_note_text(note: models.Note | models.ArchivedNote, version: int, operations: list):
+    """
+    Apply operations made against the version of a note to its text and save it as the next version.
+    Raise NoteVersionConflict if the note was changed since that version, even concurrently,
+    DoesNotExist of its model if it was moved to another tier or deleted, and ValueError
+    if operations don't fit the text.
+    """
+    if note.version != version:
+        raise NoteVersionConflict(note.version)
+    text = apply_text_patch(note.text or '', operations)
+    note.text = text
+    note.words = count_words_in_text(text)
+    note.unique_words = count_words_in_text(text, unique=True)
+
+    model = type(note)
+    database = router.db_for_write(model, instance=note)
+    text_fields = ('stored_text', 'is_text_compressed') if note.is_archived else ('text',)
+    # The update is conditional on the version, so only one of concurrent patches of a version is applied.
+    updated = (
+        model.objects.using(database)
+        .filter(pk=note.pk, version=version)
+        .update(
+            version=version + 1,
+            words=note.words,
+            unique_words=note.unique_words,
+            **{name: getattr(note, name) for name in text_fields},
+        )
+    )
+    if not updated:
+        raise NoteVersionConflict(get_note_version(model, database, note.pk))
+    note.version = version + 1
+
+
+def merge_note_tiers(tiers: list[Iterable], key: Callable = attrgetter('created', 'id')) -> Iterator:
+    """
+    Merge notes of tiers, each ordered by the creation date and id descending, into one stream ordered the same way.
+    Only the current notes of the tiers are compared, so chunked querysets are never read whole.
+    """
+    if len(tiers) == 1:
+        return iter(tiers[0])
+    return heapq.merge(*tiers, key=key, reverse=True)
+
+
+def iter_serialize_filter_qs(qs: Iterable[models.Note]) -> Iterator[dict]:
+    """Serialize filtered notes one by one. Urls are built from templates instead of reversing them per note."""
+    url_templates = get_url_templates('note', NOTE_URLS)
+    for note in qs:
+        note_data = {
+            'note': {
+                'id': note.id,
+                'title': note.title,
+                'is_archived': note.is_archived,
+                'created': note.created.strftime('%d.%m.%Y'),
+            },
+            'urls': {url: template.format(id=note.id) for url, template in url_templates.items()},
+        }
         if note.category:
-            category_data = serialize_model(
-                note.category,
-                ('title', 'color'),
+            note_data['category'] = {'id': note.category_id, 'title': note.category.title, 'color': note.category.color}
+        yield note_data
+
+
+def serialize_filter_qs(qs: Iterable[models.Note]) -> list[dict]:
+    return list(iter_serialize_filter_qs(qs))
+
+
+def get_url_templates(key_model: str, urls) -> dict[str, str]:
+    """Return urls of a model with an "{id}" placeholder, e.g. {'update': '/note/update/{id}/'}."""
+    return {
+        url: reverse(f'{url}_{key_model}', args=[URL_ID_PLACEHOLDER]).replace(URL_ID_PLACEHOLDER, '{id}')
+        for url in urls
+    }
+
+
+def serialize_filter_qs_columnar(tiers: list[QuerySet], offset: int = 0) -> dict:
+    """
+    Serialize filtered notes of tiers after the first offset ones into columns: a list per note field, categories
+    deduplicated into a lookup table which notes refer to by index, and url templates sent once instead of four
+    urls per note.
+    """
+    notes: dict[str, list] = {'id': [], 'title': [], 'is_archived': [], 'created': [], 'category': []}
+    categories: dict[str, list] = {'id': [], 'title': [], 'color': []}
+    category_indexes: dict[int, int] = {}
+
+    rows = merge_note_tiers(
+        [
+            qs.values_list('created', 'id', 'title', 'category_id', 'category__title', 'category__color').annotate(
+                is_archived=Value(qs.model.is_archived)
             )
-            note_data.update(category_data)
-        serialized_data.append(note_data)
+            for qs in tiers
+        ],
+        key=itemgetter(0, 1),
+    )
+    for created, id_, title, category_id, category_title, category_color, is_archived in itertools.islice(
+        rows, offset, None
+    ):
+        notes['id'].append(id_)
+        notes['title'].append(title)
+        notes['is_archived'].append(is_archived)
+        notes['created'].append(created.strftime('%d.%m.%Y'))
+        if category_id is not None and category_id not in category_indexes:
+            category_indexes[category_id] = len(categories['title'])
+            categories['id'].append(category_id)
+            categories['title'].append(category_title)
+            categories['color'].append(category_color)
+        notes['category'].append(category_indexes.get(category_id))
 
-    return serialized_data
+    return {
+        'url_templates': get_url_templates('note', NOTE_URLS),
+        'categories': categories,
+        'notes': notes,
+    }
 
 
 def serialize_model(model_instance: Type[Model], fields, urls=()) -> dict:
-    key_model = model_instance.__class__.__name__.lower()
+    key_model = getattr(model_instance, 'serialization_key', model_instance.__class__.__name__.lower())
     data = {
         key_model: {field: getattr(model_instance, field) for field in fields},
     }
@@ -53,10 +531,11 @@ def count_words_in_text(text: str, unique=False) -> int:
     if not isinstance(text, str):
         raise ValueError('Type of "text" must be str.')
 
-    clean_text = re.sub(r'[^\s\w]+', ' ', text)
-    words = clean_text.lower().split()
+    with WORD_COUNT_DURATION.time(unique=str(unique).lower()):
+        clean_text = re.sub(r'[^\s\w]+', ' ', text)
+        words = clean_text.lower().split()
 
-    if unique:
-        return sum(quantity for quantity in Counter(words).values() if quantity == 1)
+        if unique:
+            return sum(quantity for quantity in Counter(words).values() if quantity == 1)
 
-    return len(words)
+        return len(words)
@@ -0,0 +1,38 @@
+"""
+Sharding of worktables together with their notes and categories between NOTES_SHARDS databases.
+
+Ids of worktables are allocated by models.WorktableShard, a directory in the "default" database which
+also keeps the shard of every worktable and the user or the session to find it by. A new worktable is
+placed on a shard by rendezvous hashing of its id, so adding a shard moves only the worktables which
+hash to the new shard (see the rebalance_shards command). Notes, archived notes and categories are stored
+on the shard of their worktable and are always looked up through it, their ids are unique only within a shard.
+They are created by save() or by related managers of the worktable, which write to its shard,
+while Note.objects.create() writes to the "default" database.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+SHARDED_MODELS = ('notes.worktable', 'notes.note', 'notes.archivednote', 'notes.category')
+# The directory of worktables and sessions, which lead to it, are kept only in the "default" database.
+DIRECTORY_MODELS = ('notes.worktableshard', 'sessions.session')
+
+
+def get_shard_for_id(worktable_id: int, shards: list[str] | None = None) -> str:
+    """Return the shard with the highest hash of the shard and the worktable id."""
+
+    def weight(shard: str) -> bytes:
+        return hashlib.blake2b(f'{shard}:{worktable_id}'.encode(), digest_size=8).digest()
+
+    return max(shards or settings.NOTES_SHARDS, key=weight)
+
+
+def get_shard_of_database(database: str) -> str:
+    """Return the shard of a database alias, replicas of the "default" database belong to its shard."""
+    return DEFAULT_DB_ALIAS if database in settings.DATABASE_REPLICAS else database
+
+
+def is_sharded(model) -> bool:
+    return model._meta.label_lower in SHARDED_MODELS
@@ -1,11 +1,13 @@
+from django.conf import settings
 from django.contrib.sessions.models import Session
-from django.db.models.signals import post_delete, pre_save
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
 from notes import models, services
 
 
 @receiver(pre_save, sender=models.Note)
+@receiver(pre_save, sender=models.ArchivedNote)
 def set_quantity_of_all_words(sender, instance, *args, **kwargs):
     if instance.text:
         text = instance.text
@@ -15,8 +17,24 @@ def set_quantity_of_all_words(sender, instance, *args, **kwargs):
 
 @receiver(post_delete, sender=Session)
 def delete_worktable_after_deleting_session(sender, instance, *args, **kwargs):
-    try:
-        worktable = models.Worktable.objects.get(session_key=instance.session_key)
-        worktable.delete()
-    except models.Worktable.DoesNotExist:
-        pass
+    services.delete_worktables(
+        models.WorktableShard.objects.filter(session_key=instance.session_key).values_list('pk', flat=True)
+    )
+
+
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL)
+def delete_worktable_before_deleting_user(sender, instance, *args, **kwargs):
+    # Deleting of a user cascades only to the "default" database, a worktable may be on another shard.
+    services.delete_worktables(models.WorktableShard.objects.filter(user=instance).values_list('pk', flat=True))
+
+
+@receiver(post_save, sender=models.Worktable)
+def bump_version_of_created_worktable(sender, instance, created, *args, **kwargs):
+    if created:
+        services.bump_worktable_version(instance.pk)
+
+
+@receiver(post_save, sender=models.Category)
+@receiver(post_delete, sender=models.Category)
+def bump_worktable_version_after_changing_category(sender, instance, *args, **kwargs):
+    services.bump_worktable_version(instance.worktable_id)
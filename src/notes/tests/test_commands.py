@@ -0,0 +1,399 @@
+import csv
+import os
+import re
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock, skipIf, skipUnless
+
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from accounts.tests import TEST_EMAIL, TEST_PASSWORD
+from core import health
+from notes import fields, models, seeding, services
+from notes.management.commands import bootstrap, partition_notes, seed_notes, startup_report
+
+
+class PurgeStaleWorktablesCommandTest(TestCase):
+    def setUp(self) -> None:
+        self.client.session.save()
+        self.alive_worktable = models.Worktable.objects.create(session_key=self.client.session.session_key)
+        for n in range(3):
+            worktable = models.Worktable.objects.create(session_key=f'deleted_session_{n}')
+            models.Note.objects.create(worktable=worktable, title=f'Note #{n}')
+
+    def call_command(self, *args):
+        stdout = StringIO()
+        call_command('purge_stale_worktables', *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_command_deletes_only_stale_worktables(self):
+        self.call_command('--batch-size', '2')
+
+        self.assertListEqual(list(models.Worktable.objects.all()), [self.alive_worktable])
+        self.assertFalse(models.Note.objects.exists())
+
+    def test_command_reports_deleting_rate(self):
+        output = self.call_command()
+
+        self.assertRegex(output, r'Deleted 6 rows in .+ rows/s')
+
+    def test_command_doesnt_delete_anything_in_dry_run(self):
+        output = self.call_command('--dry-run')
+
+        self.assertIn('Found 3 stale worktables.', output)
+        self.assertEqual(models.Worktable.objects.count(), 4)
+
+    @override_settings(SESSION_ENGINE='django.contrib.sessions.backends.cache')
+    def test_command_raises_error_if_sessions_arent_stored_in_database(self):
+        with self.assertRaisesRegex(CommandError, r'Sessions must be stored in the database'):
+            self.call_command()
+
+        self.assertEqual(models.Worktable.objects.count(), 4)
+
+
+class SeedNotesCommandTest(TestCase):
+    def call_command(self, *args):
+        stdout = StringIO()
+        call_command('seed_notes', '--notes', '50', '--users', '2', '--sessions', '3', *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def get_notes(self) -> list[tuple]:
+        return [
+            (
+                getattr(note.worktable.user, 'email', None),
+                getattr(note.category, 'title', None),
+                note.title,
+                note.text,
+                note.words,
+                note.unique_words,
+                note.is_archived,
+            )
+            for model in (models.Note, models.ArchivedNote)
+            for note in model.objects.order_by('pk').select_related('worktable__user', 'category')
+        ]
+
+    def test_command_creates_worktables_of_users_and_sessions_with_notes(self):
+        self.call_command('--processes', '1')
+
+        self.assertEqual(models.Worktable.objects.filter(user__email__startswith='seed-0-').count(), 2)
+        self.assertEqual(
+            Session.objects.filter(session_key__in=models.Worktable.objects.values('session_key')).count(), 3
+        )
+        self.assertEqual(models.Note.objects.count() + models.ArchivedNote.objects.count(), 50)
+        self.assertTrue(models.ArchivedNote.objects.exists())
+        self.assertTrue(self.client.login(email='seed-0-0@seed.test', password='password'))
+
+    def test_command_counts_words_of_notes(self):
+        self.call_command('--processes', '1')
+
+        for note in [*models.Note.objects.all(), *models.ArchivedNote.objects.all()]:
+            self.assertEqual(note.words, services.count_words_in_text(note.text))
+            self.assertEqual(note.unique_words, services.count_words_in_text(note.text, unique=True))
+
+    def test_command_generates_same_data_for_same_seed_with_any_quantity_of_processes(self):
+        self.call_command('--processes', '1', '--chunk-size', '7')
+        notes = self.get_notes()
+        get_user_model().objects.all().delete()
+        Session.objects.all().delete()
+
+        self.call_command('--processes', '2', '--chunk-size', '7')
+
+        self.assertListEqual(self.get_notes(), notes)
+
+    def test_command_reports_creating_rate(self):
+        output = self.call_command('--processes', '1')
+
+        self.assertRegex(output, r'notes: 50 in .+ rows/s')
+        self.assertRegex(output, r'Created \d+ rows in .+ rows/s')
+
+    def test_command_raises_error_if_data_of_seed_exists(self):
+        self.call_command('--processes', '1')
+
+        with self.assertRaisesRegex(CommandError, r'Data of seed 0 already exists'):
+            self.call_command('--processes', '1')
+
+    def test_notes_are_copied_to_every_column_on_postgresql(self):
+        # COPY writes NULL to columns which aren't listed, the database has no defaults of fields.
+        connection = mock.MagicMock(vendor='postgresql')
+        connection.ops.quote_name = lambda name: f'"{name}"'
+        chunk = seeding.NotesChunk(0, 0, 0, 1, (), 1, 10, 1, timezone.now())
+        *row, _is_archived, created = seeding.generate_notes(chunk)[0]
+
+        with mock.patch.object(seed_notes, 'connections', {'default': connection}):
+            seed_notes.Command().copy_notes('default', [(*row, created)])
+
+        statement, buffer = connection.cursor().__enter__().copy_expert.call_args.args
+        columns = re.search(r'\((.+)\) FROM STDIN', statement)[1].split(', ')
+        self.assertCountEqual(
+            columns, [f'"{field.column}"' for field in models.Note._meta.concrete_fields if not field.primary_key]
+        )
+        self.assertEqual(len(next(csv.reader(buffer))), len(columns))
+        self.assertEqual(seed_notes.make_note((*row, created)).version, 0)
+
+
+class DistributeTest(TestCase):
+    def test_uniform_distribution_splits_total_equally(self):
+        self.assertListEqual(seeding.distribute(10, 4, 'uniform'), [3, 3, 2, 2])
+
+    def test_zipf_distribution_makes_first_parts_largest(self):
+        counts = seeding.distribute(1_000, 4, 'zipf')
+
+        self.assertEqual(sum(counts), 1_000)
+        self.assertListEqual(counts, sorted(counts, reverse=True))
+        self.assertEqual(counts[0], 480)
+
+    def test_unknown_distribution_raises_error(self):
+        with self.assertRaises(ValueError):
+            seeding.distribute(10, 2, 'normal')
+
+
+@override_settings(
+    STORAGES={
+        'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+        'staticfiles': {'BACKEND': 'core.storage.BundledManifestStaticFilesStorage'},
+    }
+)
+class BootstrapCommandTest(TestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.static_root = Path(temp_dir.name)
+        settings_override = override_settings(STATIC_ROOT=self.static_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        environ_patch = mock.patch.dict(
+            os.environ, {'DJANGO_SUPERUSER_EMAIL': TEST_EMAIL, 'DJANGO_SUPERUSER_PASSWORD': TEST_PASSWORD}
+        )
+        environ_patch.start()
+        self.addCleanup(environ_patch.stop)
+
+    def call_command(self, *args):
+        stdout = StringIO()
+        call_command('bootstrap', *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_command_skips_migrations_if_all_are_applied(self):
+        output = self.call_command()
+
+        self.assertIn('Migrations: nothing to apply, skipped.', output)
+
+    def test_command_creates_superuser_with_worktable_once(self):
+        output = self.call_command()
+
+        self.assertIn('Superuser: created with a worktable.', output)
+        superuser = get_user_model().objects.get(email=TEST_EMAIL)
+        self.assertTrue(superuser.is_superuser)
+        self.assertTrue(models.Worktable.objects.filter(user=superuser).exists())
+
+        output = self.call_command()
+
+        self.assertIn('Superuser: already exists, skipped.', output)
+        self.assertEqual(models.Worktable.objects.filter(user=superuser).count(), 1)
+
+    def test_command_collects_static_files_only_if_they_changed(self):
+        output = self.call_command()
+
+        self.assertIn('Static files: collected.', output)
+        self.assertTrue((self.static_root / 'staticfiles.json').exists())
+
+        output = self.call_command()
+
+        self.assertIn('Static files: not changed since the last collecting, skipped.', output)
+
+        with override_settings(STATIC_BUNDLES={}):
+            output = self.call_command()
+
+        self.assertIn('Static files: collected.', output)
+
+    def test_command_collects_static_files_again_if_manifest_is_missing(self):
+        self.call_command()
+        (self.static_root / 'staticfiles.json').unlink()
+
+        output = self.call_command()
+
+        self.assertIn('Static files: collected.', output)
+
+    def test_command_runs_every_step_if_forced(self):
+        self.call_command()
+
+        output = self.call_command('--force')
+
+        self.assertIn('Migrations: applied 0 to default.', output)
+        self.assertIn('Static files: collected.', output)
+
+    @override_settings(NOTES_SHARDS=['default', 'shard_1'])
+    def test_command_migrates_only_databases_with_unapplied_migrations(self):
+        def get_unapplied_migrations(cache_timeout, database):
+            return ['notes.0042_test'] if database == 'shard_1' else []
+
+        with (
+            mock.patch.object(health, 'get_unapplied_migrations', side_effect=get_unapplied_migrations),
+            mock.patch.object(bootstrap, 'call_command') as call_command_mock,
+        ):
+            output = bootstrap.Command().migrate(force=False)
+
+        self.assertEqual(output, 'Migrations: applied 0 to default, 1 to shard_1.')
+        call_command_mock.assert_called_once_with('migrate', database='shard_1', interactive=False, verbosity=0)
+
+
+IMPORT_TIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        300 |     django.utils.version
+import time:       200 |        500 |   django.utils
+import time:       100 |        600 | django
+import time:        50 |         50 | sqlparse
+"""
+
+
+class PartitionNotesCommandTest(SimpleTestCase):
+    def test_sql_partitions_table_by_key(self):
+        statements = partition_notes.get_partition_sql(
+            'notes_note',
+            'worktable_id',
+            2,
+            indexes=[
+                ('notes_note_pkey', 'CREATE UNIQUE INDEX notes_note_pkey ON notes_note (id)', True),
+                ('notes_note_idx', 'CREATE INDEX notes_note_idx ON public.notes_note (created)', False),
+            ],
+            foreign_keys=[('notes_note_fk', 'FOREIGN KEY (worktable_id) REFERENCES notes_worktable(id)')],
+        )
+
+        self.assertIn('PARTITION BY HASH ("worktable_id")', statements[2])
+        self.assertEqual(
+            statements[3:5],
+            [
+                'CREATE TABLE "notes_note_p0" PARTITION OF "notes_note" FOR VALUES WITH (MODULUS 2, REMAINDER 0)',
+                'CREATE TABLE "notes_note_p1" PARTITION OF "notes_note" FOR VALUES WITH (MODULUS 2, REMAINDER 1)',
+            ],
+        )
+        self.assertIn(
+            'ALTER TABLE "notes_note" ADD CONSTRAINT "notes_note_pkey" PRIMARY KEY ("id", "worktable_id")', statements
+        )
+        self.assertIn('CREATE INDEX notes_note_idx ON public.notes_note (created)', statements)
+        # Rows are copied before indexes are created.
+        self.assertLess(
+            statements.index('INSERT INTO "notes_note" SELECT * FROM "notes_note_unpartitioned"'),
+            statements.index('CREATE INDEX notes_note_idx ON public.notes_note (created)'),
+        )
+        self.assertEqual(statements[-1], 'ANALYZE "notes_note"')
+
+    def test_command_needs_postgresql(self):
+        with self.assertRaisesMessage(CommandError, 'Partitioning needs PostgreSQL'):
+            call_command('partition_notes', stdout=StringIO())
+
+
+@skipUnless(connection.vendor == 'postgresql', 'Partitioning needs PostgreSQL.')
+class PartitionNotesCommandPostgreSQLTest(TestCase):
+    def call_command(self):
+        stdout = StringIO()
+        call_command('partition_notes', '--dry-run', stdout=stdout)
+        return stdout.getvalue()
+
+    def test_unique_index_of_several_columns_including_key_is_partitioned(self):
+        with connection.cursor() as cursor:
+            cursor.execute('CREATE UNIQUE INDEX notes_note_title_key ON notes_note (title, worktable_id)')
+
+        self.assertIn('CREATE UNIQUE INDEX notes_note_title_key', self.call_command())
+
+    def test_unique_index_without_key_isnt_partitioned(self):
+        with connection.cursor() as cursor:
+            cursor.execute('CREATE UNIQUE INDEX notes_note_title_key ON notes_note (title, created)')
+
+        with self.assertRaisesMessage(CommandError, 'Unique index notes_note_title_key must include worktable_id'):
+            self.call_command()
+
+    def test_missing_table_raises_error(self):
+        with mock.patch.object(models.Note._meta, 'db_table', 'notes_missing_note'):
+            with self.assertRaisesMessage(CommandError, "Table notes_missing_note doesn't exist"):
+                self.call_command()
+
+
+@skipIf(connection.vendor == 'postgresql', 'PostgreSQL compresses texts itself.')
+class CompressNoteTextsCommandTest(TestCase):
+    def setUp(self) -> None:
+        self.text = 'Lorem ipsum dolor sit amet. ' * 200
+        worktable = models.Worktable.objects.create(session_key='session')
+        for n in range(3):
+            models.Note.objects.create(worktable=worktable, title=f'Note #{n}', text=self.text)
+        models.Note.objects.create(worktable=worktable, title='Short note', text='Short')
+        # Notes written before texts were compressed.
+        with connection.cursor() as cursor:
+            cursor.execute('UPDATE notes_note SET text = %s WHERE text != %s', [self.text, 'Short'])
+
+    def call_command(self, *args):
+        stdout = StringIO()
+        call_command('compress_note_texts', *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def get_stored_texts(self) -> list[str]:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT text FROM notes_note ORDER BY id')
+            return [row[0] for row in cursor.fetchall()]
+
+    def test_command_compresses_long_texts_in_batches(self):
+        output = self.call_command('--batch-size', '2')
+
+        self.assertEqual(output.count('Compressed batch of'), 2)
+        self.assertRegex(output, rf'Compressed 3 texts from {len(self.text) * 3} to \d+ bytes')
+        stored_texts = self.get_stored_texts()
+        self.assertTrue(all(text.startswith(fields.MARKER) for text in stored_texts[:3]))
+        self.assertEqual(stored_texts[3], 'Short')
+        self.assertEqual([note.text for note in models.Note.objects.order_by('pk')], [self.text] * 3 + ['Short'])
+
+    def test_command_skips_compressed_texts(self):
+        self.call_command()
+
+        self.assertIn('Compressed 0 texts', self.call_command())
+
+    def test_command_doesnt_change_anything_in_dry_run(self):
+        output = self.call_command('--dry-run')
+
+        self.assertIn('Found 3 notes with uncompressed texts.', output)
+        self.assertEqual(self.get_stored_texts(), [self.text] * 3 + ['Short'])
+
+
+class StartupReportCommandTest(SimpleTestCase):
+    def test_parse_import_times_reads_nesting_of_imports(self):
+        import_times = startup_report.parse_import_times(IMPORT_TIME_OUTPUT)
+
+        self.assertEqual(len(import_times), 5)
+        self.assertEqual(import_times[1], startup_report.ImportTime('django.utils.version', 300, 300, 2))
+        self.assertEqual([import_time.depth for import_time in import_times], [1, 2, 1, 0, 0])
+
+    def test_package_times_sum_own_times_of_modules(self):
+        import_times = startup_report.parse_import_times(IMPORT_TIME_OUTPUT)
+
+        self.assertEqual(startup_report.get_package_times(import_times), {'_io': 120, 'django': 600, 'sqlparse': 50})
+
+    def test_command_reports_imports_of_role(self):
+        stdout = StringIO()
+        call_command('startup_report', '--role', 'management', '--repeat', '1', '--top', '3', stdout=stdout)
+        output = stdout.getvalue()
+
+        self.assertIn('Role "management": started in', output)
+        self.assertIn('django', output)
+        self.assertNotIn('Role "web"', output)
+
+    def test_management_role_doesnt_import_admin_theme_and_debug_tooling(self):
+        _duration, import_times = startup_report.profile_startup('management')
+        packages = startup_report.get_package_times(import_times)
+
+        self.assertIn('django', packages)
+        self.assertNotIn('baton', packages)
+        self.assertNotIn('debug_toolbar', packages)
+
+
+class ProcessRoleTest(SimpleTestCase):
+    def test_commands_serving_pages_run_in_web_role(self):
+        import manage
+
+        self.assertEqual(manage.get_process_role(['manage.py', 'runserver']), 'web')
+        self.assertEqual(manage.get_process_role(['manage.py', 'collectstatic']), 'web')
+        self.assertEqual(manage.get_process_role(['manage.py', 'migrate']), 'management')
+        self.assertEqual(manage.get_process_role(['manage.py']), 'management')
@@ -0,0 +1,112 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from notes import fields, models
+
+
+class CompressedTextFieldTest(SimpleTestCase):
+    def setUp(self) -> None:
+        self.field = fields.CompressedTextField(threshold=100)
+        self.long_text = 'Lorem ipsum dolor sit amet. ' * 100
+
+    def test_long_text_is_stored_compressed(self):
+        stored_text = self.field.encode(self.long_text)
+
+        self.assertTrue(stored_text.startswith(f'{fields.MARKER}zlib:'))
+        self.assertLess(len(stored_text), len(self.long_text))
+        self.assertEqual(fields.decode_text(stored_text), self.long_text)
+
+    def test_text_shorter_than_threshold_is_stored_as_is(self):
+        self.assertEqual(self.field.encode('Short text'), 'Short text')
+
+    def test_text_is_stored_as_is_if_compression_doesnt_make_it_smaller(self):
+        text = ''.join(chr(code) for code in range(0x400, 0x400 + 100))
+
+        self.assertEqual(self.field.encode(text), text)
+
+    def test_text_is_compressed_by_lzma(self):
+        field = fields.CompressedTextField(codec='lzma', threshold=100)
+        stored_text = field.encode(self.long_text)
+
+        self.assertTrue(stored_text.startswith(f'{fields.MARKER}lzma:'))
+        self.assertEqual(fields.decode_text(stored_text), self.long_text)
+
+    def test_text_starting_with_marker_is_escaped(self):
+        text = f'{fields.MARKER}zlib:not compressed'
+        stored_text = self.field.encode(text)
+
+        self.assertNotEqual(stored_text, text)
+        self.assertEqual(fields.decode_text(stored_text), text)
+
+    def test_plain_and_empty_texts_are_read_as_is(self):
+        self.assertEqual(fields.decode_text('Plain text'), 'Plain text')
+        self.assertIsNone(fields.decode_text(None))
+        self.assertIsNone(self.field.encode(None))
+
+    def test_text_isnt_compressed_on_postgresql(self):
+        postgresql, sqlite = mock.Mock(vendor='postgresql'), mock.Mock(vendor='sqlite')
+
+        self.assertEqual(self.field.get_db_prep_value(self.long_text, postgresql), self.long_text)
+        self.assertTrue(self.field.get_db_prep_value(self.long_text, sqlite).startswith(fields.MARKER))
+
+    def test_unknown_codec_raises_error(self):
+        with self.assertRaisesRegex(ValueError, r'Codec must be one of zlib, lzma'):
+            fields.CompressedTextField(codec='gzip')
+
+    def test_codec_and_threshold_are_read_from_settings_by_default(self):
+        field = fields.CompressedTextField()
+
+        with self.settings(NOTES_TEXT_CODEC='lzma', NOTES_TEXT_COMPRESSION_THRESHOLD=100):
+            self.assertTrue(field.encode(self.long_text).startswith(f'{fields.MARKER}lzma:'))
+        with self.settings(NOTES_TEXT_COMPRESSION_THRESHOLD=len(self.long_text) + 1):
+            self.assertEqual(field.encode(self.long_text), self.long_text)
+
+    def test_unknown_codec_in_settings_raises_error(self):
+        with self.settings(NOTES_TEXT_CODEC='gzip'), self.assertRaises(ImproperlyConfigured):
+            fields.CompressedTextField(threshold=100).encode(self.long_text)
+
+    def test_deconstruct_leaves_out_codec_and_threshold(self):
+        *_, kwargs = fields.CompressedTextField(codec='lzma', threshold=10).deconstruct()
+
+        self.assertNotIn('codec', kwargs)
+        self.assertNotIn('threshold', kwargs)
+
+
+class CompressedTextFieldMigrationsTest(TestCase):
+    databases = '__all__'
+
+    @override_settings(NOTES_TEXT_CODEC='lzma', NOTES_TEXT_COMPRESSION_THRESHOLD=100)
+    def test_changing_settings_doesnt_need_migration(self):
+        call_command('makemigrations', 'notes', '--check', '--dry-run', stdout=StringIO())  # not raise SystemExit
+
+
+class NoteTextCompressionTest(TestCase):
+    def setUp(self) -> None:
+        self.worktable = models.Worktable.objects.create(session_key=self.client.session.session_key)
+        self.text = 'Lorem ipsum dolor sit amet. ' * 200
+
+    def get_stored_text(self, note) -> str:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT text FROM notes_note WHERE id = %s', [note.pk])
+            return cursor.fetchone()[0]
+
+    def test_note_text_is_stored_compressed_where_database_doesnt_compress_it_and_read_transparently(self):
+        note = models.Note.objects.create(worktable=self.worktable, title='Note', text=self.text)
+
+        stored_text = self.get_stored_text(note)
+
+        self.assertEqual(
+            stored_text.startswith(fields.MARKER), models.Note._meta.get_field('text').compresses_on(connection)
+        )
+        self.assertEqual(models.Note.objects.get().text, self.text)
+        self.assertEqual(models.Note.objects.values_list('text', flat=True).get(), self.text)
+
+    def test_note_is_found_by_exact_text(self):
+        note = models.Note.objects.create(worktable=self.worktable, title='Note', text=self.text)
+
+        self.assertEqual(models.Note.objects.get(text=self.text), note)
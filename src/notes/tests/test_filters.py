@@ -3,7 +3,7 @@ from datetime import timedelta
 from django.test import TestCase
 from django.utils import timezone
 
-from notes import models, filters
+from notes import models, filters, services
 from notes.tests import get_test_request
 
 
@@ -13,7 +13,7 @@ class NoteFilterTest(TestCase):
         self.request = get_test_request(self.client)
         self.worktable = models.Worktable.objects.create(session_key=self.client.session.session_key)
         self.category = models.Category.objects.create(worktable=self.worktable, title='Category #1')
-        models.Note.objects.bulk_create(
+        notes = models.Note.objects.bulk_create(
             [
                 models.Note(
                     worktable=self.worktable,
@@ -21,11 +21,11 @@ class NoteFilterTest(TestCase):
                     category=category,
                     words=n * 10,
                     unique_words=n,
-                    is_archived=True if n == 3 else False,
                 )
                 for n, category in enumerate((self.category, self.category, None), start=1)
             ]
         )
+        services.archive_note(notes[2])
 
     def test_filter_filters_notes_by_category(self):
         expected_qs = models.Note.objects.filter(category=self.category)
@@ -33,20 +33,24 @@ class NoteFilterTest(TestCase):
 
         self.assertEqual(filter_.qs.count(), 2)
         self.assertQuerySetEqual(filter_.qs, expected_qs)
+        self.assertFalse(filter_.tiers[1].exists())
 
     def test_filter_filters_notes_by_active_status(self):
-        expected_qs = models.Note.objects.filter(is_archived=False)
         filter_ = self.filter_class(request=self.request, data={'status': self.filter_class.Status.ACTIVE})
 
-        self.assertEqual(filter_.qs.count(), 2)
-        self.assertQuerySetEqual(filter_.qs, expected_qs)
+        self.assertEqual(len(filter_.tiers), 1)
+        self.assertQuerySetEqual(filter_.tiers[0], models.Note.objects.all())
 
     def test_filter_filters_notes_by_archived_status(self):
-        expected_qs = models.Note.objects.filter(is_archived=True)
         filter_ = self.filter_class(request=self.request, data={'status': self.filter_class.Status.ARCHIVED})
 
-        self.assertEqual(filter_.qs.count(), 1)
-        self.assertQuerySetEqual(filter_.qs, expected_qs)
+        self.assertEqual(len(filter_.tiers), 1)
+        self.assertQuerySetEqual(filter_.tiers[0], models.ArchivedNote.objects.all())
+
+    def test_filter_filters_notes_of_both_tiers_without_status(self):
+        filter_ = self.filter_class(request=self.request, data={'words_min': '20'})
+
+        self.assertListEqual([note.title for note in services.merge_note_tiers(filter_.tiers)], ['Note #3', 'Note #2'])
 
     def test_filter_filters_notes_by_quantity_words_range(self):
         expected_qs = models.Note.objects.filter(words__range=(0, 20))
@@ -81,8 +85,9 @@ class NoteFilterTest(TestCase):
             },
         )
 
-        self.assertEqual(filter_.qs.count(), 2)
+        self.assertEqual(filter_.qs.count(), 1)
         self.assertQuerySetEqual(filter_.qs, expected_qs)
+        self.assertEqual(filter_.tiers[1].count(), 1)
 
     def test_category_filter_returns_categories_of_current_worktable(self):
         morty_worktable = models.Worktable.objects.create(session_key='morty_worktable_session_key')
@@ -92,3 +97,28 @@ class NoteFilterTest(TestCase):
 
         self.assertQuerySetEqual(category_qs, self.worktable.get_all_categories())
         self.assertFalse(category_qs.filter(id=morty_category.id))
+
+    def test_base_form_class_is_built_once(self):
+        self.assertIs(self.filter_class.get_base_form_class(), self.filter_class.get_base_form_class())
+
+    def test_filter_form_still_validates_categories_of_current_worktable_after_building_base_form_class(self):
+        self.filter_class.get_base_form_class()
+        morty_worktable = models.Worktable.objects.create(session_key='morty_worktable_session_key')
+        morty_category = models.Category.objects.create(worktable=morty_worktable, title='Morty Note')
+        filter_ = self.filter_class(request=self.request, data={'category': morty_category.id})
+
+        self.assertFalse(filter_.form.is_valid())
+
+    def test_filter_leaves_fields_with_errors_out_of_both_tiers(self):
+        filter_ = self.filter_class(request=self.request, data={'words_min': 'many', 'category': self.category.id})
+
+        self.assertEqual(filter_.tiers[0].count(), 2)
+        self.assertFalse(filter_.tiers[1].exists())
+
+    def test_filter_filters_archive_tier_by_filter_of_archived_notes(self):
+        filter_ = self.filter_class(request=self.request, data={'words_min': '30'})
+        archived_filter = filters.ArchivedNoteFilter(request=self.request, data={'words_min': '30'})
+
+        self.assertIs(archived_filter._meta.model, models.ArchivedNote)
+        self.assertQuerySetEqual(filter_.tiers[1], archived_filter.qs)
+        self.assertListEqual([note.title for note in filter_.tiers[1]], ['Note #3'])
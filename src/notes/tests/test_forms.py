@@ -1,9 +1,11 @@
+from unittest import mock
+
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django import forms as dj_forms
 
 from accounts.tests import TEST_EMAIL, TEST_PASSWORD
-from notes import forms, models
+from notes import forms, models, services
 from notes.tests import get_test_request
 
 User = get_user_model()
@@ -32,6 +34,7 @@ class NoteUpdateForm(TestCase):
             "head forward - what's wrong with you?;\n"
             'head back - what the hell?;\n'
             'all other times - shrug;',
+            'version': 0,
         }
 
     def test_form_inherits_ModelForm(self):
@@ -52,6 +55,34 @@ class NoteUpdateForm(TestCase):
         self.assertEqual(self.note.text, self.data['text'])
 
 
+class ArchivedNoteUpdateForm(TestCase):
+    def setUp(self) -> None:
+        self.form_class = forms.ArchivedNoteUpdateForm
+        self.worktable = models.Worktable.objects.create(session_key=self.client.session.session_key)
+        self.category = models.Category.objects.create(worktable=self.worktable, title='Category #1')
+        self.note = services.archive_note(
+            models.Note.objects.create(worktable=self.worktable, title='Note #1', text='Some text')
+        )
+
+    def test_form_updates_archived_note_with_its_text(self):
+        data = {'category': self.category.id, 'title': 'Note #2', 'text': 'Other archived text', 'version': 0}
+
+        form = self.form_class(instance=self.note, data=data)
+        self.assertTrue(form.is_valid())
+        form.save()
+        archived_note = models.ArchivedNote.objects.get()
+
+        self.assertEqual(archived_note.category, self.category)
+        self.assertEqual(archived_note.title, 'Note #2')
+        self.assertEqual(archived_note.text, 'Other archived text')
+        self.assertEqual(archived_note.words, 3)
+        self.assertEqual(archived_note.version, 1)
+        self.assertFalse(models.Note.objects.exists())
+
+    def test_form_is_initialized_with_text_of_archived_note(self):
+        self.assertEqual(self.form_class(instance=self.note).initial['text'], 'Some text')
+
+
 class NoteCreateForm(TestCase):
     def setUp(self) -> None:
         self.form_class = forms.NoteCreateForm
@@ -188,3 +219,24 @@ class BaseCreateFormTest(TestCase):
         category = form.save()
 
         self.assertEqual(category.worktable.pk, worktable.pk)
+
+
+class FormFactoryTest(TestCase):
+    def setUp(self) -> None:
+        self.request = get_test_request(self.client)
+
+    def test_accepts_request_introspects_form_constructor(self):
+        self.assertTrue(forms.accepts_request(forms.CategoryCreateForm))
+        self.assertFalse(forms.accepts_request(forms.CategoryUpdateForm))
+
+    def test_build_form_passes_request_only_if_form_takes_it(self):
+        self.assertIs(forms.build_form(forms.CategoryCreateForm, self.request).request, self.request)
+        self.assertIsInstance(forms.build_form(forms.CategoryUpdateForm, self.request), forms.CategoryUpdateForm)
+
+    def test_lazy_form_is_built_on_first_access(self):
+        with mock.patch.object(forms, 'build_form', wraps=forms.build_form) as build_form:
+            form = forms.lazy_form(forms.CategoryUpdateForm, self.request)
+            build_form.assert_not_called()
+
+            self.assertIsInstance(form, forms.CategoryUpdateForm)
+            build_form.assert_called_once()
@@ -4,7 +4,7 @@ from django.contrib.auth import get_user_model
 from django.contrib.sessions.models import Session
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils import timezone
 
 from accounts.tests import TEST_EMAIL, TEST_PASSWORD
@@ -66,9 +66,8 @@ class NoteModelTest(TestCase):
         with self.assertRaisesRegex(IntegrityError, r'CHECK .+'):
             self.model_class.objects.create(**self.data)
 
-    def test_is_archived_field_is_false_by_default(self):
+    def test_note_isnt_archived(self):
         note = self.model_class.objects.create(**self.data)
-        note.full_clean()
 
         self.assertFalse(note.is_archived)
 
@@ -114,6 +113,43 @@ class NoteModelTest(TestCase):
         self.assertEqual(str(note), self.data['title'])
 
 
+class ArchivedNoteModelTest(TestCase):
+    def setUp(self) -> None:
+        self.worktable = models.Worktable.objects.create(session_key=self.client.session.session_key)
+        self.note = models.Note.objects.create(worktable=self.worktable, title='Note #1', text='Some text ' * 100)
+
+    def test_model_keeps_fields_and_id_of_note(self):
+        archived_note = models.ArchivedNote.from_note(self.note)
+        archived_note.save()
+        archived_note = models.ArchivedNote.objects.get()
+
+        self.assertTrue(archived_note.is_archived)
+        for name in ('id', *models.NOTE_TIER_FIELDS):
+            self.assertEqual(getattr(archived_note, name), getattr(self.note, name))
+
+    def test_text_is_compressed(self):
+        archived_note = models.ArchivedNote.from_note(self.note)
+
+        self.assertTrue(archived_note.is_text_compressed)
+        self.assertLess(len(archived_note.stored_text), len(self.note.text))
+
+    def test_text_isnt_compressed_if_compression_doesnt_make_it_smaller(self):
+        archived_note = models.ArchivedNote(text='Short')
+
+        self.assertFalse(archived_note.is_text_compressed)
+        self.assertEqual(archived_note.text, 'Short')
+
+    @override_settings(NOTES_ARCHIVE_COMPRESSION=False)
+    def test_text_isnt_compressed_if_compression_is_off(self):
+        archived_note = models.ArchivedNote.from_note(self.note)
+
+        self.assertFalse(archived_note.is_text_compressed)
+        self.assertEqual(archived_note.text, self.note.text)
+
+    def test_empty_text_is_stored_as_null(self):
+        self.assertIsNone(models.ArchivedNote(text=None).stored_text)
+
+
 class CategoryModelTest(TestCase):
     def setUp(self) -> None:
         self.model_class = models.Category
@@ -1,9 +1,16 @@
+from datetime import timedelta
+
 from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
 from django.test import TestCase
+from django.utils import timezone
 
 from django.urls import reverse
 
 from accounts.tests import TEST_PASSWORD, TEST_EMAIL
+from core import metrics
 from notes import services, models
 from notes.tests import get_test_request
 
@@ -30,6 +37,247 @@ class GetWorktableServiceTest(TestCase):
 
         self.assertEqual(worktable.id, expected_worktable.id)
 
+    def test_service_returns_unsaved_worktable_if_session_doesnt_have_it(self):
+        worktable = self.service_fn(self.request)
+
+        self.assertIsNone(worktable.pk)
+        self.assertFalse(worktable.get_all_notes().exists())
+        self.assertFalse(worktable.get_all_categories().exists())
+        self.assertEqual(models.Worktable.objects.count(), 0)
+
+
+class GetOrCreateWorktableServiceTest(TestCase):
+    def setUp(self) -> None:
+        self.service_fn = services.get_or_create_worktable
+        self.request = get_test_request(self.client)
+
+    def test_service_creates_worktable_for_session(self):
+        worktable = self.service_fn(self.request)
+
+        self.assertIsNotNone(worktable.pk)
+        self.assertEqual(worktable.session_key, self.request.session.session_key)
+
+    def test_service_returns_existing_worktable(self):
+        expected_worktable = models.Worktable.objects.create(session_key=self.client.session.session_key)
+
+        self.assertEqual(self.service_fn(self.request), expected_worktable)
+
+
+class WorktableVersionServiceTest(TestCase):
+    def setUp(self) -> None:
+        self.worktable = models.Worktable.objects.create(session_key='session')
+
+    def test_service_returns_same_version_until_bump(self):
+        version = services.get_worktable_version(self.worktable)
+
+        self.assertEqual(services.get_worktable_version(self.worktable), version)
+
+        services.bump_worktable_version(self.worktable.id)
+
+        self.assertNotEqual(services.get_worktable_version(self.worktable), version)
+
+    def test_service_returns_zero_version_for_unsaved_worktable(self):
+        self.assertEqual(services.get_worktable_version(models.Worktable()), 0)
+
+    def test_service_counts_cache_hits_and_misses(self):
+        cache.clear()
+        values = metrics.REGISTRY.collect()['online_notes_cache_requests_total']
+        hits, misses = values.get(('worktable_version', 'hit'), 0), values.get(('worktable_version', 'miss'), 0)
+
+        services.get_worktable_version(self.worktable)
+        services.get_worktable_version(self.worktable)
+
+        values = metrics.REGISTRY.collect()['online_notes_cache_requests_total']
+        self.assertEqual(values[('worktable_version', 'hit')], hits + 1)
+        self.assertEqual(values[('worktable_version', 'miss')], misses + 1)
+
+
+class DeleteCategoryServiceTest(TestCase):
+    def setUp(self) -> None:
+        self.service_fn = services.delete_category
+        self.worktable = models.Worktable.objects.create(session_key=self.client.session.session_key)
+        self.category = models.Category.objects.create(worktable=self.worktable, title='Category #1')
+        self.other_category = models.Category.objects.create(worktable=self.worktable, title='Category #2')
+        notes = models.Note.objects.bulk_create(
+            [models.Note(worktable=self.worktable, title=f'Note #{n}', category=self.category) for n in range(5)]
+        )
+        services.archive_note(notes[0])
+
+    def test_service_deletes_category_and_detaches_notes(self):
+        updated = self.service_fn(self.category, chunk_size=2)
+
+        self.assertEqual(updated, 5)
+        self.assertFalse(models.Category.objects.filter(id=self.category.id).exists())
+        self.assertEqual(models.Note.objects.filter(category__isnull=True).count(), 4)
+        self.assertIsNone(models.ArchivedNote.objects.get().category)
+
+    def test_service_moves_notes_to_other_category(self):
+        updated = self.service_fn(self.category, move_to=self.other_category, chunk_size=2)
+
+        self.assertEqual(updated, 5)
+        self.assertEqual(models.Note.objects.filter(category=self.other_category).count(), 4)
+        self.assertEqual(models.ArchivedNote.objects.get().category, self.other_category)
+
+    def test_service_raises_error_if_move_to_category_belongs_to_other_worktable(self):
+        worktable = models.Worktable.objects.create(session_key='other_session')
+        foreign_category = models.Category.objects.create(worktable=worktable, title='Category #3')
+
+        with self.assertRaisesRegex(ValueError, r'same worktable'):
+            self.service_fn(self.category, move_to=foreign_category)
+
+        self.assertTrue(models.Category.objects.filter(id=self.category.id).exists())
+
+
+class GetStaleWorktablesServiceTest(TestCase):
+    def setUp(self) -> None:
+        self.service_fn = services.get_stale_worktables
+        self.client.session.save()
+        self.alive_worktable = models.Worktable.objects.create(session_key=self.client.session.session_key)
+
+    def test_service_returns_worktables_without_sessions(self):
+        worktable = models.Worktable.objects.create(session_key='deleted_session')
+
+        self.assertListEqual(list(self.service_fn().values_list('pk', flat=True)), [worktable.pk])
+
+    def test_service_returns_worktables_with_expired_sessions(self):
+        Session.objects.update(expire_date=timezone.now() - timedelta(days=1))
+
+        self.assertListEqual(list(self.service_fn().values_list('pk', flat=True)), [self.alive_worktable.pk])
+
+    def test_service_doesnt_return_user_worktables(self):
+        user = User.objects.create_user(email=TEST_EMAIL, password=TEST_PASSWORD)
+        models.Worktable.objects.create(user=user)
+
+        self.assertFalse(self.service_fn().exists())
+
+
+class DeleteWorktablesServiceTest(TestCase):
+    def setUp(self) -> None:
+        self.service_fn = services.delete_worktables
+        self.worktable = models.Worktable.objects.create(session_key='session')
+        self.category = models.Category.objects.create(worktable=self.worktable, title='Category #1')
+        models.Note.objects.create(worktable=self.worktable, title='Note #1', category=self.category)
+        services.archive_note(models.Note.objects.create(worktable=self.worktable, title='Note #2'))
+
+    def test_service_deletes_worktables_with_notes_and_categories(self):
+        deleted = self.service_fn([self.worktable.id])
+
+        self.assertDictEqual(
+            deleted, {'notes.Note': 1, 'notes.ArchivedNote': 1, 'notes.Category': 1, 'notes.Worktable': 1}
+        )
+        self.assertFalse(models.Worktable.objects.exists())
+        self.assertFalse(models.Note.objects.exists())
+
+    def test_service_deletes_rows_of_shard_by_query_per_table(self):
+        for n in range(2, 6):
+            category = models.Category.objects.create(worktable=self.worktable, title=f'Category #{n}')
+            models.Note.objects.create(worktable=self.worktable, title=f'Note #{n + 1}', category=category)
+
+        with self.assertNumQueries(4):
+            deleted = services.delete_worktables_of_shard(DEFAULT_DB_ALIAS, [self.worktable.id])
+
+        self.assertDictEqual(
+            deleted, {'notes.Note': 5, 'notes.ArchivedNote': 1, 'notes.Category': 5, 'notes.Worktable': 1}
+        )
+        self.assertFalse(models.Category.objects.exists())
+
+
+class ArchiveNoteServiceTest(TestCase):
+    def setUp(self) -> None:
+        self.worktable = models.Worktable.objects.create(session_key=self.client.session.session_key)
+        self.note = models.Note.objects.create(worktable=self.worktable, title='Note #1', text='Some text')
+        self.note.created = timezone.now() - timedelta(days=3)
+        self.note.save()
+
+    def test_service_moves_note_to_archive(self):
+        archived_note = services.archive_note(self.note)
+
+        self.assertFalse(models.Note.objects.exists())
+        self.assertEqual(models.ArchivedNote.objects.get(), archived_note)
+        self.assertEqual(archived_note.pk, self.note.pk)
+        self.assertEqual(archived_note.text, 'Some text')
+
+    def test_service_moves_archived_note_back_with_its_id_and_created_date(self):
+        note = services.unarchive_note(services.archive_note(self.note))
+
+        self.assertFalse(models.ArchivedNote.objects.exists())
+        self.assertEqual(models.Note.objects.get(), note)
+        self.assertEqual(note.pk, self.note.pk)
+        self.assertEqual(models.Note.objects.get().created, self.note.created)
+
+    def test_service_gets_note_of_any_tier(self):
+        other_note = models.Note.objects.create(worktable=self.worktable, title='Note #2')
+        services.archive_note(self.note)
+
+        self.assertTrue(services.get_note(self.worktable, self.note.pk).is_archived)
+        self.assertFalse(services.get_note(self.worktable, other_note.pk).is_archived)
+        with self.assertRaises(models.Note.DoesNotExist):
+            services.get_note(self.worktable, 999_999_999)
+
+    def test_service_archives_notes_of_queryset_by_chunks(self):
+        models.Note.objects.bulk_create(models.Note(worktable=self.worktable, title=f'Note #{n}') for n in range(4))
+
+        archived = services.archive_notes(models.Note.objects.all(), chunk_size=2)
+
+        self.assertEqual(archived, 5)
+        self.assertFalse(models.Note.objects.exists())
+        self.assertEqual(models.ArchivedNote.objects.get(pk=self.note.pk).created, self.note.created)
+
+
+class BulkCreateNotesServiceTest(TestCase):
+    def test_service_keeps_given_creation_dates_of_notes(self):
+        worktable = models.Worktable.objects.create(session_key='session')
+        dates = [timezone.now() - timedelta(days=n) for n in range(3)]
+
+        notes = services.bulk_create_notes(
+            'default',
+            (models.Note(worktable=worktable, title=f'Note #{n}', created=date) for n, date in enumerate(dates)),
+        )
+
+        self.assertListEqual([note.created for note in notes], dates)
+        self.assertListEqual(list(models.Note.objects.order_by('pk').values_list('created', flat=True)), dates)
+        self.assertTrue(models.Note._meta.get_field('created').auto_now_add)
+
+
+class PatchNoteTextServiceTest(TestCase):
+    def setUp(self) -> None:
+        worktable = models.Worktable.objects.create(session_key='session')
+        self.note = models.Note.objects.create(worktable=worktable, title='Note #1', text='Hello world')
+
+    def test_operations_apply_in_order(self):
+        operations = [{'offset': 6, 'length': 5, 'insert': 'there'}, {'offset': 11, 'insert': '!'}, {'offset': 0}]
+
+        self.assertEqual(services.apply_text_patch('Hello world', operations), 'Hello there!')
+
+    def test_offsets_count_characters(self):
+        self.assertEqual(
+            services.apply_text_patch('Привет 👋 мир', [{'offset': 9, 'length': 3, 'insert': 'world'}]),
+            'Привет 👋 world',
+        )
+
+    def test_invalid_operations_raise_error(self):
+        for operations in (
+            {'offset': 0},
+            ['insert'],
+            [{'length': 1}],
+            [{'offset': -1}],
+            [{'offset': True}],
+            [{'offset': 0, 'insert': 1}],
+            [{'offset': 5, 'length': 7}],
+        ):
+            with self.subTest(operations=operations), self.assertRaises(ValueError):
+                services.apply_text_patch('Hello world', operations)
+
+    def test_patch_of_stale_note_conflicts_with_concurrent_patch(self):
+        stale_note = models.Note.objects.get()
+        services.patch_note_text(self.note, 0, [{'offset': 0, 'insert': 'First '}])
+
+        with self.assertRaises(services.NoteVersionConflict) as context:
+            services.patch_note_text(stale_note, 0, [{'offset': 0, 'insert': 'Second '}])
+
+        self.assertEqual(context.exception.version, 1)
+        self.assertEqual(models.Note.objects.get().text, 'First Hello world')
+
 
 class SerializeModelTest(TestCase):
     def setUp(self) -> None:
@@ -83,6 +331,7 @@ class SerializeFilterQS(TestCase):
                     'created': self.note.created.strftime('%d.%m.%Y'),
                 },
                 'category': {
+                    'id': self.category.id,
                     'title': self.category.title,
                     'color': self.category.color,
                 },
@@ -104,6 +353,54 @@ class SerializeFilterQS(TestCase):
         self.assertListEqual(data, self.expected_data)
 
 
+class SerializeFilterQSColumnarTest(TestCase):
+    def setUp(self) -> None:
+        self.service_fn = services.serialize_filter_qs_columnar
+        self.worktable = models.Worktable.objects.create(session_key=self.client.session.session_key)
+        self.category = models.Category.objects.create(worktable=self.worktable, title='Category #1')
+        self.notes = [
+            models.Note.objects.create(worktable=self.worktable, title=f'Note #{n}', category=category)
+            for n, category in enumerate((self.category, None, self.category))
+        ]
+
+    def test_service_serializes_notes_into_columns(self):
+        data = self.service_fn([models.Note.objects.order_by('id')])
+
+        self.assertDictEqual(
+            data['notes'],
+            {
+                'id': [note.id for note in self.notes],
+                'title': ['Note #0', 'Note #1', 'Note #2'],
+                'is_archived': [False, False, False],
+                'created': [note.created.strftime('%d.%m.%Y') for note in self.notes],
+                'category': [0, None, 0],
+            },
+        )
+        self.assertDictEqual(
+            data['categories'], {'id': [self.category.id], 'title': ['Category #1'], 'color': [self.category.color]}
+        )
+
+    def test_service_merges_tiers_by_created_date(self):
+        services.archive_note(self.notes[1])
+
+        data = self.service_fn([models.Note.objects.all(), models.ArchivedNote.objects.all()])
+
+        self.assertListEqual(data['notes']['title'], ['Note #2', 'Note #1', 'Note #0'])
+        self.assertListEqual(data['notes']['is_archived'], [False, True, False])
+
+    def test_service_skips_notes_before_offset(self):
+        data = self.service_fn([models.Note.objects.order_by('-created', '-id')], offset=2)
+
+        self.assertListEqual(data['notes']['title'], ['Note #0'])
+
+    def test_service_returns_url_templates_of_notes(self):
+        data = self.service_fn([models.Note.objects.all()])
+        note = self.notes[0]
+
+        for url, template in data['url_templates'].items():
+            self.assertEqual(template.format(id=note.id), reverse(f'{url}_note', args=[note.id]))
+
+
 class CountAllWordsInTextTest(TestCase):
     def setUp(self) -> None:
         self.service_fn = services.count_words_in_text
@@ -0,0 +1,187 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.db import connections, router
+from django.db.models import F
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from accounts.tests import TEST_EMAIL, TEST_PASSWORD
+from notes import models, services, sharding
+
+SHARDS = ['default', 'shard_1', 'shard_2']
+
+
+class GetShardForIdTest(SimpleTestCase):
+    def test_shard_is_stable_and_shards_are_balanced(self):
+        placements = [sharding.get_shard_for_id(pk, SHARDS) for pk in range(3_000)]
+
+        self.assertEqual(placements, [sharding.get_shard_for_id(pk, SHARDS) for pk in range(3_000)])
+        for shard in SHARDS:
+            self.assertAlmostEqual(placements.count(shard), 1_000, delta=150)
+
+    def test_adding_shard_moves_worktables_only_to_it(self):
+        for pk in range(3_000):
+            shard = sharding.get_shard_for_id(pk, SHARDS)
+            if shard != sharding.get_shard_for_id(pk, SHARDS[:2]):
+                self.assertEqual(shard, 'shard_2')
+
+
+class ShardRouterMigrationsTest(TestCase):
+    databases = set(SHARDS)
+
+    def test_directory_isnt_migrated_to_shards(self):
+        self.assertTrue(router.allow_migrate('shard_1', 'notes', model_name='note'))
+        self.assertTrue(router.allow_migrate('shard_1', 'notes', model_name='worktable'))
+        self.assertTrue(router.allow_migrate('shard_1', 'accounts', model_name='user'))
+        self.assertFalse(router.allow_migrate('shard_1', 'notes', model_name='worktableshard'))
+        self.assertFalse(router.allow_migrate('shard_1', 'sessions', model_name='session'))
+        self.assertTrue(router.allow_migrate('default', 'notes', model_name='worktableshard'))
+
+    def test_shard_database_has_tables_of_sharded_models_without_directory(self):
+        tables = set(connections['shard_1'].introspection.table_names())
+
+        self.assertLessEqual({'notes_worktable', 'notes_note', 'notes_archivednote', 'notes_category'}, tables)
+        self.assertNotIn('notes_worktableshard', tables)
+        self.assertNotIn('django_session', tables)
+
+    def test_worktables_on_shards_dont_reference_users(self):
+        with connections['shard_1'].cursor() as cursor:
+            constraints = connections['shard_1'].introspection.get_constraints(cursor, 'notes_worktable')
+
+        self.assertFalse(
+            [
+                name
+                for name, constraint in constraints.items()
+                if constraint['foreign_key'] and 'user_id' in constraint['columns']
+            ]
+        )
+
+
+@override_settings(NOTES_SHARDS=['shard_1'])
+class ShardedViewsTest(TestCase):
+    databases = set(SHARDS)
+
+    def test_worktable_notes_and_categories_are_stored_on_its_shard(self):
+        response = self.client.post(reverse('create_category'), data={'title': 'Category #1', 'color': '#FF0000'})
+        self.assertEqual(response.status_code, 201)
+        category_id = response.json()['category']['id']
+        response = self.client.post(reverse('create_note'), data={'title': 'Note #1', 'category': category_id})
+        self.assertEqual(response.status_code, 201)
+        note_id = response.json()['note']['id']
+
+        entry = models.WorktableShard.objects.get(session_key=self.client.session.session_key)
+        self.assertEqual(entry.shard, 'shard_1')
+        self.assertTrue(models.Worktable.objects.using('shard_1').filter(pk=entry.pk).exists())
+        self.assertFalse(models.Worktable.objects.using('default').exists())
+        self.assertEqual(models.Note.objects.using('shard_1').get().category_id, category_id)
+
+        response = self.client.get(reverse('retrieve_note', args=[note_id]))
+        self.assertEqual(response.json()['category']['title'], 'Category #1')
+        response = self.client.get(reverse('filter_notes'))
+        self.assertEqual([note['note']['id'] for note in response.json()], [note_id])
+
+        response = self.client.post(reverse('update_note', args=[note_id]), data={'title': 'Note #2', 'version': 0})
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(reverse('delete_category', args=[category_id]))
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(models.Note.objects.using('shard_1').get().category_id)
+
+    def test_notes_of_other_worktables_arent_found(self):
+        worktable = models.Worktable.objects.create(session_key='other_session')
+        note = worktable.note_set.create(title='Note #1')
+        self.client.post(reverse('create_note'), data={'title': 'Note #2'})
+
+        response = self.client.get(reverse('retrieve_note', args=[note.id]))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_deleting_session_deletes_worktable_on_shard(self):
+        self.client.post(reverse('create_note'), data={'title': 'Note #1'})
+
+        Session.objects.get().delete()
+
+        self.assertFalse(models.Worktable.objects.using('shard_1').exists())
+        self.assertFalse(models.Note.objects.using('shard_1').exists())
+        self.assertFalse(models.WorktableShard.objects.exists())
+
+    def test_deleting_user_deletes_worktable_on_shard(self):
+        user = get_user_model().objects.create_user(email=TEST_EMAIL, password=TEST_PASSWORD)
+        worktable = models.Worktable.objects.create(user=user)
+        worktable.note_set.create(title='Note #1')
+
+        user.delete()
+
+        self.assertFalse(models.Worktable.objects.using('shard_1').exists())
+        self.assertFalse(models.Note.objects.using('shard_1').exists())
+
+
+class RebalanceShardsCommandTest(TestCase):
+    databases = set(SHARDS)
+
+    def setUp(self) -> None:
+        for n in range(20):
+            worktable = models.Worktable.objects.create(session_key=f'session_{n}')
+            category = worktable.category_set.create(title=f'Category #{n}')
+            worktable.note_set.create(category=category, title=f'Note #{n}')
+            services.archive_note(worktable.note_set.create(title=f'Note #{n}'))
+
+    def call_command(self, *args):
+        stdout = StringIO()
+        call_command('rebalance_shards', *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def get_notes(self) -> set[tuple]:
+        notes = set()
+        for shard in SHARDS:
+            for model in (models.Note, models.ArchivedNote):
+                rows = model.objects.using(shard).values_list('worktable_id', 'title', 'category__title', 'created')
+                notes.update((model.is_archived, *row) for row in rows)
+        return notes
+
+    @override_settings(NOTES_SHARDS=SHARDS)
+    def test_command_moves_worktables_to_their_shards(self):
+        notes = self.get_notes()
+
+        output = self.call_command()
+
+        moved = models.WorktableShard.objects.exclude(shard='default').count()
+        self.assertGreater(moved, 0)
+        self.assertIn(f'Moved {moved} worktables with {moved * 2} notes', output)
+        for entry in models.WorktableShard.objects.all():
+            self.assertEqual(entry.shard, sharding.get_shard_for_id(entry.pk))
+            self.assertTrue(models.Worktable.objects.using(entry.shard).filter(pk=entry.pk).exists())
+        self.assertEqual(models.Worktable.objects.using('default').count(), 20 - moved)
+        self.assertSetEqual(self.get_notes(), notes)
+
+        self.assertIn('Moved 0 worktables', self.call_command())
+
+    @override_settings(NOTES_SHARDS=SHARDS)
+    def test_worktable_changed_while_moving_stays_on_its_shard(self):
+        entry = models.WorktableShard.objects.exclude(shard='shard_1').first()
+        archive_notes = services.archive_notes
+
+        def archive_notes_and_edit_note(notes):
+            # A note of the worktable is edited on the old shard after it has been copied.
+            models.Note.objects.using(entry.shard).filter(worktable_id=entry.pk).update(version=F('version') + 1)
+            return archive_notes(notes)
+
+        with (
+            mock.patch.object(services, 'archive_notes', archive_notes_and_edit_note),
+            self.assertRaises(services.WorktableChangedError),
+        ):
+            services.move_worktable(entry, 'shard_1')
+
+        self.assertEqual(models.WorktableShard.objects.get(pk=entry.pk).shard, entry.shard)
+        self.assertTrue(models.Worktable.objects.using(entry.shard).filter(pk=entry.pk).exists())
+        self.assertFalse(models.Worktable.objects.using('shard_1').filter(pk=entry.pk).exists())
+
+    @override_settings(NOTES_SHARDS=SHARDS)
+    def test_command_doesnt_move_anything_in_dry_run(self):
+        output = self.call_command('--dry-run')
+
+        self.assertIn('shard_1: ', output)
+        self.assertFalse(models.WorktableShard.objects.exclude(shard='default').exists())
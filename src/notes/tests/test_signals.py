@@ -1,7 +1,10 @@
+from importlib import import_module
+
+from django.conf import settings
 from django.contrib.sessions.models import Session
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
-from notes import models
+from notes import models, services
 
 
 class SetQuantityOfAllWordsTest(TestCase):
@@ -40,3 +43,35 @@ class DeleteWorktableAfterDeletingSessionSignalTest(TestCase):
         self.session.delete()  # not raise
 
         self.assertEqual(models.Worktable.objects.count(), 0)
+
+
+@override_settings(SESSION_ENGINE='django.contrib.sessions.backends.cached_db')
+class DeleteWorktableAfterDeletingCachedSessionSignalTest(TestCase):
+    def setUp(self) -> None:
+        self.session = import_module(settings.SESSION_ENGINE).SessionStore()
+        self.session.create()
+        self.worktable = models.Worktable.objects.create(session_key=self.session.session_key)
+
+    def test_signal_deletes_worktable_after_deleting_cached_session(self):
+        self.session.delete()
+
+        self.assertFalse(models.Worktable.objects.filter(id=self.worktable.id).exists())
+
+
+class BumpWorktableVersionSignalTest(TestCase):
+    def setUp(self) -> None:
+        self.worktable = models.Worktable.objects.create(session_key='session')
+        self.version = services.get_worktable_version(self.worktable)
+
+    def test_signal_bumps_version_after_creating_category(self):
+        models.Category.objects.create(worktable=self.worktable, title='Category #1')
+
+        self.assertNotEqual(services.get_worktable_version(self.worktable), self.version)
+
+    def test_signal_bumps_version_after_deleting_category(self):
+        category = models.Category.objects.create(worktable=self.worktable, title='Category #1')
+        version = services.get_worktable_version(self.worktable)
+
+        category.delete()
+
+        self.assertNotEqual(services.get_worktable_version(self.worktable), version)
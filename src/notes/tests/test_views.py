@@ -1,13 +1,21 @@
+import json
+from datetime import timedelta
+from unittest import mock, skipIf
+
+from django.contrib.auth import get_user_model
 from django.contrib.sessions.models import Session
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from django.urls import reverse
 from django.utils import timezone
 from django.views import generic
 
 from accounts import forms as acc_forms
+from accounts.tests import TEST_EMAIL, TEST_PASSWORD
 from notes import views, forms, models, filters, services
 
+User = get_user_model()
+
 
 class FilterNotesViewTest(TestCase):
     def setUp(self) -> None:
@@ -16,7 +24,7 @@ class FilterNotesViewTest(TestCase):
         self.worktable = models.Worktable.objects.create(session_key=self.client.session.session_key)
         self.category = models.Category.objects.create(worktable=self.worktable, title='Category #1')
 
-        models.Note.objects.bulk_create(
+        notes = models.Note.objects.bulk_create(
             [
                 models.Note(
                     worktable=self.worktable,
@@ -24,14 +32,14 @@ class FilterNotesViewTest(TestCase):
                     category=category,
                     words=n * 10,
                     unique_words=n,
-                    is_archived=True if n == 3 else False,
                 )
                 for n, category in enumerate((self.category, self.category, None), start=1)
             ]
         )
+        services.archive_note(notes[2])
 
     def test_view_filters_notes_correctly(self):
-        expected_data = services.serialize_filter_qs(models.Note.objects.filter(is_archived=False))
+        expected_data = services.serialize_filter_qs(models.Note.objects.all())
         response = self.client.get(self.url, data={'status': filters.NoteFilter.Status.ACTIVE})
         data = response.json()
 
@@ -39,6 +47,110 @@ class FilterNotesViewTest(TestCase):
         self.assertEqual(len(data), 2)
         self.assertListEqual(data, expected_data)
 
+    def test_view_filters_archived_notes(self):
+        expected_data = services.serialize_filter_qs(models.ArchivedNote.objects.all())
+        response = self.client.get(self.url, data={'status': filters.NoteFilter.Status.ARCHIVED})
+        data = response.json()
+
+        self.assertEqual(len(data), 1)
+        self.assertTrue(data[0]['note']['is_archived'])
+        self.assertListEqual(data, expected_data)
+
+    def test_view_merges_notes_of_both_tiers_by_created_date(self):
+        models.ArchivedNote.objects.update(created=timezone.now() + timedelta(days=1))
+        expected_data = services.serialize_filter_qs([*models.ArchivedNote.objects.all(), *models.Note.objects.all()])
+
+        data = self.client.get(self.url).json()
+
+        self.assertListEqual(data, expected_data)
+
+    @override_settings(JSON_STREAMING_THRESHOLD=1)
+    def test_view_streams_long_list_of_notes(self):
+        expected_data = services.serialize_filter_qs(
+            services.merge_note_tiers([models.Note.objects.all(), models.ArchivedNote.objects.all()])
+        )
+
+        response = self.client.get(self.url)
+        data = json.loads(b''.join(response.streaming_content))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertListEqual(data, expected_data)
+
+    def test_view_returns_notes_after_offset(self):
+        expected_data = services.serialize_filter_qs(
+            services.merge_note_tiers([models.Note.objects.all(), models.ArchivedNote.objects.all()])
+        )
+
+        for headers, get_titles in (
+            ({}, lambda response: [data['note']['title'] for data in response.json()]),
+            ({'accept': views.COLUMNAR_CONTENT_TYPE}, lambda response: response.json()['notes']['title']),
+        ):
+            with self.subTest(headers=headers):
+                response = self.client.get(self.url, data={'offset': 1}, headers=headers)
+
+                self.assertEqual(response.status_code, 200)
+                self.assertListEqual(get_titles(response), [data['note']['title'] for data in expected_data[1:]])
+
+    def test_view_returns_error_for_invalid_offset(self):
+        for offset in ('-1', 'first'):
+            with self.subTest(offset=offset):
+                response = self.client.get(self.url, data={'offset': offset})
+
+                self.assertEqual(response.status_code, 400)
+                self.assertListEqual(response.json()['errors'], ['Offset must be a non-negative integer.'])
+
+    def test_view_returns_default_format_for_any_accepted_type(self):
+        response = self.client.get(self.url, headers={'accept': 'application/json, text/javascript, */*; q=0.01'})
+
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertIsInstance(response.json(), list)
+
+    def test_view_returns_columnar_format_if_client_accepts_it(self):
+        expected_data = services.serialize_filter_qs_columnar([models.Note.objects.all()])
+
+        response = self.client.get(
+            self.url,
+            data={'status': filters.NoteFilter.Status.ACTIVE},
+            headers={'accept': views.COLUMNAR_CONTENT_TYPE},
+        )
+
+        self.assertEqual(response['Content-Type'], views.COLUMNAR_CONTENT_TYPE)
+        self.assertDictEqual(response.json(), expected_data)
+
+    def test_view_returns_format_of_highest_quality(self):
+        for accept, content_type in (
+            (f'{views.MSGPACK_CONTENT_TYPE};q=0, application/json', 'application/json'),
+            (f'{views.COLUMNAR_CONTENT_TYPE};q=0.5, application/json', 'application/json'),
+            (f'application/json;q=0.5, {views.COLUMNAR_CONTENT_TYPE}', views.COLUMNAR_CONTENT_TYPE),
+        ):
+            with self.subTest(accept=accept):
+                response = self.client.get(self.url, headers={'accept': accept})
+
+                self.assertEqual(response['Content-Type'], content_type)
+
+    def test_view_responses_vary_by_accept_header(self):
+        for headers, data in (
+            ({}, {}),
+            ({'accept': views.COLUMNAR_CONTENT_TYPE}, {}),
+            ({'accept': views.MSGPACK_CONTENT_TYPE}, {}),
+            ({}, {'offset': 'first'}),
+        ):
+            with self.subTest(headers=headers, data=data):
+                response = self.client.get(self.url, data=data, headers=headers)
+
+                self.assertIn('Accept', response['Vary'])
+
+    @skipIf(views.msgpack is None, 'msgpack is not installed')
+    def test_view_returns_msgpack_format_if_client_accepts_it(self):
+        expected_data = services.serialize_filter_qs_columnar(
+            [models.Note.objects.all(), models.ArchivedNote.objects.all()]
+        )
+
+        response = self.client.get(self.url, headers={'accept': views.MSGPACK_CONTENT_TYPE})
+
+        self.assertEqual(response['Content-Type'], views.MSGPACK_CONTENT_TYPE)
+        self.assertDictEqual(views.msgpack.unpackb(response.content), expected_data)
+
 
 class RetrieveCategoryView(TestCase):
     def setUp(self) -> None:
@@ -98,6 +210,26 @@ class DeleteCategoryView(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertDictEqual(data, self.expected_data)
 
+    def test_view_moves_notes_to_other_category(self):
+        other_category = models.Category.objects.create(worktable=self.worktable, title='Category #2')
+        note = models.Note.objects.create(worktable=self.worktable, title='Note #1', category=self.category)
+
+        response = self.client.get(self.url, data={'move_to': other_category.id})
+        note.refresh_from_db()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(note.category, other_category)
+
+    def test_view_returns_error_data_if_move_to_category_doesnt_exist(self):
+        non_existent_id = 999_999_999
+
+        response = self.client.get(self.url, data={'move_to': non_existent_id})
+        data = response.json()
+
+        self.assertEqual(response.status_code, 404)
+        self.assertRegex(data['errors'][0], rf'Not found such category by id={non_existent_id}')
+        self.assertEqual(models.Category.objects.count(), 1)
+
     def test_view_returns_error_data_if_category_doesnt_exist(self):
         non_existent_id = 999_999_999
         url = reverse('delete_category', args=[non_existent_id])
@@ -209,6 +341,17 @@ class CreateCategoryView(TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertTrue(data.get('errors'))
 
+    def test_view_creates_session_and_worktable_on_first_write(self):
+        self.client.cookies.clear()
+        self.worktable.delete()
+
+        response = self.client.post(self.url, self.data)
+        category = models.Category.objects.first()
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Session.objects.count(), 2)
+        self.assertEqual(category.worktable.session_key, self.client.session.session_key)
+
 
 class DeleteNoteView(TestCase):
     def setUp(self) -> None:
@@ -258,22 +401,21 @@ class ArchiveNoteView(TestCase):
     def test_view_archives_note_correctly(self):
         response = self.client.get(self.url)
         data = response.json()
-        self.note.refresh_from_db()
 
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(self.note.is_archived)
+        self.assertFalse(models.Note.objects.exists())
+        self.assertEqual(models.ArchivedNote.objects.get().id, self.note.id)
         self.assertDictEqual(data, self.expected_data)
 
     def test_view_unarchives_note_if_it_was_archived(self):
-        self.note.is_archived = True
-        self.note.save()
+        services.archive_note(self.note)
 
         response = self.client.get(self.url)
         data = response.json()
-        self.note.refresh_from_db()
 
         self.assertEqual(response.status_code, 200)
-        self.assertFalse(self.note.is_archived)
+        self.assertFalse(models.ArchivedNote.objects.exists())
+        self.assertEqual(models.Note.objects.get().created, self.note.created)
         self.assertDictEqual(data, self.expected_data)
 
     def test_view_returns_error_data_if_note_doesnt_exist(self):
@@ -301,8 +443,11 @@ class RetrieveNoteView(TestCase):
         self.url = reverse('retrieve_note', args=[self.note.id])
 
         self.expected_date = {
-            'urls': {'update': reverse('update_note', args=[self.note.id])},
-            'note': {'title': self.note.title, 'text': self.note.text},
+            'urls': {
+                'update': reverse('update_note', args=[self.note.id]),
+                'patch': reverse('patch_note', args=[self.note.id]),
+            },
+            'note': {'title': self.note.title, 'text': self.note.text, 'version': 0},
             'category': {
                 'id': self.category.id,
                 'title': self.category.title,
@@ -328,6 +473,15 @@ class RetrieveNoteView(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertDictEqual(data, self.expected_date)
 
+    def test_view_returns_data_of_archived_note(self):
+        services.archive_note(self.note)
+
+        response = self.client.get(self.url)
+        data = response.json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertDictEqual(data, self.expected_date)
+
     def test_view_returns_error_data_if_note_doesnt_exist(self):
         non_existent_id = 999_999_999
         url = reverse('retrieve_note', args=[non_existent_id])
@@ -347,11 +501,12 @@ class UpdateNoteView(TestCase):
 
         self.url = reverse('update_note', args=[self.note.id])
 
-        self.data = {'category': self.category.id, 'title': 'Note #2', 'text': 'Some Text'}
+        self.data = {'category': self.category.id, 'title': 'Note #2', 'text': 'Some Text', 'version': 0}
         self.expected_date = {
             'note': {
                 'id': self.note.id,
                 'title': self.data['title'],
+                'version': 1,
             },
             'category': {
                 'title': self.category.title,
@@ -368,6 +523,17 @@ class UpdateNoteView(TestCase):
         self.assertEqual(self.note.title, self.data['title'])
         self.assertEqual(self.note.text, self.data['text'])
 
+    def test_view_updates_archived_note(self):
+        services.archive_note(self.note)
+
+        response = self.client.post(self.url, self.data)
+        archived_note = models.ArchivedNote.objects.get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(archived_note.title, self.data['title'])
+        self.assertEqual(archived_note.text, self.data['text'])
+        self.assertEqual(archived_note.words, 2)
+
     def test_view_returns_data_with_category(self):
         response = self.client.post(self.url, self.data)
         data = response.json()
@@ -394,6 +560,141 @@ class UpdateNoteView(TestCase):
         self.assertIsNotNone(errors)
         self.assertTrue(errors, msg='Data is empty.')
 
+    def test_view_returns_error_data_if_note_doesnt_exist(self):
+        non_existent_id = 999_999_999
+        url = reverse('update_note', args=[non_existent_id])
+
+        response = self.client.post(url, self.data)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertRegex(response.json()['errors'][0], rf'Not found such note by id={non_existent_id}')
+
+    def test_view_returns_error_data_if_note_belongs_to_other_worktable(self):
+        other_worktable = models.Worktable.objects.create(session_key='other_session')
+        other_note = models.Note.objects.create(worktable=other_worktable, title='Note #1')
+
+        response = self.client.post(reverse('update_note', args=[other_note.id]), self.data)
+        other_note.refresh_from_db()
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(other_note.title, 'Note #1')
+
+    def test_view_returns_conflict_if_note_was_changed_since_version(self):
+        services.patch_note_text(self.note, 0, [{'offset': 0, 'insert': 'Patched'}])
+
+        response = self.client.post(self.url, self.data)
+        self.note.refresh_from_db()
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['version'], 1)
+        self.assertEqual(self.note.text, 'Patched')
+        self.assertEqual(self.note.title, 'Note #1')
+
+    def test_view_returns_error_data_if_note_is_archived_while_saving(self):
+        with mock.patch.object(services, 'get_note', return_value=self.note):
+            services.archive_note(models.Note.objects.get(pk=self.note.pk))
+
+            response = self.client.post(self.url, self.data)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(models.ArchivedNote.objects.get().title, 'Note #1')
+
+    def test_view_requires_version(self):
+        del self.data['version']
+
+        response = self.client.post(self.url, self.data)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('version', response.json()['errors'])
+
+
+class PatchNoteView(TestCase):
+    def setUp(self) -> None:
+        self.worktable = models.Worktable.objects.create(session_key=self.client.session.session_key)
+        self.note = models.Note.objects.create(worktable=self.worktable, title='Note #1', text='Some text here')
+
+        self.url = reverse('patch_note', args=[self.note.id])
+
+    def patch(self, data, url=None):
+        return self.client.post(url or self.url, json.dumps(data), content_type='application/json')
+
+    def test_view_applies_operations_to_text(self):
+        response = self.patch(
+            {
+                'version': 0,
+                'operations': [{'offset': 5, 'length': 4, 'insert': 'patched text'}, {'offset': 0, 'insert': '> '}],
+            }
+        )
+        self.note.refresh_from_db()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertDictEqual(response.json(), {'note': {'id': self.note.id, 'version': 1}})
+        self.assertEqual(self.note.text, '> Some patched text here')
+        self.assertEqual(self.note.version, 1)
+        self.assertEqual((self.note.words, self.note.unique_words), (4, 4))
+
+    def test_view_patches_archived_note(self):
+        services.archive_note(self.note)
+
+        response = self.patch({'version': 0, 'operations': [{'offset': 0, 'length': 4, 'insert': 'Any'}]})
+        archived_note = models.ArchivedNote.objects.get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(archived_note.text, 'Any text here')
+        self.assertEqual(archived_note.version, 1)
+
+    def test_view_returns_conflict_if_note_was_changed_since_version(self):
+        self.patch({'version': 0, 'operations': [{'offset': 0, 'insert': 'First '}]})
+
+        response = self.patch({'version': 0, 'operations': [{'offset': 0, 'insert': 'Second '}]})
+        self.note.refresh_from_db()
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['version'], 1)
+        self.assertEqual(self.note.text, 'First Some text here')
+
+    def test_view_returns_error_data_if_note_is_deleted_while_patching(self):
+        with mock.patch.object(services, 'get_note', return_value=self.note):
+            models.Note.objects.filter(pk=self.note.pk).delete()
+
+            response = self.patch({'version': 0, 'operations': [{'offset': 0, 'insert': 'Any '}]})
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_full_update_makes_patches_of_earlier_versions_conflict(self):
+        self.client.post(
+            reverse('update_note', args=[self.note.id]), {'title': 'Note #1', 'text': 'Other text', 'version': 0}
+        )
+
+        response = self.patch({'version': 0, 'operations': [{'offset': 0, 'length': 4, 'insert': 'Any'}]})
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['version'], 1)
+
+    def test_view_returns_error_data_if_operation_is_out_of_text(self):
+        response = self.patch({'version': 0, 'operations': [{'offset': 10, 'length': 10, 'insert': ''}]})
+        self.note.refresh_from_db()
+
+        self.assertEqual(response.status_code, 400)
+        self.assertRegex(response.json()['errors'][0], r'out of the text of length 14')
+        self.assertEqual(self.note.version, 0)
+
+    def test_view_returns_error_data_if_patch_is_malformed(self):
+        for body in ('not json', json.dumps({'operations': []}), json.dumps({'version': '0', 'operations': []})):
+            with self.subTest(body=body):
+                response = self.client.post(self.url, body, content_type='application/json')
+
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('errors', response.json())
+
+    def test_view_returns_error_data_if_note_doesnt_exist(self):
+        non_existent_id = 999_999_999
+
+        response = self.patch({'version': 0, 'operations': []}, url=reverse('patch_note', args=[non_existent_id]))
+
+        self.assertEqual(response.status_code, 404)
+        self.assertRegex(response.json()['errors'][0], rf'Not found such note by id={non_existent_id}')
+
 
 class CreateNewNoteView(TestCase):
     def setUp(self) -> None:
@@ -407,6 +708,7 @@ class CreateNewNoteView(TestCase):
         self.expected_data = {
             'note': {
                 'title': self.data['title'],
+                'version': 0,
                 'created': timezone.now().strftime('%d.%m.%Y'),
             },
             'category': {
@@ -491,28 +793,41 @@ class BaseViewTest(TestCase):
             else:
                 self.fail(f'Missed <{cls.__name__}>.')
 
+    def test_view_doesnt_render_login_and_register_forms_for_authenticated_user(self):
+        user = User.objects.create_user(email=TEST_EMAIL, password=TEST_PASSWORD)
+        models.Worktable.objects.create(user=user)
+        self.client.force_login(user)
+
+        response = self.client.get(self.url)
+
+        self.assertNotContains(response, 'id="login_form"')
+        self.assertNotContains(response, 'id="registration_form"')
+
     def test_view_context_has_worktable(self):
         response = self.client.get(self.url)
         self.assertIsInstance(response.context.get('worktable'), models.Worktable)
 
-    def test_view_creates_session_if_session_key_is_none(self):
-        self.assertEqual(Session.objects.count(), 0)
-
+    def test_view_doesnt_create_session_if_session_key_is_none(self):
         self.client.get(self.url)
 
-        self.assertEqual(Session.objects.count(), 1)
-
-    def test_view_creates_worktable_if_session_doesnt_have_it(self):
-        self.assertEqual(models.Worktable.objects.count(), 0)
+        self.assertEqual(Session.objects.count(), 0)
 
+    def test_view_doesnt_create_worktable_if_session_doesnt_have_it(self):
         response = self.client.get(self.url)
 
-        self.assertEqual(models.Worktable.objects.count(), 1)
+        self.assertEqual(models.Worktable.objects.count(), 0)
 
         worktable = response.context.get('worktable')
 
         self.assertIsInstance(worktable, models.Worktable)
-        self.assertEqual(worktable.session_key, self.client.session.session_key)
+        self.assertIsNone(worktable.pk)
+
+    def test_view_uses_existing_worktable_of_session(self):
+        worktable = models.Worktable.objects.create(session_key=self.client.session.session_key)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.context.get('worktable'), worktable)
 
 
 class NotesViewTest(TestCase):
@@ -545,6 +860,42 @@ class NotesViewTest(TestCase):
 
         self.assertIsNotNone(response.context.get('filter_form'))
 
+    def test_view_renders_first_notes(self):
+        worktable = models.Worktable.objects.create(session_key=self.client.session.session_key)
+        category = models.Category.objects.create(worktable=worktable, title='Category #1')
+        models.Note.objects.create(worktable=worktable, title='Note #1', category=category)
+        models.Note.objects.create(worktable=worktable, title='Note #2')
+
+        response = self.client.get(self.url)
+
+        self.assertListEqual(response.context['notes'], services.serialize_filter_qs(worktable.get_all_notes()))
+        self.assertFalse(response.context['has_more_notes'])
+        self.assertContains(response, 'Title: Note #1')
+        self.assertContains(response, 'Category: Category #1')
+        self.assertContains(response, f'data-category-id="{category.id}"')
+        self.assertContains(response, 'data-has-more="false"')
+
+    def test_view_renders_only_limited_quantity_of_notes(self):
+        worktable = models.Worktable.objects.create(session_key=self.client.session.session_key)
+        models.Note.objects.bulk_create(
+            models.Note(worktable=worktable, title=f'Note #{n}') for n in range(self.view_class.initial_notes_limit + 1)
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(len(response.context['notes']), self.view_class.initial_notes_limit)
+        self.assertTrue(response.context['has_more_notes'])
+        self.assertContains(response, 'data-has-more="true"')
+
+    def test_view_filters_first_notes_by_query_params(self):
+        worktable = models.Worktable.objects.create(session_key=self.client.session.session_key)
+        models.Note.objects.create(worktable=worktable, title='Note #1')
+        services.archive_note(models.Note.objects.create(worktable=worktable, title='Note #2'))
+
+        response = self.client.get(self.url, data={'status': filters.NoteFilter.Status.ARCHIVED})
+
+        self.assertEqual([data['note']['title'] for data in response.context['notes']], ['Note #2'])
+
 
 class CategoriesViewTest(TestCase):
     def setUp(self) -> None:
@@ -559,6 +910,15 @@ class CategoriesViewTest(TestCase):
 
         self.assertTemplateUsed(response, 'categories.html')
 
+    def test_view_renders_new_category_after_caching_category_list(self):
+        worktable = models.Worktable.objects.create(session_key=self.client.session.session_key)
+        self.client.get(self.url)
+
+        models.Category.objects.create(worktable=worktable, title='New Category')
+        response = self.client.get(self.url)
+
+        self.assertContains(response, 'New Category')
+
     def test_view_context_has_expected_forms(self):
         expected_forms = {
             'category_create_form': forms.CategoryCreateForm,
@@ -7,6 +7,7 @@ urlpatterns = [
     path('notes/filter/', views.filter_notes, name='filter_notes'),
     path('note/create/', views.create_new_note, name='create_note'),
     path('note/update/<id>/', views.update_note, name='update_note'),
+    path('note/patch/<id>/', views.patch_note, name='patch_note'),
     path('note/retrieve/<id>/', views.retrieve_note, name='retrieve_note'),
     path('note/archive/<id>/', views.archive_note, name='archive_note'),
     path('note/delete/<id>/', views.delete_note, name='delete_note'),
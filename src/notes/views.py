@@ -1,22 +1,81 @@
-import inspect
+import itertools
+import json
 
 from django import views
-from django.http import JsonResponse
+from django.http import HttpResponse
+from django.utils.functional import SimpleLazyObject
+from django.views.decorators.vary import vary_on_headers
 from django.views import generic
 
 from accounts import forms as acc_forms
+from core import routers
+from core.http import JsonResponse, json_list_response
 from notes import forms, models, filters, services
 
+try:
+    import msgpack
+except ImportError:  # MessagePack responses are optional
+    msgpack = None
 
+
+COLUMNAR_CONTENT_TYPE = 'application/vnd.online-notes.columnar+json'
+MSGPACK_CONTENT_TYPE = 'application/msgpack'
+
+
+def get_media_type_quality(media_type) -> float:
+    try:
+        return float(media_type.params.get('q', 1))
+    except ValueError:
+        return 1
+
+
+def get_filter_response_format(request) -> str:
+    """
+    Return a content type of the filter_notes response. Compact formats are used only if the client
+    lists them explicitly in the Accept header, so "*/*" still gets the default JSON list. Types are
+    taken by their quality, types of zero quality are never returned.
+    """
+    media_types = [media_type for media_type in request.accepted_types if get_media_type_quality(media_type) > 0]
+    for media_type in sorted(media_types, key=get_media_type_quality, reverse=True):
+        content_type = f'{media_type.main_type}/{media_type.sub_type}'
+        if content_type == MSGPACK_CONTENT_TYPE and msgpack is not None:
+            return MSGPACK_CONTENT_TYPE
+        if content_type == COLUMNAR_CONTENT_TYPE:
+            return COLUMNAR_CONTENT_TYPE
+        if content_type == 'application/json':
+            break
+    return 'application/json'
+
+
+# Bodies differ by the Accept header, so caches must not serve one format to clients of another.
+@vary_on_headers('Accept')
+@routers.read_only()
 def filter_notes(request):
+    # Notes after the offset, e.g. the rest of notes after the first ones which NotesView rendered.
+    offset = request.GET.get('offset', '0')
+    if not offset.isdecimal():
+        return JsonResponse(data={'errors': ['Offset must be a non-negative integer.']}, status=400)
+    offset = int(offset)
+
     filter_ = filters.NoteFilter(request=request, data=request.GET)
-    data = services.serialize_filter_qs(filter_.qs)
-    return JsonResponse(data=data, status=200, safe=False)
+    # Long lists are streamed after the view returns, so the database is chosen while reads are routed.
+    tiers = [qs.select_related('category').using(qs.db) for qs in filter_.tiers]
+    response_format = get_filter_response_format(request)
+    if response_format == MSGPACK_CONTENT_TYPE:
+        data = services.serialize_filter_qs_columnar(tiers, offset)
+        return HttpResponse(msgpack.packb(data), status=200, content_type=MSGPACK_CONTENT_TYPE)
+    elif response_format == COLUMNAR_CONTENT_TYPE:
+        data = services.serialize_filter_qs_columnar(tiers, offset)
+        return JsonResponse(data=data, status=200, content_type=COLUMNAR_CONTENT_TYPE)
+
+    notes = services.merge_note_tiers([qs.iterator(chunk_size=2_000) for qs in tiers])
+    return json_list_response(services.iter_serialize_filter_qs(itertools.islice(notes, offset, None)), status=200)
 
 
+@routers.read_only()
 def retrieve_category(request, id):
     try:
-        category = models.Category.objects.get(id=id)
+        category = services.get_worktable(request).get_all_categories().get(id=id)
         data = services.serialize_model(
             category,
             ('id', 'title', 'color'),
@@ -29,18 +88,27 @@ def retrieve_category(request, id):
 
 
 def delete_category(request, id):
+    categories = services.get_worktable(request).get_all_categories()
     try:
-        category = models.Category.objects.get(id=id)
-        data = services.serialize_model(category, ('id',))
-        category.delete()
-        return JsonResponse(data=data, status=200)
+        category = categories.get(id=id)
     except models.Category.DoesNotExist:
         return JsonResponse(data={'errors': [f'Not found such category by id={id}']}, status=404)
 
+    move_to = None
+    if move_to_id := request.GET.get('move_to'):
+        try:
+            move_to = categories.exclude(id=category.id).get(id=move_to_id)
+        except (models.Category.DoesNotExist, ValueError):
+            return JsonResponse(data={'errors': [f'Not found such category by id={move_to_id}']}, status=404)
+
+    data = services.serialize_model(category, ('id',))
+    services.delete_category(category, move_to)
+    return JsonResponse(data=data, status=200)
+
 
 def update_category(request, id):
     try:
-        category = models.Category.objects.get(id=id)
+        category = services.get_worktable(request).get_all_categories().get(id=id)
         form = forms.CategoryUpdateForm(instance=category, data=request.POST)
         if form.is_valid():
             category = form.save()
@@ -72,7 +140,7 @@ def create_category(request):
 
 def delete_note(request, id):
     try:
-        note = models.Note.objects.get(id=id)
+        note = services.get_note(services.get_worktable(request), id)
         data = services.serialize_model(note, ('id',))
         note.delete()
         return JsonResponse(data=data, status=200)
@@ -82,22 +150,22 @@ def delete_note(request, id):
 
 def archive_note(request, id):
     try:
-        note = models.Note.objects.get(id=id)
-        note.is_archived = not note.is_archived
-        note.save()
+        note = services.get_note(services.get_worktable(request), id)
+        note = services.unarchive_note(note) if note.is_archived else services.archive_note(note)
         data = services.serialize_model(note, ('id',))
         return JsonResponse(data=data, status=200)
     except models.Note.DoesNotExist:
         return JsonResponse(data={'errors': [f'Not found such note by id={id}']}, status=404)
 
 
+@routers.read_only()
 def retrieve_note(request, id):
     try:
-        note = models.Note.objects.get(id=id)
+        note = services.get_note(services.get_worktable(request), id)
         data = services.serialize_model(
             note,
-            ('title', 'text'),
-            ('update',),
+            ('title', 'text', 'version'),
+            ('update', 'patch'),
         )
         if note.category:
             data.update(services.serialize_model(note.category, ('id', 'title', 'color')))
@@ -108,13 +176,22 @@ def retrieve_note(request, id):
 
 
 def update_note(request, id):
-    note = models.Note.objects.get(id=id)
-    form = forms.NoteUpdateForm(instance=note, data=request.POST)
+    try:
+        note = services.get_note(services.get_worktable(request), id)
+    except models.Note.DoesNotExist:
+        return JsonResponse(data={'errors': [f'Not found such note by id={id}']}, status=404)
+    form_class = forms.ArchivedNoteUpdateForm if note.is_archived else forms.NoteUpdateForm
+    form = form_class(instance=note, data=request.POST)
     if form.is_valid():
-        note = form.save()
+        try:
+            note = form.save()
+        except (models.Note.DoesNotExist, models.ArchivedNote.DoesNotExist):
+            return JsonResponse(data={'errors': [f'Not found such note by id={id}']}, status=404)
+        except services.NoteVersionConflict as error:
+            return JsonResponse(data={'errors': [str(error)], 'version': error.version}, status=409)
         data = services.serialize_model(
             note,
-            ('id', 'title'),
+            ('id', 'title', 'version'),
         )
         if note.category:
             data.update(services.serialize_model(note.category, ('title', 'color')))
@@ -124,13 +201,40 @@ def update_note(request, id):
         return JsonResponse(data={'errors': form.errors}, status=400)
 
 
+def patch_note(request, id):
+    """
+    Apply a patch {"version": 3, "operations": [{"offset": 10, "length": 2, "insert": "text"}]} to the text
+    of a note, so that saving an edit sends the edit instead of the whole text.
+    """
+    try:
+        patch = json.loads(request.body)
+        version, operations = patch['version'], patch['operations']
+        if not isinstance(version, int):
+            raise TypeError
+    except (ValueError, KeyError, TypeError):
+        return JsonResponse(
+            data={'errors': ['Patch must be a JSON object with an integer "version" and "operations".']}, status=400
+        )
+
+    try:
+        note = services.get_note(services.get_worktable(request), id)
+        services.patch_note_text(note, version, operations)
+    except (models.Note.DoesNotExist, models.ArchivedNote.DoesNotExist):
+        return JsonResponse(data={'errors': [f'Not found such note by id={id}']}, status=404)
+    except services.NoteVersionConflict as error:
+        return JsonResponse(data={'errors': [str(error)], 'version': error.version}, status=409)
+    except ValueError as error:
+        return JsonResponse(data={'errors': [str(error)]}, status=400)
+    return JsonResponse(data=services.serialize_model(note, ('id', 'version')), status=200)
+
+
 def create_new_note(request):
     form = forms.NoteCreateForm(request=request, data=request.POST)
     if form.is_valid():
         note = form.save()
         data = services.serialize_model(
             note,
-            ('id', 'title'),
+            ('id', 'title', 'version'),
             ('update', 'retrieve', 'archive', 'delete'),
         )
         data['note']['created'] = note.created.strftime('%d.%m.%Y')
@@ -151,38 +255,26 @@ class BaseView(views.View, generic.base.ContextMixin, generic.base.TemplateRespo
     extra_form_classes: dict = {}
 
     def get_extra_forms(self, **kwargs) -> dict:
-        kwargs = {}
-        for form_key, form in self.extra_form_classes.items():
-            if 'request' in inspect.signature(form.__init__).parameters:
-                kwargs[form_key] = form(self.request)
-            else:
-                kwargs[form_key] = form()
-
-        return kwargs
+        return {form_key: forms.lazy_form(form, self.request) for form_key, form in self.extra_form_classes.items()}
 
     def get_context_data(self, **kwargs):
         kwargs['worktable'] = self.get_worktable()
+        kwargs['worktable_version'] = services.get_worktable_version(kwargs['worktable'])
         if self.extra_form_classes:
             kwargs.update(self.get_extra_forms())
 
         for form_key, form in self.form_classes.items():
-            if 'request' in inspect.signature(form.__init__).parameters:
-                kwargs[form_key] = form(self.request)
-            else:
-                kwargs[form_key] = form()
+            kwargs[form_key] = forms.lazy_form(form, self.request)
 
         return super().get_context_data(**kwargs)
 
     def get_worktable(self) -> models.Worktable:
-        if self.request.user.is_authenticated:
-            return self.request.user.worktable
-        else:
-            if self.request.session.session_key is None:
-                self.request.session.save()
-            return models.Worktable.objects.get_or_create(session_key=self.request.session.session_key)[0]
+        return services.get_worktable(self.request)
 
+    @routers.read_only()
     def get(self, request, *args, **kwargs):
-        return self.render_to_response(self.get_context_data())
+        # Templates are rendered lazily, so the response is rendered while reads are routed.
+        return self.render_to_response(self.get_context_data()).render()
 
 
 class NotesView(BaseView):
@@ -191,11 +283,26 @@ class NotesView(BaseView):
         'note_create_form': forms.NoteCreateForm,
     }
     filter_class = filters.NoteFilter
+    initial_notes_limit = 50
+
+    def get_initial_notes(self) -> tuple[list[dict], bool]:
+        """Return the first notes serialized like for filter_notes and whether the worktable has more notes."""
+        filter_ = self.filter_class(request=self.request, data=self.request.GET)
+        notes = services.merge_note_tiers(
+            [qs.select_related('category')[: self.initial_notes_limit + 1] for qs in filter_.tiers]
+        )
+        notes = services.serialize_filter_qs(itertools.islice(notes, self.initial_notes_limit + 1))
+        return notes[: self.initial_notes_limit], len(notes) > self.initial_notes_limit
+
+    def get_filter_form(self, worktable: models.Worktable):
+        form = self.filter_class.get_base_form_class()()
+        form.fields['category'].queryset = worktable.get_all_categories()
+        return form
 
     def get_context_data(self, **kwargs):
         kwargs = super().get_context_data(**kwargs)
-        filter_form_class = self.filter_class(self.request).get_form_class()
-        kwargs['filter_form'] = filter_form_class()
+        kwargs['filter_form'] = SimpleLazyObject(lambda: self.get_filter_form(kwargs['worktable']))
+        kwargs['notes'], kwargs['has_more_notes'] = self.get_initial_notes()
         return kwargs
 
 
@@ -1,6 +1,7 @@
 import os
 from datetime import timedelta
 from functools import wraps
+from importlib import import_module
 from time import time, sleep
 from typing import Callable
 
@@ -19,6 +20,7 @@ from webdriver_manager.firefox import GeckoDriverManager
 from selenium import webdriver
 
 from notes.models import Worktable, Note, Category
+from notes import services
 
 
 def wait(wait_time=5):
@@ -151,8 +153,15 @@ class FunctionalTestCase(StaticLiveServerTestCase):
         self.wait_for(lambda: self.get_navbar().find_element(value='user'))
 
     def get_worktable(self):
+        """Return a worktable of the browser. Page views don't create worktables, so it's created for a session."""
         self.enter_to_site()
-        return Worktable.objects.first()
+        if worktable := Worktable.objects.first():
+            return worktable
+
+        session = import_module(settings.SESSION_ENGINE).SessionStore()
+        session.create()
+        self.browser.add_cookie({'name': settings.SESSION_COOKIE_NAME, 'value': session.session_key})
+        return Worktable.objects.create(session_key=session.session_key)
 
     def get_registration_form(self) -> WebElement:
         return self.browser.find_element(value='modal_registration_form')
@@ -245,10 +254,10 @@ class FunctionalTestCase(StaticLiveServerTestCase):
                 category=category,
                 words=n * 10,
                 unique_words=n,
-                is_archived=True if n == 5 else False,
             )
             for n, category in enumerate(categories, start=1)
         ]
         notes = Note.objects.bulk_create(notes)
         notes[3].created = timezone.now() + timedelta(days=1)
         notes[3].save()
+        services.archive_note(notes[4])
@@ -0,0 +1,46 @@
+from notes.models import Note
+from notes.views import NotesView
+from selenium_tests import FunctionalTestCase
+
+
+class TimeToFirstContentTest(FunctionalTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.worktable = self.get_worktable()
+
+    def create_notes(self, quantity: int):
+        Note.objects.bulk_create(Note(worktable=self.worktable, title=f'Note #{n}') for n in range(quantity))
+
+    def get_filter_requests(self) -> list[dict]:
+        return self.browser.execute_script(
+            "return performance.getEntriesByType('resource').filter(e => e.name.includes('/notes/filter/'))"
+            '.map(e => ({start: e.startTime, end: e.responseEnd}));'
+        )
+
+    def get_time_to_first_content(self) -> float:
+        """Return milliseconds from navigation start until the page with the first note cards is parsed."""
+        return self.browser.execute_script(
+            "return performance.getEntriesByType('navigation')[0].domContentLoadedEventEnd;"
+        )
+
+    def test_note_list_is_rendered_without_extra_request(self):
+        self.create_notes(NotesView.initial_notes_limit)
+
+        # User enters to site and sees notes at once
+        self.enter_to_site()
+        cards = self.wait_for(self.get_cards_from_note_list)
+
+        self.assertEqual(len(cards), NotesView.initial_notes_limit)
+        self.assertListEqual(self.get_filter_requests(), [])
+
+    def test_note_list_is_requested_if_worktable_has_more_notes_than_first_page(self):
+        self.create_notes(NotesView.initial_notes_limit + 1)
+
+        # User enters to site and the rest of notes are loaded by the filter request
+        self.enter_to_site()
+        self.wait_for(lambda: len(self.get_cards_from_note_list()), NotesView.initial_notes_limit + 1)
+
+        filter_requests = self.get_filter_requests()
+        self.assertEqual(len(filter_requests), 1)
+        # The first cards come with the page and don't wait for the request of the rest.
+        self.assertLessEqual(self.get_time_to_first_content(), filter_requests[0]['end'])
@@ -67,19 +67,60 @@ $(document).ready(function(){
         return note_list
     }
 
-    function send_ajax_filter_request() {
+    function expand_columnar_notes(data) {
+        var notes = [];
+        for (var i = 0; i < data.notes.id.length; i++) {
+            var id = data.notes.id[i];
+            var urls = {};
+            for (var name in data.url_templates) {
+                urls[name] = data.url_templates[name].replace('{id}', id);
+            }
+            var note = {
+                note: {
+                    id: id,
+                    title: data.notes.title[i],
+                    is_archived: data.notes.is_archived[i],
+                    created: data.notes.created[i],
+                },
+                urls: urls,
+            };
+            var category = data.notes.category[i];
+            if (category !== null) {
+                note.category = {
+                    id: data.categories.id[category],
+                    title: data.categories.title[category],
+                    color: data.categories.color[category],
+                };
+            }
+            notes.push(note);
+        }
+        return notes
+    }
+
+    function send_ajax_filter_request(offset) {
 
         var form = $('#filter_form')
-        send_ajax_request(
-            data=form.serialize(),
-            type=form.attr('method'),
-            url=form.attr('action'),
-            success=function(response){
-                $('#note_list').html(get_note_list(response))
+        var data = form.serialize();
+        if (offset) {
+            data += '&offset=' + offset;
+        }
+        $.ajax({
+            url: form.attr('action'),
+            type: form.attr('method'),
+            dataType: 'json',
+            headers: {Accept: 'application/vnd.online-notes.columnar+json'},
+            data: data,
+            success: function(response){
+                var note_list = get_note_list(expand_columnar_notes(response));
+                if (offset) {
+                    $('#note_list').append(note_list);
+                } else {
+                    $('#note_list').html(note_list);
+                }
             },
-            error=function(xhr, status, error){
+            error: function(xhr, status, error){
                 console.log(error)
-
+            }
         });
     }
 
@@ -92,7 +133,9 @@ $(document).ready(function(){
         setTimeout(send_ajax_filter_request, 0);
     });
 
-    $('#filter_form').on('change',  ['select', 'input'], send_ajax_filter_request);
+    $('#filter_form').on('change',  ['select', 'input'], function() {
+        send_ajax_filter_request();
+    });
 
 
     $(document).on('click', '#create_new', function(event) {
@@ -228,6 +271,7 @@ $(document).ready(function(){
                 form.attr('action', response.urls.update);
                 form.find('#id_title').val(response.note.title);
                 form.find('#id_text').val(response.note.text);
+                form.find('#id_version').val(response.note.version);
                 if(response.category) {
                     form.find('#id_category').val(response.category.id);
                 }
@@ -247,6 +291,8 @@ $(document).ready(function(){
             url=$(this).attr('action'),
             success=function(response) {
                 var form = $('#note_form');
+                // Updates are made against the version of the note which the form holds.
+                form.find('#id_version').val(response.note.version);
                 if(form.attr('action').includes('create')) {
                     form.attr('action', response.urls.update);
                     $('#note_list').prepend(get_note_to_list(response));
@@ -320,5 +366,8 @@ $(document).ready(function(){
         });
     });
 
-    send_ajax_filter_request()
+    // The first notes are rendered by the server. Only the notes after them are requested if the worktable has more.
+    if ($('#note_list').attr('data-has-more') === 'true') {
+        send_ajax_filter_request($('#note_list .card').length);
+    }
 });
\ No newline at end of file